@@ -50,7 +50,7 @@ async def agent_run_sse_endpoint(
     AC-19: Stream real-time SSE events for an agent pipeline run.
 
     Validates run_id belongs to the current tenant, then opens a streaming
-    response backed by an in-process asyncio.Queue (SSEManager).
+    response backed by an in-process per-run event queue (SSEManager).
     """
     schema_name = slug_to_schema_name(current_tenant_slug.get())
 
@@ -4,7 +4,7 @@ Story: 1-1-user-account-creation
 AC: AC6 — Redis-backed rate limiting
 """
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from src.config import get_settings
 
@@ -14,17 +14,34 @@ _redis: Redis | None = None
 
 
 def get_redis_client() -> Redis:
-    """Returns (or creates) the module-level Redis client."""
+    """
+    Returns (or creates) the module-level Redis client.
+
+    Every caller shares one client over a bounded BlockingConnectionPool, so
+    connections are reused across requests and a burst (e.g. concurrent
+    logins) waits for a free connection instead of opening new ones past
+    redis_max_connections.
+    """
     global _redis
     if _redis is None:
-        _redis = Redis.from_url(
+        pool = BlockingConnectionPool.from_url(
             settings.redis_url,
+            max_connections=settings.redis_max_connections,
             encoding="utf-8",
             decode_responses=True,
         )
+        _redis = Redis(connection_pool=pool)
     return _redis
 
 
+async def close_redis_client() -> None:
+    """Close the shared client and its pool (app shutdown)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose(close_connection_pool=True)
+        _redis = None
+
+
 async def check_redis() -> dict:
     """Health check for /ready endpoint."""
     client = get_redis_client()
@@ -21,6 +21,7 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = "redis://localhost:6379"
+    redis_max_connections: int = 64  # Shared pool size; callers wait for a free connection at the cap
 
     # JWT — RS256 asymmetric key pair (Story 1.5 AC3)
     # Leave empty in development: keys are auto-generated at startup.
@@ -79,6 +80,11 @@ class Settings(BaseSettings):
     mfa_max_failures_per_hour: int = 10     # per user per hour before lockout
     mfa_lockout_seconds: int = 3600         # 1 hour lockout after 10 failures
 
+    # Backup code hashing (Argon2id) — Story 1.7 (AC4, AC9)
+    # Tests lower these (tests/conftest.py) to keep hashing out of the suite's wall time.
+    backup_code_argon2_memory_cost: int = 32768  # KiB (32 MiB)
+    backup_code_argon2_time_cost: int = 2
+
     # Profile — Story 1.8
     s3_avatar_key_prefix: str = "user-avatars"
     avatar_presigned_url_expires: int = 300        # 5 minutes (AC: presigned URLs expire quickly)
@@ -21,12 +21,23 @@ settings = get_settings()
 # Engine (single instance shared across requests)
 # ---------------------------------------------------------------------------
 
+# Compiled-SQL cache sized for every distinct statement the API issues
+# (SQLAlchemy default: 500), and a larger per-connection prepared-statement
+# cache on asyncpg (default: 100) so hot queries skip PARSE on the server.
+_ASYNCPG_CONNECT_ARGS = {"prepared_statement_cache_size": 500}
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.environment == "development",
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    query_cache_size=1200,
+    connect_args=(
+        _ASYNCPG_CONNECT_ARGS
+        if settings.database_url.startswith("postgresql+asyncpg")
+        else {}
+    ),
 )
 
 # ---------------------------------------------------------------------------
@@ -178,3 +178,10 @@ async def on_startup() -> None:
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
     logger.info("QUALISYS API shutting down")
+
+    # Write any audit rows still buffered by log_action_async()
+    from src.services.audit_service import audit_service
+    await audit_service.flush()
+
+    from src.cache import close_redis_client
+    await close_redis_client()
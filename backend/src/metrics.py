@@ -55,6 +55,14 @@ auth_login_total = Counter(
     labelnames=["status"],  # success | failure | mfa_required
 )
 
+# Login rate-limit checks skipped because Redis could not answer — alert on this:
+# every increment is a login that bypassed lockout / attempt limiting.
+auth_rate_limit_fail_open_total = Counter(
+    name="auth_rate_limit_fail_open_total",
+    documentation="Login rate-limit checks that failed open, by reason",
+    labelnames=["reason"],  # timeout | error
+)
+
 org_schema_provision_duration_seconds = Histogram(
     name="org_schema_provision_duration_seconds",
     documentation="Duration of tenant schema provisioning in seconds",
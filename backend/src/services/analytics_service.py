@@ -11,6 +11,10 @@ Returns simple usage counts for the admin dashboard:
 
 Redis cache (5-minute TTL) prevents repeated COUNT queries on every dashboard load.
 Cache key: analytics:dashboard:{tenant_id}
+On expiry a SET NX lock (analytics:dashboard:{tenant_id}:lock) lets a single
+worker regenerate the metrics while concurrent callers wait for the cache.
+The lock value is a per-call random token; it is released with a
+compare-and-delete script so a worker never deletes a lock it no longer owns.
 
 Security (C1, C2):
   - schema_name validated by caller before passing here.
@@ -18,6 +22,7 @@ Security (C1, C2):
   - Parameterized queries only (SQLAlchemy text() with named :params).
 """
 
+import asyncio
 import json
 import uuid
 from typing import Any
@@ -31,6 +36,26 @@ from src.logger import logger
 # Redis TTL for dashboard metrics (seconds)
 _METRICS_CACHE_TTL = 300  # 5 minutes
 
+# Compact JSON for the cached payload. The shared Redis client decodes replies
+# to str (decode_responses=True), so a binary codec (msgpack) would not round-trip;
+# dropping the default ", " / ": " whitespace is the cheap win on size.
+_JSON_SEPARATORS = (",", ":")
+
+# Single-flight regeneration on cache miss: only the worker holding the lock
+# runs the COUNT query; others poll the cache briefly before falling back.
+_REGEN_LOCK_TTL = 5            # seconds — upper bound if the holder dies
+_REGEN_WAIT_INTERVAL = 0.05    # seconds between cache re-reads
+_REGEN_WAIT_ATTEMPTS = 10      # ~0.5s total before computing anyway
+
+# Atomic Lua: DEL the lock only while it still holds our token. If regeneration
+# outlived _REGEN_LOCK_TTL the lock may now belong to another worker.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 
 class AnalyticsService:
     """
@@ -68,51 +93,82 @@ class AnalyticsService:
         except Exception as exc:
             logger.warning("Analytics cache read failed", exc=str(exc))
 
-        # --- 2. Query DB ---
+        # --- 2. Single-flight: one regenerator per tenant on cache expiry ---
+        lock_key = f"{cache_key}:lock"
+        lock_token: str | None = uuid.uuid4().hex
+        try:
+            acquired = await redis.set(lock_key, lock_token, nx=True, ex=_REGEN_LOCK_TTL)
+        except Exception as exc:
+            logger.warning("Analytics cache lock failed", exc=str(exc))
+            # Fail open — behave as before the lock existed; no lock is held,
+            # so there is nothing to release afterwards.
+            acquired, lock_token = True, None
+
+        if not acquired:
+            cached = await self._wait_for_cache(redis, cache_key)
+            if cached is not None:
+                return cached
+
+        # --- 3. Query DB ---
         metrics = await self._compute_metrics(schema_name, tenant_id, db)
 
-        # --- 3. Store in cache ---
+        # --- 4. Store in cache, then release the lock ---
         try:
-            await redis.setex(cache_key, _METRICS_CACHE_TTL, json.dumps(metrics, default=str))
+            await redis.setex(
+                cache_key,
+                _METRICS_CACHE_TTL,
+                json.dumps(metrics, default=str, separators=_JSON_SEPARATORS),
+            )
+            if acquired and lock_token is not None:
+                await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)  # type: ignore[arg-type]
         except Exception as exc:
             logger.warning("Analytics cache write failed", exc=str(exc))
 
         return metrics
 
+    async def _wait_for_cache(self, redis: Any, cache_key: str) -> dict[str, Any] | None:
+        """Poll the cache while another worker regenerates it; None on timeout."""
+        for _ in range(_REGEN_WAIT_ATTEMPTS):
+            await asyncio.sleep(_REGEN_WAIT_INTERVAL)
+            try:
+                cached_raw = await redis.get(cache_key)
+            except Exception as exc:
+                logger.warning("Analytics cache read failed", exc=str(exc))
+                return None
+            if cached_raw:
+                return json.loads(cached_raw)
+        return None
+
     async def _compute_metrics(
         self,
         schema_name: str,
         tenant_id: uuid.UUID,
         db: AsyncSession,
     ) -> dict[str, Any]:
-        """Execute COUNT queries and build the metrics dict."""
-        # Active users: members of this tenant with is_active = true
+        """
+        Execute both COUNTs in a single statement (one DB round-trip) and build
+        the metrics dict.
+
+          - active_users:    members of this tenant with is_active = true
+          - active_projects: projects in tenant schema with is_active = true
+        """
         try:
-            user_result = await db.execute(
+            result = await db.execute(
                 text(
-                    "SELECT COUNT(*) AS cnt FROM public.tenants_users "
-                    "WHERE tenant_id = :tenant_id AND is_active = true"
+                    "SELECT "
+                    "(SELECT COUNT(*) FROM public.tenants_users "
+                    " WHERE tenant_id = :tenant_id AND is_active = true) AS active_users, "
+                    f'(SELECT COUNT(*) FROM "{schema_name}".projects '
+                    " WHERE is_active = true) AS active_projects"
                 ),
                 {"tenant_id": str(tenant_id)},
             )
-            row = user_result.fetchone()
+            row = result.fetchone()
             active_users: int = row[0] if row else 0
+            active_projects: int = row[1] if row else 0
         except Exception as exc:
-            logger.warning("Analytics: user count query failed", exc=str(exc))
+            logger.warning("Analytics: count query failed", exc=str(exc))
             active_users = 0
-
-        # Active projects: projects in tenant schema with is_active = true
-        try:
-            project_result = await db.execute(
-                text(
-                    f'SELECT COUNT(*) AS cnt FROM "{schema_name}".projects '
-                    "WHERE is_active = true"
-                ),
-            )
-            row = project_result.fetchone()
-            active_projects: int = row[0] if row else 0
-        except Exception as exc:
-            logger.warning("Analytics: project count query failed", exc=str(exc))
             active_projects = 0
 
         return {
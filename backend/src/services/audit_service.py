@@ -7,8 +7,12 @@ AC: #7 — @audit_action decorator, action catalog, non-blocking pattern
 Design:
   - log_action()       — synchronous within an existing DB session (for in-transaction use,
                          e.g., audit BEFORE hard-delete so project data is still available)
-  - log_action_async() — opens its own session; fire-and-forget via BackgroundTasks or
-                         asyncio.create_task().  MUST NOT fail the main request.
+  - log_action_async() — buffers the row in memory and returns; a background flush
+                         writes buffered rows in batches (one session, one executemany
+                         and one commit per schema). Fire-and-forget via BackgroundTasks
+                         or asyncio.create_task().  MUST NOT fail the main request.
+                         Rows still buffered on a hard crash are lost (see flush()).
+  - flush()            — writes everything buffered now; called on app shutdown.
   - Convenience wrappers pre-fill resource_type for common domains.
   - @audit_action decorator auto-logs endpoints that receive `request` and `auth` kwargs.
 
@@ -25,14 +29,172 @@ Security (C1, C2):
 import asyncio
 import functools
 import json
+import re
 import uuid
 from typing import Any, Callable, Optional
 
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logger import logger
 
+# Batching for log_action_async(): flush when this many rows are buffered,
+# or this many seconds after the first row of a batch arrived.
+_AUDIT_BATCH_MAX = 100
+_AUDIT_FLUSH_INTERVAL = 0.2  # seconds
+
+# Per-schema groups at least this large are written with a binary COPY when
+# the session runs on asyncpg (no SQL parse/bind per row); smaller groups and
+# other drivers use the executemany INSERT.
+_AUDIT_COPY_MIN_ROWS = 100
+_AUDIT_COLUMNS = (
+    "tenant_id", "actor_user_id", "action", "resource_type", "resource_id",
+    "details", "ip_address", "user_agent",
+)
+
+# Action naming convention (see catalog below): {resource_type}.{verb},
+# lowercase snake_case on both sides of a single dot.
+_ACTION_RE = re.compile(r"[a-z][a-z0-9_]*\.[a-z][a-z0-9_]*")
+
+
+@functools.lru_cache(maxsize=64)
+def _insert_stmt(schema_name: str) -> TextClause:
+    """
+    INSERT statement for a tenant schema's audit_logs, built once per schema.
+
+    text() parses the SQL for :bind params on construction; caching the
+    immutable TextClause skips that on every audit write.
+    """
+    return text(
+        f'INSERT INTO "{schema_name}".audit_logs '
+        "(tenant_id, actor_user_id, action, resource_type, resource_id, "
+        " details, ip_address, user_agent) "
+        "VALUES (:tenant_id, :actor_user_id, :action, :resource_type, "
+        "        :resource_id, :details::jsonb, :ip_address, :user_agent)"
+    )
+
+
+def _row_values(
+    tenant_id: uuid.UUID,
+    actor_user_id: uuid.UUID,
+    action: str,
+    resource_type: str,
+    resource_id: Optional[uuid.UUID],
+    details: Optional[dict],
+    ip_address: Optional[str],
+    user_agent: Optional[str],
+) -> tuple[Any, ...]:
+    """Column values for one audit row, in _AUDIT_COLUMNS order."""
+    if _ACTION_RE.fullmatch(action) is None:
+        # Still written — the audit layer never rejects an event.
+        logger.warning("Audit action does not match {resource_type}.{verb}", action=action)
+    return (
+        str(tenant_id),
+        str(actor_user_id),
+        action,
+        resource_type,
+        str(resource_id) if resource_id else None,
+        # Most events carry no details: skip the encoder for the common case.
+        # Compact separators — JSONB discards the whitespace anyway.
+        json.dumps(details, default=str, separators=(",", ":")) if details else "{}",
+        ip_address,
+        user_agent,
+    )
+
+
+def _row_params(*args: Any) -> dict[str, Any]:
+    """Named :params for _insert_stmt(); same arguments as _row_values()."""
+    return dict(zip(_AUDIT_COLUMNS, _row_values(*args)))
+
+
+class _AuditBatch:
+    """
+    Buffered rows for one tenant schema, stored column-wise: one list per
+    entry of _AUDIT_COLUMNS. Appending a row touches eight lists and
+    allocates no per-row dict; COPY consumes the columns via zip().
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self) -> None:
+        self.columns: tuple[list[Any], ...] = tuple([] for _ in _AUDIT_COLUMNS)
+
+    def __len__(self) -> int:
+        return len(self.columns[0])
+
+    def append(self, values: tuple[Any, ...]) -> None:
+        for column, value in zip(self.columns, values):
+            column.append(value)
+
+    def records(self) -> list[tuple[Any, ...]]:
+        """Row tuples in _AUDIT_COLUMNS order (COPY input)."""
+        return list(zip(*self.columns))
+
+    def params(self) -> list[dict[str, Any]]:
+        """Row dicts keyed by column (executemany input for _insert_stmt())."""
+        return [dict(zip(_AUDIT_COLUMNS, record)) for record in zip(*self.columns)]
+
+
+async def _copy_rows(db: AsyncSession, schema_name: str, batch: _AuditBatch) -> bool:
+    """
+    COPY the batch into "{schema_name}".audit_logs over the session's asyncpg
+    connection, inside the session's transaction. Returns False, writing
+    nothing, when the underlying driver has no copy_records_to_table.
+    """
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    copy = getattr(raw.driver_connection, "copy_records_to_table", None)
+    if copy is None:
+        return False
+    # The asyncpg adapter issues BEGIN lazily, on the first execute(). A raw
+    # COPY sent first would run outside the transaction and autocommit, so a
+    # later rollback could not undo it — start the transaction explicitly.
+    await conn.exec_driver_sql("SELECT 1")
+    await copy(
+        "audit_logs",
+        schema_name=schema_name,
+        columns=list(_AUDIT_COLUMNS),
+        records=batch.records(),
+    )
+    return True
+
+
+async def _write_batch(db: AsyncSession, schema_name: str, batch: _AuditBatch) -> None:
+    """
+    Write and commit one schema's buffered rows.
+
+    If the group fails it is rolled back and retried one row per commit, so
+    a bad row (or a dropped schema) costs only the rows that fail again —
+    each logged, never re-raised.
+    """
+    try:
+        if not (len(batch) >= _AUDIT_COPY_MIN_ROWS and await _copy_rows(db, schema_name, batch)):
+            await db.execute(_insert_stmt(schema_name), batch.params())
+        await db.commit()
+        return
+    except Exception as exc:
+        await db.rollback()
+        logger.warning(
+            "Audit batch write failed, retrying row by row",
+            schema_name=schema_name,
+            rows=len(batch),
+            exc=str(exc),
+        )
+
+    for params in batch.params():
+        try:
+            await db.execute(_insert_stmt(schema_name), params)
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            logger.error(
+                "Audit log write failed (async background)",
+                schema_name=schema_name,
+                action=params["action"],
+                resource_type=params["resource_type"],
+                exc=str(exc),
+            )
+
 
 # ---------------------------------------------------------------------------
 # AuditService
@@ -47,6 +209,12 @@ class AuditService:
     never block or fail the main request path.
     """
 
+    def __init__(self) -> None:
+        # schema_name -> rows awaiting the next batch flush
+        self._pending: dict[str, _AuditBatch] = {}
+        self._pending_rows = 0
+        self._flush_task: Optional[asyncio.Task] = None
+
     # ------------------------------------------------------------------
     # Core: synchronous insert within an existing session
     # ------------------------------------------------------------------
@@ -85,23 +253,11 @@ class AuditService:
         """
         try:
             await db.execute(
-                text(
-                    f'INSERT INTO "{schema_name}".audit_logs '
-                    "(tenant_id, actor_user_id, action, resource_type, resource_id, "
-                    " details, ip_address, user_agent) "
-                    "VALUES (:tenant_id, :actor_user_id, :action, :resource_type, "
-                    "        :resource_id, :details::jsonb, :ip_address, :user_agent)"
+                _insert_stmt(schema_name),
+                _row_params(
+                    tenant_id, actor_user_id, action, resource_type,
+                    resource_id, details, ip_address, user_agent,
                 ),
-                {
-                    "tenant_id": str(tenant_id),
-                    "actor_user_id": str(actor_user_id),
-                    "action": action,
-                    "resource_type": resource_type,
-                    "resource_id": str(resource_id) if resource_id else None,
-                    "details": json.dumps(details or {}, default=str),
-                    "ip_address": ip_address,
-                    "user_agent": user_agent,
-                },
             )
         except Exception as exc:
             # Non-fatal: log the error but don't propagate (AC3, AC7 — must not fail request)
@@ -129,37 +285,37 @@ class AuditService:
         user_agent: Optional[str] = None,
     ) -> None:
         """
-        Non-blocking audit log insert.  Opens its own DB session and commits.
+        Non-blocking audit log insert.  Buffers the row and returns immediately.
+
+        Buffered rows are written by flush(): after _AUDIT_FLUSH_INTERVAL
+        seconds, or at once when _AUDIT_BATCH_MAX rows are waiting — one
+        session per batch and one executemany + commit per schema instead of
+        a session + commit per event.
 
         Designed for use as a BackgroundTasks callback or asyncio.create_task target.
         Any exception is caught and logged; the audit failure MUST NOT propagate to
         the caller (AC3: audit logging must not slow down the main request).
 
-        Args: same as log_action() except no `db` (opens its own session).
+        Args: same as log_action() except no `db` (flush() opens its own session).
         """
-        from src.db import AsyncSessionLocal
         try:
-            async with AsyncSessionLocal() as db:
-                await db.execute(
-                    text(
-                        f'INSERT INTO "{schema_name}".audit_logs '
-                        "(tenant_id, actor_user_id, action, resource_type, resource_id, "
-                        " details, ip_address, user_agent) "
-                        "VALUES (:tenant_id, :actor_user_id, :action, :resource_type, "
-                        "        :resource_id, :details::jsonb, :ip_address, :user_agent)"
-                    ),
-                    {
-                        "tenant_id": str(tenant_id),
-                        "actor_user_id": str(actor_user_id),
-                        "action": action,
-                        "resource_type": resource_type,
-                        "resource_id": str(resource_id) if resource_id else None,
-                        "details": json.dumps(details or {}, default=str),
-                        "ip_address": ip_address,
-                        "user_agent": user_agent,
-                    },
-                )
-                await db.commit()
+            values = _row_values(
+                tenant_id, actor_user_id, action, resource_type,
+                resource_id, details, ip_address, user_agent,
+            )
+            batch = self._pending.get(schema_name)
+            if batch is None:
+                batch = self._pending[schema_name] = _AuditBatch()
+            batch.append(values)
+            self._pending_rows += 1
+            if self._pending_rows >= _AUDIT_BATCH_MAX:
+                await self.flush()
+            elif (
+                self._flush_task is None
+                or self._flush_task.done()
+                or self._flush_task.get_loop() is not asyncio.get_running_loop()
+            ):
+                self._flush_task = asyncio.create_task(self._flush_later())
         except Exception as exc:
             logger.error(
                 "Audit log write failed (async background)",
@@ -168,6 +324,49 @@ class AuditService:
                 exc=str(exc),
             )
 
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(_AUDIT_FLUSH_INTERVAL)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Write every buffered log_action_async() row now.
+
+        Rows are grouped by tenant schema; each group is one executemany
+        (or, for groups of _AUDIT_COPY_MIN_ROWS+ on asyncpg, one binary COPY)
+        on a shared session and is committed on its own, so one tenant's
+        failure never drops another tenant's rows.  A failed group is retried
+        row by row (see _write_batch); only rows that fail again are logged
+        and dropped, as on the per-event path.  Nothing is re-raised.
+
+        Rows are held in memory until then: if the process dies without
+        running the shutdown flush() (SIGKILL, OOM, crash), up to
+        _AUDIT_BATCH_MAX rows / _AUDIT_FLUSH_INTERVAL seconds of events are
+        lost.  Events that must survive a crash belong in log_action(),
+        inside the caller's transaction.
+        """
+        timer = self._flush_task
+        if timer is not None and timer is not asyncio.current_task() and not timer.done():
+            timer.cancel()
+        self._flush_task = None
+
+        if not self._pending:
+            return
+        by_schema, self._pending = self._pending, {}
+        rows, self._pending_rows = self._pending_rows, 0
+
+        from src.db import AsyncSessionLocal
+        try:
+            async with AsyncSessionLocal() as db:
+                for schema_name, batch in by_schema.items():
+                    await _write_batch(db, schema_name, batch)
+        except Exception as exc:
+            logger.error(
+                "Audit log write failed (async background)",
+                rows=rows,
+                exc=str(exc),
+            )
+
     # ------------------------------------------------------------------
     # Convenience: domain-scoped wrappers (pre-fill resource_type)
     # ------------------------------------------------------------------
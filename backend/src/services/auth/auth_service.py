@@ -17,17 +17,19 @@ Security constraints:
   - Correlation ID on all log entries
 """
 
+import asyncio
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import get_settings
 from src.logger import logger
+from src.metrics import auth_rate_limit_fail_open_total
 from src.models.user import User
 
 settings = get_settings()
@@ -45,6 +47,11 @@ _pwd_context = CryptContext(
     argon2__parallelism=4,
 )
 
+# Case-insensitive user lookup (LOWER(email) index), built once: execute()
+# then hits SQLAlchemy's compiled cache and asyncpg's prepared statement
+# without rebuilding the select for every login/registration.
+_USER_BY_EMAIL = select(User).where(func.lower(User.email) == bindparam("email"))
+
 
 def hash_password(plain: str) -> str:
     """Hash password with Argon2id."""
@@ -163,8 +170,7 @@ async def register_user(
     normalized_email = email.lower()
 
     # AC5: case-insensitive duplicate check via LOWER(email) index
-    stmt = select(User).where(func.lower(User.email) == normalized_email)
-    result = await db.execute(stmt)
+    result = await db.execute(_USER_BY_EMAIL, {"email": normalized_email})
     existing = result.scalar_one_or_none()
     if existing is not None:
         logger.info(
@@ -269,8 +275,7 @@ async def get_or_create_oauth_user(
         return existing_by_google, False
 
     # Check if email already registered with a different provider
-    stmt = select(User).where(func.lower(User.email) == normalized_email)
-    result = await db.execute(stmt)
+    result = await db.execute(_USER_BY_EMAIL, {"email": normalized_email})
     existing_by_email = result.scalar_one_or_none()
     if existing_by_email is not None:
         # AC2: "If Google email already registered, link accounts"
@@ -349,6 +354,15 @@ def _get_dummy_hash() -> str:
     return _DUMMY_HASH
 
 
+# Budget for the rate-limit MGET round-trip. Only a Redis that is genuinely
+# stalled (minutes-long GC, network partition) degrades to fail-open; the
+# budget is sized well above event-loop jitter under a login burst so the
+# lockout check is not skipped exactly when it matters. Waiting for a pooled
+# connection is deliberately outside the budget: a burst that fills the pool
+# must queue, not skip the check.
+_RATE_LIMIT_CHECK_TIMEOUT = 0.25  # seconds
+
+
 async def _check_login_rate_limit(email: str) -> None:
     """
     Enforce per-email rate limiting and account lockout (AC7, AC8).
@@ -357,6 +371,11 @@ async def _check_login_rate_limit(email: str) -> None:
       login_attempts:{email}  — attempt counter, TTL = login_rate_window_seconds
       login_lockout:{email}   — lockout marker, TTL = login_lockout_window_seconds
 
+    Both keys are read with a single MGET (one Redis round-trip per login).
+    The MGET, once a connection is held, is bounded by
+    _RATE_LIMIT_CHECK_TIMEOUT; on timeout or Redis error the check fails open
+    and auth_rate_limit_fail_open_total is incremented.
+
     Raises:
       AccountLockedError — lockout marker exists (>= lockout_attempts failures)
       RateLimitError     — attempt counter >= max_attempts within rate window
@@ -367,14 +386,20 @@ async def _check_login_rate_limit(email: str) -> None:
         email_key = email.lower()
 
         lockout_key = f"login_lockout:{email_key}"
-        if await redis.exists(lockout_key):
+        attempts_key = f"login_attempts:{email_key}"
+        # client() pins one pooled connection on entry (queueing at the pool
+        # cap, up to the pool's own timeout); only the command gets the budget.
+        async with redis.client() as conn:
+            locked, attempts = await asyncio.wait_for(
+                conn.mget(lockout_key, attempts_key),
+                timeout=_RATE_LIMIT_CHECK_TIMEOUT,
+            )
+        if locked is not None:
             raise AccountLockedError(
                 "Account locked due to repeated failed login attempts. "
                 "Check your email for an unlock link or wait 1 hour."
             )
 
-        attempts_key = f"login_attempts:{email_key}"
-        attempts = await redis.get(attempts_key)
         count = int(attempts) if attempts else 0
         if count >= settings.login_max_attempts:
             raise RateLimitError(
@@ -382,9 +407,17 @@ async def _check_login_rate_limit(email: str) -> None:
             )
     except (AccountLockedError, RateLimitError):
         raise
+    except asyncio.TimeoutError:
+        # Redis reachable but slower than the budget — allow login (fail open)
+        auth_rate_limit_fail_open_total.labels(reason="timeout").inc()
+        logger.warning(
+            "Login rate-limit Redis check timed out (fail open)",
+            timeout_seconds=_RATE_LIMIT_CHECK_TIMEOUT,
+        )
     except Exception as exc:
-        # Redis unavailable — log and allow login (fail open for availability)
-        logger.warning("Login rate-limit Redis check failed (fail open)", error=str(exc))
+        # Redis unavailable (incl. no pooled connection within the pool timeout)
+        auth_rate_limit_fail_open_total.labels(reason="error").inc()
+        logger.warning("Login rate-limit Redis check failed (fail open)", error=repr(exc))
 
 
 async def _record_login_failure(email: str) -> None:
@@ -455,14 +488,14 @@ async def login_with_password(
     await _check_login_rate_limit(normalized)
 
     # Step 2: Load user
-    result = await db.execute(
-        select(User).where(func.lower(User.email) == normalized)
-    )
+    result = await db.execute(_USER_BY_EMAIL, {"email": normalized})
     user = result.scalar_one_or_none()
 
-    # Step 3: Always run bcrypt verify (constant-time; prevents timing enumeration)
+    # Step 3: Always run the hash verify (constant-time; prevents timing enumeration).
+    # Argon2id (64 MiB, t=3) runs in a worker thread so concurrent logins do not
+    # block the event loop — and with it every other request's Redis checks.
     stored_hash = user.password_hash if (user and user.password_hash) else _get_dummy_hash()
-    password_ok = verify_password(password, stored_hash)
+    password_ok = await asyncio.to_thread(verify_password, password, stored_hash)
 
     # Step 4: Fail path — same error for missing user, wrong password, OAuth-only account
     if user is None or not password_ok or user.password_hash is None:
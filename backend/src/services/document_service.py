@@ -38,7 +38,7 @@ from src.api.v1.documents.schemas import FileTooLargeError, UnsupportedFileTypeE
 from src.config import get_settings
 from src.db import AsyncSessionLocal
 from src.logger import logger
-from src.services.audit_service import AuditService
+from src.services.audit_service import audit_service
 from src.services.embedding_service import embedding_service
 
 settings = get_settings()
@@ -64,7 +64,8 @@ _ACCEPTED_EXTENSIONS: dict[str, str] = {
     ".txt": "md",  # stored as md type
 }
 
-_audit_service = AuditService()
+# Shared singleton so buffered audit rows are flushed together (and on shutdown)
+_audit_service = audit_service
 
 
 # ---------------------------------------------------------------------------
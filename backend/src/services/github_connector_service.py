@@ -350,7 +350,13 @@ async def clone_repo_task(
             logger.info("github: cloning repo", connection_id=connection_id, clone_dir=str(clone_dir))
 
             # Run synchronous git clone in thread pool to avoid blocking event loop
-            await asyncio.to_thread(Repo.clone_from, clone_url, str(clone_dir), depth=1)
+            cloned_repo = await asyncio.to_thread(Repo.clone_from, clone_url, str(clone_dir), depth=1)
+            # Repo + commit identifies the tree; lets a re-connect of the same
+            # commit reuse the earlier analysis even though clone_dir is new.
+            try:
+                analysis_key = f"{owner_repo.group(1)}/{owner_repo.group(2)}@{cloned_repo.head.commit.hexsha}"
+            except ValueError:  # empty repository — no HEAD commit to key on
+                analysis_key = None
 
             expires_at = datetime.now(timezone.utc) + timedelta(days=_REPO_EXPIRY_DAYS)
 
@@ -374,8 +380,11 @@ async def clone_repo_task(
 
             # Story 2-4: Source code analysis (AC-11d/e)
             # Runs inside the same AsyncSessionLocal() context — no new session needed (C6).
+            # The filesystem scan runs in a worker thread so it does not block the event loop.
             try:
-                summary    = source_code_analyzer_service.analyze(str(clone_dir))
+                summary    = await source_code_analyzer_service.analyze_async(
+                    str(clone_dir), cache_key=analysis_key
+                )
                 routes     = summary.get('routes', [])
                 components = summary.get('components', [])
 
@@ -12,34 +12,53 @@ Security (C1):
   - All paths stored as relative to clone_path (no absolute filesystem paths exposed)
   - No user data interpolated into regex or file operations
 
-Constraint (C3): stdlib only — os, re, json, pathlib. No new pip packages.
+Constraint (C3): stdlib only — os, re, ast, json, mmap, asyncio, pathlib. No new pip packages.
 Constraint (C4): unknown framework is NOT a failure — returns 'unknown', status still set to 'analyzed'.
 """
 
 from __future__ import annotations
 
+import ast
+import asyncio
 import json
+import mmap
 import os
 import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Union
 
 
 # ---------------------------------------------------------------------------
 # Compiled regex patterns
+# Source-file patterns are bytes patterns: files are scanned as raw bytes
+# (see _source_buffer) and only the captured groups are decoded.
 # ---------------------------------------------------------------------------
 
 # AC-11a: FastAPI detection
-_FASTAPI_IMPORT_RE = re.compile(r'from fastapi import|FastAPI\(\)')
+_FASTAPI_IMPORT_RE = re.compile(rb'from fastapi import|FastAPI\(\)')
 
-# AC-11a: Spring Boot detection in pom.xml / build.gradle
-_SPRING_BOOT_RE = re.compile(r'spring-boot')
+# AC-11a: Spring Boot detection in pom.xml / build.gradle — plain substring
+# (matches both the starter artifact and the Gradle plugin id)
+_SPRING_BOOT_MARKER = b'spring-boot'
+_SPRING_MANIFESTS = ('pom.xml', 'build.gradle', 'build.gradle.kts')
 
 # AC-11b: FastAPI route decorators
 # Matches: @app.get("/path") or @router.post("/path") etc.
 # Groups: (1) http_method, (2) path
+# Fallback for files that do not parse (see _fastapi_routes_from_ast).
 _FASTAPI_ROUTE_RE = re.compile(
-    r'@(?:app|router)\.(get|post|put|patch|delete)\(["\']([^"\']+)["\']',
+    rb'@(?:app|router)\.(get|post|put|patch|delete)\(["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+
+# Cheap pre-filter: only files containing a route-decorator call pay for
+# ast.parse. Looser than _FASTAPI_ROUTE_RE so path= keywords and multi-line
+# decorator arguments still reach the AST walk.
+_FASTAPI_DECORATOR_HINT_RE = re.compile(
+    rb'@(?:app|router)\.(?:get|post|put|patch|delete)\(',
     re.IGNORECASE,
 )
 
@@ -47,7 +66,7 @@ _FASTAPI_ROUTE_RE = re.compile(
 # Matches: router.get("/path") or router.post("/path") etc.
 # Groups: (1) http_method, (2) path
 _EXPRESS_ROUTE_RE = re.compile(
-    r'router\.(get|post|put|patch|delete)\(["\']([^"\']+)["\']',
+    rb'router\.(get|post|put|patch|delete)\(["\']([^"\']+)["\']',
     re.IGNORECASE,
 )
 
@@ -55,25 +74,183 @@ _EXPRESS_ROUTE_RE = re.compile(
 # Matches: @GetMapping("/path") or @PostMapping("/path") etc.
 # Groups: (1) annotation_name, (2) path
 _SPRING_ROUTE_RE = re.compile(
-    r'@(GetMapping|PostMapping|PutMapping|DeleteMapping|RequestMapping)'
-    r'\(["\']?([^"\')\s]+)["\']?\)',
+    rb'@(GetMapping|PostMapping|PutMapping|DeleteMapping|RequestMapping)'
+    rb'\(["\']?([^"\')\s]+)["\']?\)',
 )
 
 # Maps Spring annotation name → HTTP method
-_SPRING_METHOD_MAP: dict[str, str] = {
-    "getmapping":     "GET",
-    "postmapping":    "POST",
-    "putmapping":     "PUT",
-    "deletemapping":  "DELETE",
-    "requestmapping": "GET",  # RequestMapping defaults to GET for MVP
+_SPRING_METHOD_MAP: dict[bytes, str] = {
+    b"getmapping":     "GET",
+    b"postmapping":    "POST",
+    b"putmapping":     "PUT",
+    b"deletemapping":  "DELETE",
+    b"requestmapping": "GET",  # RequestMapping defaults to GET for MVP
+}
+
+# FastAPI / Express verb → HTTP method. Every route dict shares these
+# constant strings instead of allocating a fresh decode().upper() per match.
+_HTTP_METHOD_MAP: dict[bytes, str] = {
+    b"get":    "GET",
+    b"post":   "POST",
+    b"put":    "PUT",
+    b"patch":  "PATCH",
+    b"delete": "DELETE",
 }
 
 # AC-11c: React component — export default function/class ComponentName
 _REACT_COMPONENT_RE = re.compile(
-    r'export\s+default\s+(?:function|class)\s+([A-Z][A-Za-z0-9_]*)'
+    rb'export\s+default\s+(?:function|class)\s+([A-Z][A-Za-z0-9_]*)'
+)
+
+
+# ---------------------------------------------------------------------------
+# Filesystem helpers
+# ---------------------------------------------------------------------------
+
+# Directory names never descended into: vendored dependencies, build output,
+# caches. Hidden directories (.git, .venv, .next, ...) are skipped as well
+# unless prune_hidden=False.
+_PRUNE_DIRS = frozenset({
+    'node_modules', '__pycache__', 'target', 'dist', 'build', 'venv',
+})
+
+
+def _iter_files(
+    root: str,
+    suffixes: tuple[str, ...],
+    prune: frozenset[str] = _PRUNE_DIRS,
+    prune_hidden: bool = True,
+) -> Iterator[os.DirEntry]:
+    """
+    Yield DirEntry objects for regular files under root whose name ends with
+    one of suffixes.
+
+    Iterative os.scandir walk (explicit stack, no recursion): DirEntry.is_dir()
+    and is_file() reuse the d_type returned by getdents, so no per-entry stat()
+    is issued. Symlinks are not followed (a cloned repo must not be able to
+    point the scan outside clone_path); unreadable directories are skipped,
+    matching os.walk's default onerror=None behaviour. Subdirectories named
+    in prune are not entered, nor hidden ones while prune_hidden is set.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in prune and not (
+                            prune_hidden and entry.name.startswith('.')
+                        ):
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and entry.name.endswith(suffixes):
+                        yield entry
+                except OSError:
+                    continue
+
+
+# Root-level build manifests consulted by detect_framework (AC-11a)
+_MARKER_FILES = frozenset({'package.json', *_SPRING_MANIFESTS})
+
+
+def _root_markers(root: str) -> frozenset[str]:
+    """Return which of _MARKER_FILES exist as regular files directly in root."""
+    try:
+        with os.scandir(root) as it:
+            return frozenset(
+                e.name for e in it
+                if e.name in _MARKER_FILES and e.is_file()
+            )
+    except OSError:
+        return frozenset()
+
+
+# Below this size a plain read() is cheaper than setting up a mapping.
+_MMAP_MIN_SIZE = 4096
+
+# madvise() hints applied to each mapping (only those this platform defines)
+_MMAP_ADVICE = tuple(
+    getattr(mmap, name) for name in ('MADV_SEQUENTIAL', 'MADV_WILLNEED')
+    if hasattr(mmap, name)
 )
 
 
+@contextmanager
+def _source_buffer(path: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Yield the raw contents of a source file for a bytes regex scan.
+
+    Files of _MMAP_MIN_SIZE or more are memory-mapped read-only so large
+    JS/TS bundles are scanned in place without a read() copy or a UTF-8
+    decode. Where the platform supports it the mapping is advised
+    MADV_SEQUENTIAL (aggressive readahead, early page drop) and
+    MADV_WILLNEED (start reading the whole file now), so disk I/O for the
+    rest of the file overlaps the regex scan of its first pages. Smaller
+    files are read whole. Raises OSError like open().
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            for advice in _MMAP_ADVICE:
+                buf.madvise(advice)
+            yield buf
+
+
+# Decorator receivers recognised as FastAPI routers (mirrors _FASTAPI_ROUTE_RE)
+_FASTAPI_ROUTERS = frozenset({'app', 'router'})
+_FASTAPI_METHODS = {verb.decode(): method for verb, method in _HTTP_METHOD_MAP.items()}
+
+
+def _fastapi_routes_from_ast(source: bytes) -> list[tuple[str, str]] | None:
+    """
+    Return (METHOD, path) for each route decorator on a function, in source order.
+
+    Only real decorators count — commented-out code and decorator-like text
+    inside strings are ignored, and path= keyword arguments are understood.
+    Returns None if the file does not parse — including deeply nested or
+    generated code that exhausts the parser (RecursionError, MemoryError) —
+    so the caller can fall back to the regex scan.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return None
+
+    found: list[tuple[int, int, str, str]] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for dec in node.decorator_list:
+            if not (
+                isinstance(dec, ast.Call)
+                and isinstance(dec.func, ast.Attribute)
+                and isinstance(dec.func.value, ast.Name)
+                and dec.func.value.id.lower() in _FASTAPI_ROUTERS
+                and dec.func.attr.lower() in _FASTAPI_METHODS
+            ):
+                continue
+            path_arg = dec.args[0] if dec.args else next(
+                (kw.value for kw in dec.keywords if kw.arg == 'path'), None
+            )
+            if isinstance(path_arg, ast.Constant) and isinstance(path_arg.value, str) and path_arg.value:
+                found.append((
+                    dec.lineno, dec.col_offset,
+                    _FASTAPI_METHODS[dec.func.attr.lower()], path_arg.value,
+                ))
+    found.sort()
+    return [(method, path) for _, _, method, path in found]
+
+
+def _decode(value: bytes) -> str:
+    """Decode a captured group, ignoring undecodable bytes (as read_text did)."""
+    return value.decode('utf-8', errors='ignore')
+
+
 # ---------------------------------------------------------------------------
 # SourceCodeAnalyzerService
 # ---------------------------------------------------------------------------
@@ -84,10 +261,33 @@ class SourceCodeAnalyzerService:
     and React component structure.
 
     Operates entirely on the local filesystem — no network or DB calls.
-    All methods are synchronous (pure CPU/IO); designed to be called from
-    clone_repo_task which runs analysis inside a BackgroundTask.
+    All methods are synchronous (pure CPU/IO); async callers such as
+    clone_repo_task use analyze_async(), which runs analyze() in a worker
+    thread so a large-repo scan does not block the event loop.
+
+    analyze() results can be memoised in a bounded in-process LRU under a
+    caller-supplied cache_key that identifies the checkout's content (e.g.
+    repo plus commit SHA); without a key every call scans the tree.
+
+    Directories named in prune_dirs (default: node_modules, build output,
+    caches) are never walked; hidden directories are skipped too unless
+    prune_hidden=False (e.g. to scan .github/workflows).
     """
 
+    _CACHE_MAX_ENTRIES = 128
+
+    def __init__(
+        self,
+        prune_dirs: frozenset[str] = _PRUNE_DIRS,
+        prune_hidden: bool = True,
+    ) -> None:
+        self._prune_dirs = frozenset(prune_dirs)
+        self._prune_hidden = prune_hidden
+        self._analysis_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # analyze() runs on asyncio.to_thread workers: get → move_to_end and
+        # insert → evict must not interleave across threads.
+        self._cache_lock = threading.Lock()
+
     # ------------------------------------------------------------------
     # AC-11a: Framework detection
     # ------------------------------------------------------------------
@@ -102,48 +302,48 @@ class SourceCodeAnalyzerService:
         """
         root = Path(clone_path)
 
+        # Probe root-level marker files with one scandir before any tree walk,
+        # so the Express / Spring Boot checks below never stat or open files
+        # that are not there.
+        markers = _root_markers(clone_path)
+
         # 1. FastAPI: walk *.py files for FastAPI import or instantiation
-        for dirpath, _dirs, files in os.walk(root):
-            for fname in files:
-                if not fname.endswith('.py'):
-                    continue
-                try:
-                    content = Path(dirpath, fname).read_text(
-                        encoding='utf-8', errors='ignore'
-                    )
-                    if _FASTAPI_IMPORT_RE.search(content):
-                        return 'fastapi'
-                except OSError:
-                    continue
+        for entry in _iter_files(clone_path, ('.py',), self._prune_dirs, self._prune_hidden):
+            try:
+                with _source_buffer(entry.path) as buf:
+                    found = _FASTAPI_IMPORT_RE.search(buf) is not None
+            except OSError:
+                continue
+            if found:
+                return 'fastapi'
 
         # 2. Express.js: package.json in repo root with 'express' in deps
-        pkg_json = root / 'package.json'
-        if pkg_json.exists():
+        if 'package.json' in markers:
             try:
-                pkg = json.loads(
-                    pkg_json.read_text(encoding='utf-8', errors='ignore')
-                )
-                all_deps = {
-                    **pkg.get('dependencies', {}),
-                    **pkg.get('devDependencies', {}),
-                }
-                if 'express' in all_deps:
+                # json.loads takes bytes directly (UTF-8/16/32 and a UTF-8
+                # BOM auto-detected), skipping a separate decode pass over the
+                # file. Undecodable bytes raise UnicodeDecodeError, a
+                # ValueError, so they land in the same handler as bad JSON.
+                pkg = json.loads((root / 'package.json').read_bytes())
+                if (
+                    'express' in pkg.get('dependencies', {})
+                    or 'express' in pkg.get('devDependencies', {})
+                ):
                     return 'express'
-            except (OSError, json.JSONDecodeError):
+            except (OSError, ValueError):
                 pass
 
         # 3. Spring Boot: pom.xml or build.gradle containing 'spring-boot'
-        for spring_file in ('pom.xml', 'build.gradle', 'build.gradle.kts'):
-            spring_path = root / spring_file
-            if spring_path.exists():
-                try:
-                    content = spring_path.read_text(
-                        encoding='utf-8', errors='ignore'
-                    )
-                    if _SPRING_BOOT_RE.search(content):
+        #    (bytes find over the raw file — no decode, no regex)
+        for spring_file in _SPRING_MANIFESTS:
+            if spring_file not in markers:
+                continue
+            try:
+                with _source_buffer(os.path.join(clone_path, spring_file)) as buf:
+                    if buf.find(_SPRING_BOOT_MARKER) != -1:
                         return 'spring_boot'
-                except OSError:
-                    pass
+            except OSError:
+                pass
 
         return 'unknown'
 
@@ -155,76 +355,73 @@ class SourceCodeAnalyzerService:
         self, clone_path: str, framework: str
     ) -> list[dict[str, str]]:
         """
-        Extract route definitions from source files using regex scan.
+        Extract route definitions from source files.
+
+        FastAPI decorators are read from the parsed AST (regex fallback for
+        files that do not parse); Express and Spring Boot use a regex scan.
 
         Returns list of {method, path, file} dicts.
         'file' is relative to clone_path (C7).
         Returns [] for unknown framework (C4).
         """
-        root = Path(clone_path)
+        root_len = len(os.path.join(clone_path, ''))
         routes: list[dict[str, str]] = []
 
         if framework == 'fastapi':
-            for dirpath, _dirs, files in os.walk(root):
-                for fname in files:
-                    if not fname.endswith('.py'):
-                        continue
-                    fpath = Path(dirpath, fname)
-                    try:
-                        content = fpath.read_text(
-                            encoding='utf-8', errors='ignore'
-                        )
-                    except OSError:
-                        continue
-                    rel_file = str(fpath.relative_to(root))
-                    for match in _FASTAPI_ROUTE_RE.finditer(content):
-                        routes.append({
-                            'method': match.group(1).upper(),
-                            'path':   match.group(2),
-                            'file':   rel_file,
-                        })
+            for entry in _iter_files(clone_path, ('.py',), self._prune_dirs, self._prune_hidden):
+                try:
+                    with _source_buffer(entry.path) as buf:
+                        # Regex pre-filter: only files that look like they
+                        # declare routes pay for an ast.parse.
+                        if _FASTAPI_DECORATOR_HINT_RE.search(buf) is None:
+                            continue
+                        source = buf[:]
+                except OSError:
+                    continue
+                rel_file = entry.path[root_len:]
+                parsed = _fastapi_routes_from_ast(source)
+                if parsed is None:
+                    parsed = [
+                        (_HTTP_METHOD_MAP[method.lower()], _decode(path))
+                        for method, path in _FASTAPI_ROUTE_RE.findall(source)
+                    ]
+                for method, path in parsed:
+                    routes.append({
+                        'method': method,
+                        'path':   path,
+                        'file':   rel_file,
+                    })
 
         elif framework == 'express':
-            for dirpath, _dirs, files in os.walk(root):
-                for fname in files:
-                    if not (fname.endswith('.js') or fname.endswith('.ts')):
-                        continue
-                    fpath = Path(dirpath, fname)
-                    try:
-                        content = fpath.read_text(
-                            encoding='utf-8', errors='ignore'
-                        )
-                    except OSError:
-                        continue
-                    rel_file = str(fpath.relative_to(root))
-                    for match in _EXPRESS_ROUTE_RE.finditer(content):
-                        routes.append({
-                            'method': match.group(1).upper(),
-                            'path':   match.group(2),
-                            'file':   rel_file,
-                        })
+            for entry in _iter_files(clone_path, ('.js', '.ts'), self._prune_dirs, self._prune_hidden):
+                try:
+                    with _source_buffer(entry.path) as buf:
+                        matches = _EXPRESS_ROUTE_RE.findall(buf)
+                except OSError:
+                    continue
+                rel_file = entry.path[root_len:]
+                for method, path in matches:
+                    routes.append({
+                        'method': _HTTP_METHOD_MAP[method.lower()],
+                        'path':   _decode(path),
+                        'file':   rel_file,
+                    })
 
         elif framework == 'spring_boot':
-            for dirpath, _dirs, files in os.walk(root):
-                for fname in files:
-                    if not fname.endswith('.java'):
-                        continue
-                    fpath = Path(dirpath, fname)
-                    try:
-                        content = fpath.read_text(
-                            encoding='utf-8', errors='ignore'
-                        )
-                    except OSError:
-                        continue
-                    rel_file = str(fpath.relative_to(root))
-                    for match in _SPRING_ROUTE_RE.finditer(content):
-                        annotation = match.group(1).lower()
-                        method = _SPRING_METHOD_MAP.get(annotation, 'GET')
-                        routes.append({
-                            'method': method,
-                            'path':   match.group(2),
-                            'file':   rel_file,
-                        })
+            for entry in _iter_files(clone_path, ('.java',), self._prune_dirs, self._prune_hidden):
+                try:
+                    with _source_buffer(entry.path) as buf:
+                        matches = _SPRING_ROUTE_RE.findall(buf)
+                except OSError:
+                    continue
+                rel_file = entry.path[root_len:]
+                for annotation, path in matches:
+                    method = _SPRING_METHOD_MAP.get(annotation.lower(), 'GET')
+                    routes.append({
+                        'method': method,
+                        'path':   _decode(path),
+                        'file':   rel_file,
+                    })
 
         # framework == 'unknown': returns []
         return routes
@@ -242,32 +439,27 @@ class SourceCodeAnalyzerService:
           - filename stem starts with an uppercase letter (primary heuristic), OR
           - file contains 'export default function/class ComponentName' (fallback).
         """
-        root = Path(clone_path)
+        root_len = len(os.path.join(clone_path, ''))
         components: list[dict[str, str]] = []
 
-        for dirpath, _dirs, files in os.walk(root):
-            for fname in files:
-                if not (fname.endswith('.tsx') or fname.endswith('.jsx')):
-                    continue
-                fpath = Path(dirpath, fname)
-                stem = fpath.stem
-                rel_file = str(fpath.relative_to(root))
+        for entry in _iter_files(clone_path, ('.tsx', '.jsx'), self._prune_dirs, self._prune_hidden):
+            stem = entry.name.rsplit('.', 1)[0]
+            rel_file = entry.path[root_len:]
 
-                # Primary: capitalised filename stem → component name = stem
-                if stem and stem[0].isupper():
-                    components.append({'name': stem, 'file': rel_file})
-                    continue
+            # Primary: capitalised filename stem → component name = stem
+            if stem and stem[0].isupper():
+                components.append({'name': stem, 'file': rel_file})
+                continue
 
-                # Fallback: explicit export default function/class with capital name
-                try:
-                    content = fpath.read_text(
-                        encoding='utf-8', errors='ignore'
-                    )
-                except OSError:
-                    continue
-                match = _REACT_COMPONENT_RE.search(content)
-                if match:
-                    components.append({'name': match.group(1), 'file': rel_file})
+            # Fallback: explicit export default function/class with capital name
+            try:
+                with _source_buffer(entry.path) as buf:
+                    match = _REACT_COMPONENT_RE.search(buf)
+                    name = _decode(match.group(1)) if match else None
+            except OSError:
+                continue
+            if name:
+                components.append({'name': name, 'file': rel_file})
 
         return components
 
@@ -275,7 +467,7 @@ class SourceCodeAnalyzerService:
     # AC-11d/e: Orchestrate
     # ------------------------------------------------------------------
 
-    def analyze(self, clone_path: str) -> dict[str, Any]:
+    def analyze(self, clone_path: str, cache_key: str | None = None) -> dict[str, Any]:
         """
         Orchestrate: detect_framework → extract_routes → extract_components.
 
@@ -283,17 +475,56 @@ class SourceCodeAnalyzerService:
         endpoints == routes in MVP (same extraction, different label for agents).
         Exceptions are NOT caught here — they bubble up to clone_repo_task
         which sets status='failed' (AC-11e).
+
+        cache_key must identify the tree's content (clone_repo_task passes
+        "owner/repo@<commit sha>"); a repeated key returns a copy of the
+        earlier summary without touching the filesystem. None disables caching.
         """
+        if cache_key is not None:
+            with self._cache_lock:
+                cached = self._analysis_cache.get(cache_key)
+                if cached is not None:
+                    self._analysis_cache.move_to_end(cache_key)
+            if cached is not None:
+                return _copy_summary(cached)
+
         framework = self.detect_framework(clone_path)
         routes = self.extract_routes(clone_path, framework)
         components = self.extract_components(clone_path)
 
-        return {
+        summary = {
             'framework':  framework,
             'routes':     routes,
             'components': components,
             'endpoints':  routes,  # MVP: endpoints and routes are the same list
         }
+        if cache_key is None:
+            return summary
+        with self._cache_lock:
+            self._analysis_cache[cache_key] = summary
+            if len(self._analysis_cache) > self._CACHE_MAX_ENTRIES:
+                self._analysis_cache.popitem(last=False)
+        return _copy_summary(summary)
+
+
+    async def analyze_async(self, clone_path: str, cache_key: str | None = None) -> dict[str, Any]:
+        """
+        analyze() offloaded to the default thread pool via asyncio.to_thread.
+
+        Same return value and exception behaviour as analyze() (AC-11e).
+        """
+        return await asyncio.to_thread(self.analyze, clone_path, cache_key)
+
+
+def _copy_summary(summary: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached summary so callers cannot mutate the cache entry."""
+    routes = [dict(r) for r in summary['routes']]
+    return {
+        'framework':  summary['framework'],
+        'routes':     routes,
+        'components': [dict(c) for c in summary['components']],
+        'endpoints':  routes,
+    }
 
 
 # Module-level singleton — imported by clone_repo_task (github_connector_service.py)
@@ -2,7 +2,7 @@
 QUALISYS — SSEManager
 Story: 2-9-real-time-agent-progress-tracking
 
-In-process asyncio.Queue registry for SSE event relay (AC-19, AC-19b).
+In-process event registry for SSE event relay (AC-19, AC-19b).
 
 Design:
   - SSEManager is a module-level singleton.
@@ -10,6 +10,9 @@ Design:
     for a given run_id and reads events from it.
   - The orchestrator calls publish() at every state transition (best-effort).
   - The generator calls remove_queue() in its finally block to clean up.
+  - Each run has exactly one consumer (its SSE generator), so the per-run queue is a
+    RunEventQueue — a deque plus a single asyncio.Event — rather than asyncio.Queue,
+    whose getter/putter waiter bookkeeping only pays off with many consumers.
 
 Concurrency: Single-process FastAPI (MVP). For multi-replica, replace with Redis pub/sub.
 """
@@ -17,19 +20,65 @@ Concurrency: Single-process FastAPI (MVP). For multi-replica, replace with Redis
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from typing import Any
+
+
+class RunEventQueue:
+    """
+    Single-consumer event queue for one agent run.
+
+    Exposes the subset of the asyncio.Queue API the SSE relay uses
+    (put/put_nowait/get/get_nowait/qsize/empty). Bounded at maxsize: when the
+    consumer falls behind, the oldest event is dropped so publish() never
+    blocks the orchestrator and the latest (terminal) event is always kept.
+    """
+
+    __slots__ = ("_items", "_ready")
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        self._items: deque[Any] = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put_nowait(self, item: Any) -> None:
+        self._items.append(item)
+        self._ready.set()
+
+    async def put(self, item: Any) -> None:
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        """Pop the oldest event; raises asyncio.QueueEmpty when there is none."""
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    async def get(self) -> Any:
+        """Wait until an event is available, then pop the oldest one."""
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
 
 
 class SSEManager:
-    """In-process asyncio.Queue registry keyed by run_id."""
+    """In-process RunEventQueue registry keyed by run_id."""
 
     def __init__(self) -> None:
-        self._queues: dict[str, asyncio.Queue] = {}
+        self._queues: dict[str, RunEventQueue] = {}
 
-    def get_or_create_queue(self, run_id: str) -> asyncio.Queue:
+    def get_or_create_queue(self, run_id: str) -> RunEventQueue:
         """Return existing queue for run_id, or create a new one (maxsize=1000 safety bound)."""
-        if run_id not in self._queues:
-            self._queues[run_id] = asyncio.Queue(maxsize=1000)
-        return self._queues[run_id]
+        q = self._queues.get(run_id)
+        if q is None:
+            q = self._queues[run_id] = RunEventQueue(maxsize=1000)
+        return q
 
     def remove_queue(self, run_id: str) -> None:
         """Remove queue from registry. No-op if not found."""
@@ -42,7 +91,7 @@ class SSEManager:
         """
         q = self._queues.get(run_id)
         if q is not None:
-            await q.put({"type": event_type, "payload": payload})
+            q.put_nowait({"type": event_type, "payload": payload})
 
 
 # Module-level singleton — import and use this directly
@@ -12,10 +12,17 @@ Usage:
     total = await token_budget_service.consume_tokens(str(tenant_id), tokens_used)
     usage  = await token_budget_service.get_monthly_usage(str(tenant_id))
     await token_budget_service.check_budget(str(tenant_id), settings.monthly_token_budget)
+    # Known cost up front: check + consume in one round-trip
+    total = await token_budget_service.check_and_consume(
+        str(tenant_id), tokens, settings.monthly_token_budget
+    )
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 from src.cache import get_redis_client
 from src.logger import logger
 from src.patterns.llm_pattern import BudgetExceededError
@@ -26,6 +33,9 @@ from src.patterns.llm_pattern import BudgetExceededError
 
 _MONTHLY_TTL_SECONDS = 2_592_000  # 30 days
 _BUDGET_KEY_PREFIX   = "budget:"
+# In-process usage cache lifetime: check_budget() runs on every agent-run
+# request, while the counter only moves when tokens are consumed.
+_USAGE_CACHE_TTL_SECONDS = 1.0
 
 # Atomic Lua: INCR key by delta, EXPIRE only on first call (count <= delta).
 # Returns [new_total, ttl].
@@ -41,6 +51,26 @@ end
 return {count, redis.call('TTL', key)}
 """
 
+# Atomic Lua: check-then-INCR in one round-trip.
+# Rejects (without incrementing) when the counter is already at the limit or
+# adding delta would exceed it. Returns [total, flag]: flag -1 = rejected and
+# total is the unchanged usage; flag 0 = consumed and total is the new count.
+_CHECK_AND_CONSUME_SCRIPT = """
+local key   = KEYS[1]
+local delta = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local ttl   = tonumber(ARGV[3])
+local used  = tonumber(redis.call('GET', key) or '0')
+if used >= limit or used + delta > limit then
+    return {used, -1}
+end
+local count = redis.call('INCRBY', key, delta)
+if count == delta then
+    redis.call('EXPIRE', key, ttl)
+end
+return {count, 0}
+"""
+
 
 def _monthly_key(tenant_id: str) -> str:
     return f"{_BUDGET_KEY_PREFIX}{tenant_id}:monthly"
@@ -54,8 +84,49 @@ class TokenBudgetService:
     """
     Tracks per-tenant token consumption in Redis.
     check_budget() enforces the monthly hard limit (Story 2-8 AC-17).
+
+    Monthly usage is cached in-process for _USAGE_CACHE_TTL_SECONDS; writes
+    through this instance refresh the cached value, and concurrent misses for
+    one tenant share a single Redis GET. Expired entries and idle per-tenant
+    locks are pruned, so the singleton holds state only for recently active
+    tenants.
     """
 
+    def __init__(self) -> None:
+        self._usage_cache: dict[str, tuple[int, float]] = {}  # tenant → (usage, expires_at)
+        self._usage_locks: dict[str, asyncio.Lock] = {}
+        self._next_prune = 0.0  # monotonic time of the next expired-entry sweep
+
+    def _cache_usage(self, tenant_id: str, usage: int) -> None:
+        now = time.monotonic()
+        self._usage_cache[tenant_id] = (usage, now + _USAGE_CACHE_TTL_SECONDS)
+        if now >= self._next_prune:
+            self._prune(now)
+
+    def _cached_usage(self, tenant_id: str) -> int | None:
+        entry = self._usage_cache.get(tenant_id)
+        if entry is None:
+            return None
+        if time.monotonic() < entry[1]:
+            return entry[0]
+        del self._usage_cache[tenant_id]
+        return None
+
+    def _prune(self, now: float) -> None:
+        """
+        Drop expired usage entries, then the locks of tenants with no live
+        entry that nobody holds. Runs at most once per cache TTL, so the sweep
+        is amortised over every write in that window.
+        """
+        self._next_prune = now + _USAGE_CACHE_TTL_SECONDS
+        for tenant_id in [t for t, (_, expires_at) in self._usage_cache.items() if expires_at <= now]:
+            del self._usage_cache[tenant_id]
+        for tenant_id in [
+            t for t, lock in self._usage_locks.items()
+            if t not in self._usage_cache and not lock.locked()
+        ]:
+            del self._usage_locks[tenant_id]
+
     async def consume_tokens(self, tenant_id: str, tokens: int) -> int:
         """
         Atomically increment the monthly token counter for `tenant_id` by `tokens`.
@@ -75,6 +146,7 @@ class TokenBudgetService:
             str(_MONTHLY_TTL_SECONDS),
         )
         new_total = int(result[0])
+        self._cache_usage(tenant_id, new_total)
 
         logger.debug(
             "Token budget updated",
@@ -86,9 +158,21 @@ class TokenBudgetService:
 
     async def get_monthly_usage(self, tenant_id: str) -> int:
         """Return current monthly token usage for `tenant_id`. Returns 0 if not set."""
-        redis = get_redis_client()
-        raw   = await redis.get(_monthly_key(tenant_id))
-        return int(raw) if raw else 0
+        usage = self._cached_usage(tenant_id)
+        if usage is not None:
+            return usage
+
+        lock = self._usage_locks.setdefault(tenant_id, asyncio.Lock())
+        async with lock:
+            # Another waiter may have refreshed the entry while we queued
+            usage = self._cached_usage(tenant_id)
+            if usage is not None:
+                return usage
+            redis = get_redis_client()
+            raw   = await redis.get(_monthly_key(tenant_id))
+            usage = int(raw) if raw else 0
+            self._cache_usage(tenant_id, usage)
+            return usage
 
     async def check_budget(self, tenant_id: str, monthly_limit: int) -> None:
         """
@@ -110,6 +194,44 @@ class TokenBudgetService:
                 pct=round(pct, 1),
             )
 
+    async def check_and_consume(
+        self, tenant_id: str, tokens: int, monthly_limit: int
+    ) -> int:
+        """
+        AC-17 fused path for callers that know the token cost before the call:
+        enforce the monthly limit and consume `tokens` atomically in one Redis
+        round-trip instead of check_budget() (GET) + consume_tokens() (EVAL).
+
+        Raises BudgetExceededError — without consuming — when usage is already at
+        the limit or `tokens` would take it over. Logs the same 80% warning as
+        check_budget(). Returns the new monthly total.
+        """
+        redis = get_redis_client()
+        result = await redis.eval(  # type: ignore[arg-type]
+            _CHECK_AND_CONSUME_SCRIPT,
+            1,
+            _monthly_key(tenant_id),
+            str(max(tokens, 0)),
+            str(monthly_limit),
+            str(_MONTHLY_TTL_SECONDS),
+        )
+        total, flag = int(result[0]), int(result[1])
+        self._cache_usage(tenant_id, total)
+
+        if flag < 0:
+            raise BudgetExceededError(tenant_id, total, monthly_limit)
+
+        pct = (total / monthly_limit * 100) if monthly_limit else 0
+        if pct >= 80:
+            logger.warning(
+                "token_budget: 80% threshold reached",
+                tenant_id=tenant_id,
+                usage=total,
+                limit=monthly_limit,
+                pct=round(pct, 1),
+            )
+        return total
+
 
 # Module-level singleton
 token_budget_service = TokenBudgetService()
@@ -31,7 +31,7 @@ import warnings
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 
 from src.config import get_settings
 from src.logger import logger
@@ -81,6 +81,12 @@ def _load_or_generate_rsa_keys() -> tuple[str, str]:
 
 _JWT_PRIVATE_KEY, _JWT_PUBLIC_KEY = _load_or_generate_rsa_keys()
 
+# Parsed key objects, built once. Given a PEM string, jose re-parses (and
+# cryptography re-validates) the RSA key on every encode/decode; passing a
+# constructed jwk.Key goes straight to the OpenSSL sign/verify call.
+_JWT_SIGNING_KEY = jwk.construct(_JWT_PRIVATE_KEY, "RS256")
+_JWT_VERIFY_KEY = jwk.construct(_JWT_PUBLIC_KEY, "RS256")
+
 
 def get_public_key_pem() -> str:
     """Return the RS256 public key PEM (used by JWKS endpoint)."""
@@ -152,7 +158,7 @@ class TokenService:
             "jti": str(uuid.uuid4()),
             "type": "access",
         }
-        return jwt.encode(payload, _JWT_PRIVATE_KEY, algorithm="RS256")
+        return jwt.encode(payload, _JWT_SIGNING_KEY, algorithm="RS256")
 
     def validate_access_token(self, token: str) -> dict:
         """
@@ -160,7 +166,7 @@ class TokenService:
         Returns the full claims payload.
         Raises jose.JWTError on invalid signature, expiry, or malformed token.
         """
-        return jwt.decode(token, _JWT_PUBLIC_KEY, algorithms=["RS256"])
+        return jwt.decode(token, _JWT_VERIFY_KEY, algorithms=["RS256"])
 
     # ------------------------------------------------------------------
     # Refresh tokens — opaque, Redis-backed (AC4, AC5)
@@ -14,11 +14,18 @@ import uuid
 from typing import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 
+# Minimum-cost Argon2 for backup codes (production: 32 MiB, t=2). Must be set
+# before src.config.get_settings() is first called, i.e. before any src import.
+os.environ.setdefault("BACKUP_CODE_ARGON2_MEMORY_COST", "1024")  # KiB
+os.environ.setdefault("BACKUP_CODE_ARGON2_TIME_COST", "1")
+
 import pytest
 import pytest_asyncio
 from faker import Faker
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from src.db import get_db
 from src.main import app
@@ -40,7 +47,25 @@ async def test_engine():
         "sqlite+aiosqlite:///:memory:",
     )
     # Use asyncpg for PostgreSQL, aiosqlite for SQLite
-    engine = create_async_engine(test_db_url, echo=False)
+    if test_db_url.startswith("sqlite"):
+        # One shared in-memory connection; no fsync and no journal file —
+        # durability is irrelevant for a throwaway test database.
+        engine = create_async_engine(
+            test_db_url,
+            echo=False,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.close()
+    else:
+        engine = create_async_engine(test_db_url, echo=False)
 
     # Create all tables
     async with engine.begin() as conn:
@@ -102,7 +127,7 @@ def _mock_redis():
 
     Design:
       - Never trips rate limits (incr always returns 1, ttl=60)
-      - Never trips lockout (exists always returns 0)
+      - Never trips lockout (exists always returns 0; mget finds no lockout/attempt keys)
       - Token operations (get, set, getdel) return safe defaults
       - Pipeline is sync-chainable with async execute()
     """
@@ -127,6 +152,7 @@ def _mock_redis():
     mock.getdel = AsyncMock(return_value=None)        # token not found (no rotation in unit tests)
     mock.delete = AsyncMock(return_value=1)
     mock.exists = AsyncMock(return_value=0)           # no lockout
+    mock.mget = AsyncMock(side_effect=lambda *keys: [None] * len(keys))  # login lockout/attempts unset
     mock.incr = AsyncMock(return_value=1)             # first attempt → no rate limit
     mock.expire = AsyncMock(return_value=True)
     mock.setex = AsyncMock(return_value=True)
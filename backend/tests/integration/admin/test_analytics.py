@@ -45,10 +45,9 @@ def _setup_auth_session(user_id, tenant_id, role="owner"):
     async def mock_execute(stmt, *args, **kwargs):
         result = MagicMock()
         s = str(stmt).lower()
-        if "tenants_users" in s and "is_active" in s:
-            # Analytics COUNT query
-            result.fetchone.return_value = (5,)
-            result.scalar.return_value = 5
+        if "tenants_users" in s and "projects" in s:
+            # Analytics combined COUNT query (active_users, active_projects)
+            result.fetchone.return_value = (5, 3)
         elif "tenants_users" in s:
             result.scalar_one_or_none.return_value = mock_membership
         elif "public.tenants" in s or "tenants" in s and "user" not in s:
@@ -70,7 +69,9 @@ def _setup_auth_session(user_id, tenant_id, role="owner"):
 def _make_mock_redis():
     mock = MagicMock()
     mock.get = AsyncMock(return_value=None)
+    mock.set = AsyncMock(return_value=True)
     mock.setex = AsyncMock(return_value=True)
+    mock.delete = AsyncMock(return_value=1)
     pipeline = MagicMock()
     pipeline.incr = MagicMock(return_value=pipeline)
     pipeline.ttl = MagicMock(return_value=pipeline)
@@ -171,7 +171,7 @@ class TestLogin:
 
         # Redis mock that simulates active lockout
         locked_redis = _mock_redis()
-        locked_redis.exists = AsyncMock(return_value=1)  # lockout active
+        locked_redis.mget = AsyncMock(return_value=["1", None])  # lockout active
 
         with patch("src.cache.get_redis_client", return_value=locked_redis):
             with patch("src.middleware.rate_limit.get_redis_client", return_value=locked_redis):
@@ -0,0 +1,184 @@
+"""
+Hand-written test doubles for AsyncSession and the Redis client.
+
+Plain classes with async methods: each call is a list append (and, for
+FakeRedis, a dict operation) with none of unittest.mock's attribute
+synthesis, so fixture setup and call recording stay in the microsecond range.
+
+Each class declares __slots__ (like spec_set on a mock): the attribute set is
+fixed, so a misspelled assignment such as `db.comits = 0` raises
+AttributeError instead of silently creating a new attribute.
+
+Assertions read the recorded state directly:
+
+    session.execute_count  — number of execute() calls
+    session.last_params    — params of the last execute()
+    session.calls          — full (statement, params) log, when order matters
+    session.commits        — number of commit() calls
+    session.rollbacks      — number of rollback() calls
+    session.flushes        — number of flush() calls
+    session.added          — objects passed to add(), in order
+    redis.data / .calls    — key/value state and (command, args) log
+"""
+
+from typing import Any, Optional
+
+
+class FakeResult:
+    """
+    Result of FakeAsyncSession.execute(): scalar() / scalar_one_or_none(),
+    fetchone() -> `row`, fetchall() -> `rows`. mappings() returns the result
+    itself — pass rows as dicts where the code under test reads row["col"].
+    """
+
+    __slots__ = ("_scalar", "_row", "_rows")
+
+    def __init__(
+        self,
+        scalar: Any = None,
+        row: Any = None,
+        rows: Optional[list] = None,
+    ) -> None:
+        self._scalar = scalar
+        self._row = row
+        self._rows = rows if rows is not None else []
+
+    def scalar(self) -> Any:
+        return self._scalar
+
+    def scalar_one_or_none(self) -> Any:
+        return self._scalar
+
+    def fetchone(self) -> Any:
+        return self._row
+
+    def fetchall(self) -> list:
+        return self._rows
+
+    def mappings(self) -> "FakeResult":
+        return self
+
+
+class FakeAsyncSession:
+    """
+    Records (statement, params) for every execute(); returns a fixed result
+    or raises `error`. add() / flush() are recorded for services that stage
+    ORM objects. Also usable as `async with AsyncSessionLocal() as db`.
+    """
+
+    __slots__ = (
+        "calls", "execute_count", "last_params", "commits", "rollbacks", "flushes",
+        "added", "_result", "_error",
+    )
+
+    def __init__(self, result: Optional[FakeResult] = None, error: Optional[Exception] = None) -> None:
+        self.calls: list[tuple[Any, Any]] = []
+        self.execute_count = 0
+        self.last_params: Any = None
+        self.commits = 0
+        self.rollbacks = 0
+        self.flushes = 0
+        self.added: list[Any] = []
+        self._result = result if result is not None else FakeResult()
+        self._error = error
+
+    async def execute(self, stmt: Any, params: Any = None) -> FakeResult:
+        self.calls.append((stmt, params))
+        self.execute_count += 1
+        self.last_params = params
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+    async def flush(self) -> None:
+        self.flushes += 1
+
+    def add(self, obj: Any) -> None:
+        self.added.append(obj)
+
+    async def __aenter__(self) -> "FakeAsyncSession":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> bool:
+        return False
+
+
+class FakeRedis:
+    """
+    Dict-backed subset of redis.asyncio used by the login rate limiter:
+    mget, set, delete, a pipeline with incr/expire, and client() as a
+    single-connection context manager (returns the same fake). Every command
+    raises `error` when given (simulates Redis being down).
+    """
+
+    __slots__ = ("data", "calls", "_error")
+
+    def __init__(self, data: Optional[dict] = None, error: Optional[Exception] = None) -> None:
+        self.data: dict[str, Any] = dict(data or {})
+        self.calls: list[tuple[str, tuple]] = []
+        self._error = error
+
+    def _record(self, command: str, *args: Any) -> None:
+        self.calls.append((command, args))
+        if self._error is not None:
+            raise self._error
+
+    async def mget(self, *keys: str) -> list[Any]:
+        self._record("mget", *keys)
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        self._record("set", key, value)
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        self._record("delete", *keys)
+        return sum(self.data.pop(k, None) is not None for k in keys)
+
+    def pipeline(self) -> "_FakePipeline":
+        return _FakePipeline(self)
+
+    def client(self) -> "FakeRedis":
+        return self
+
+    async def __aenter__(self) -> "FakeRedis":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> bool:
+        return False
+
+
+class _FakePipeline:
+    """Queues incr/expire and applies them to the parent FakeRedis on execute()."""
+
+    __slots__ = ("_redis", "_ops")
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, str]] = []
+
+    def incr(self, key: str) -> "_FakePipeline":
+        self._ops.append(("incr", key))
+        return self
+
+    def expire(self, key: str, seconds: int) -> "_FakePipeline":
+        self._ops.append(("expire", key))
+        return self
+
+    async def execute(self) -> list[Any]:
+        self._redis._record("pipeline", *self._ops)
+        results: list[Any] = []
+        for op, key in self._ops:
+            if op == "incr":
+                self._redis.data[key] = int(self._redis.data.get(key) or 0) + 1
+                results.append(self._redis.data[key])
+            else:
+                results.append(key in self._redis.data)
+        return results
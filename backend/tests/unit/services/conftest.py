@@ -0,0 +1,44 @@
+"""
+Shared fixtures for service unit tests.
+
+ProjectService (test_project_service*.py):
+  - svc            — one stateless ProjectService per module
+  - _patch_schema  — pins _get_schema to "tenant_test"; project modules opt in
+                     with pytest.mark.usefixtures("_patch_schema").
+  - mock_db        — one AsyncMock session per module, fully reset
+                     (return values and side effects too) after each test
+
+A module that defines its own `svc` fixture overrides this one.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.project_service import ProjectService
+
+
+@pytest.fixture(scope="module")
+def svc() -> ProjectService:
+    """ProjectService is stateless — one instance serves the whole module."""
+    return ProjectService()
+
+
+@pytest.fixture
+def _patch_schema(monkeypatch):
+    """Pin the tenant schema so no test depends on the current_tenant_slug ContextVar."""
+    monkeypatch.setattr(
+        "src.services.project_service._get_schema", lambda *a, **k: "tenant_test"
+    )
+
+
+@pytest.fixture(scope="module")
+def _shared_db() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_db(_shared_db: AsyncMock):
+    """Module-wide AsyncSession mock, reset (incl. return values/side effects) after each test."""
+    yield _shared_db
+    _shared_db.reset_mock(return_value=True, side_effect=True)
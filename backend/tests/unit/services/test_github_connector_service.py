@@ -213,9 +213,10 @@ class TestCloneRepoTask:
                 with patch("src.services.github_connector_service.asyncio.to_thread", new_callable=AsyncMock):
                     with patch.dict(sys.modules, {"git": mock_git}):
                         with patch(
-                            "src.services.github_connector_service.source_code_analyzer_service.analyze",
+                            "src.services.github_connector_service.source_code_analyzer_service.analyze_async",
+                            new_callable=AsyncMock,
                             return_value=dummy_summary,
-                        ):
+                        ) as mock_analyze:
                             await clone_repo_task(
                                 connection_id=connection_id,
                                 schema_name="tenant_test",
@@ -228,6 +229,8 @@ class TestCloneRepoTask:
         assert mock_db.commit.call_count == 3
         all_sql = " ".join(str(c.args[0]).lower() for c in mock_db.execute.call_args_list)
         assert "analyzed" in all_sql
+        # analysis is cached per repo + cloned commit, not per (fresh) clone_dir
+        assert mock_analyze.call_args.kwargs["cache_key"].startswith("owner/repo@")
 
     @pytest.mark.asyncio
     async def test_clone_repo_task_analysis_failure_marks_failed(self):
@@ -250,7 +253,8 @@ class TestCloneRepoTask:
                 with patch("src.services.github_connector_service.asyncio.to_thread", new_callable=AsyncMock):
                     with patch.dict(sys.modules, {"git": mock_git}):
                         with patch(
-                            "src.services.github_connector_service.source_code_analyzer_service.analyze",
+                            "src.services.github_connector_service.source_code_analyzer_service.analyze_async",
+                            new_callable=AsyncMock,
                             side_effect=RuntimeError("analysis exploded"),
                         ):
                             await clone_repo_task(
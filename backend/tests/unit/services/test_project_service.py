@@ -5,78 +5,89 @@ Task 6.1 — Unit tests: slug generation (basic, special chars, collision handli
             input validation (URL formats)
 AC: AC6 — generate_slug: lowercase, hyphens, collapse, strip, collision suffix
 AC: AC7 — URL validation via Pydantic schemas
-"""
-
-import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.services.project_service import ProjectService, _slugify_base
+PYTEST_DONT_REWRITE — plain equality asserts only; skip the assertion-rewrite
+import hook for this module.
+"""
 
+import uuid
 
-# ---------------------------------------------------------------------------
-# _slugify_base — AC6 slug algorithm
-# ---------------------------------------------------------------------------
+import pytest
+from unittest.mock import MagicMock
 
-class TestSlugifyBase:
-    """AC6: slug generation algorithm."""
+from pydantic import ValidationError
 
-    def test_basic_name(self):
-        assert _slugify_base("My Project") == "my-project"
+from src.api.v1.projects.schemas import CreateProjectRequest, UpdateProjectRequest
+from src.services.project_service import _slugify_base
 
-    def test_special_chars(self):
-        assert _slugify_base("Hello! World?") == "hello-world"
 
-    def test_consecutive_hyphens_collapsed(self):
-        assert _slugify_base("A  B   C") == "a-b-c"
+# Oversized inputs — built once at import, shared by the parametrized cases
+_TRUNC_INPUT = "a" * 100           # slug truncation (limit 90)
+_LONG_NAME_101 = "a" * 101         # name max_length=100
+_LONG_DESC_2001 = "x" * 2001       # description max_length=2000
+_ELEVEN_TAGS = [f"tag{i}" for i in range(11)]  # settings.tags max 10
+_LONG_TAG = "a" * 51               # tag max_length=50
 
-    def test_leading_trailing_stripped(self):
-        assert _slugify_base("  My Project  ") == "my-project"
+_PROJECT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 
-    def test_unicode_normalized(self):
-        result = _slugify_base("Café")
-        # Unicode normalize: Café → Cafe → cafe
-        assert result == "cafe"
+# svc / mock_db / _patch_schema come from tests/unit/services/conftest.py
+pytestmark = pytest.mark.usefixtures("_patch_schema")
 
-    def test_numbers_preserved(self):
-        assert _slugify_base("Project 2024") == "project-2024"
 
-    def test_empty_falls_back(self):
-        assert _slugify_base("!@#$%") == "project"
+# ---------------------------------------------------------------------------
+# _slugify_base — AC6 slug algorithm
+# ---------------------------------------------------------------------------
 
-    def test_truncates_at_90(self):
-        long_name = "a" * 100
-        result = _slugify_base(long_name)
-        assert len(result) <= 90
+class TestSlugifyBase:
+    """AC6: slug generation algorithm."""
 
-    def test_all_special_chars(self):
-        assert _slugify_base("!!!") == "project"
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("My Project", "my-project"),
+            ("Hello! World?", "hello-world"),
+            ("A  B   C", "a-b-c"),
+            ("  My Project  ", "my-project"),
+            # Unicode normalize: Café → Cafe → cafe
+            ("Café", "cafe"),
+            ("Project 2024", "project-2024"),
+            ("!@#$%", "project"),
+            ("!!!", "project"),
+            # Truncation: only the length bound is asserted
+            (_TRUNC_INPUT, None),
+        ],
+        ids=[
+            "basic", "special", "collapse", "strip", "unicode",
+            "numbers", "empty", "allspecial", "truncate",
+        ],
+    )
+    def test_slugify(self, raw, expected):
+        result = _slugify_base(raw)
+        if expected is None:
+            assert len(result) <= 90
+        else:
+            assert result == expected
 
 
 # ---------------------------------------------------------------------------
 # ProjectService.generate_slug — AC6 collision handling
 # ---------------------------------------------------------------------------
 
+@pytest.mark.asyncio(scope="class")
 class TestGenerateSlug:
     """AC6: collision suffix -1, -2, ..."""
 
-    @pytest.mark.asyncio
-    async def test_no_collision(self):
-        svc = ProjectService()
-        mock_db = AsyncMock()
+    async def test_no_collision(self, svc, mock_db):
         # fetchone returns None → no existing slug
         mock_result = MagicMock()
         mock_result.fetchone.return_value = None
         mock_db.execute.return_value = mock_result
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            slug = await svc.generate_slug("My Project", mock_db, "tenant_test")
+        slug = await svc.generate_slug("My Project", mock_db, "tenant_test")
 
         assert slug == "my-project"
 
-    @pytest.mark.asyncio
-    async def test_collision_adds_suffix(self):
-        svc = ProjectService()
-        mock_db = AsyncMock()
+    async def test_collision_adds_suffix(self, svc, mock_db):
 
         # First call returns row (collision), second returns None (available)
         mock_collision = MagicMock()
@@ -85,15 +96,11 @@ class TestGenerateSlug:
         mock_clear.fetchone.return_value = None
         mock_db.execute.side_effect = [mock_collision, mock_clear]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            slug = await svc.generate_slug("My Project", mock_db, "tenant_test")
+        slug = await svc.generate_slug("My Project", mock_db, "tenant_test")
 
         assert slug == "my-project-1"
 
-    @pytest.mark.asyncio
-    async def test_multiple_collisions(self):
-        svc = ProjectService()
-        mock_db = AsyncMock()
+    async def test_multiple_collisions(self, svc, mock_db):
 
         collision = MagicMock()
         collision.fetchone.return_value = ("conflict",)
@@ -102,25 +109,19 @@ class TestGenerateSlug:
         # 3 collisions then clear
         mock_db.execute.side_effect = [collision, collision, collision, clear]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            slug = await svc.generate_slug("My Project", mock_db, "tenant_test")
+        slug = await svc.generate_slug("My Project", mock_db, "tenant_test")
 
         assert slug == "my-project-3"
 
-    @pytest.mark.asyncio
-    async def test_exclude_id_skips_self(self):
+    async def test_exclude_id_skips_self(self, svc, mock_db):
         """When updating, existing record shouldn't conflict with itself."""
-        import uuid
-        svc = ProjectService()
-        mock_db = AsyncMock()
 
         mock_result = MagicMock()
         mock_result.fetchone.return_value = None
         mock_db.execute.return_value = mock_result
 
-        own_id = uuid.uuid4()
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            slug = await svc.generate_slug("My Project", mock_db, "tenant_test", exclude_id=own_id)
+        own_id = _PROJECT_ID
+        slug = await svc.generate_slug("My Project", mock_db, "tenant_test", exclude_id=own_id)
 
         assert slug == "my-project"
 
@@ -133,101 +134,62 @@ class TestProjectSchemas:
     """AC7: server-side validation of request schemas."""
 
     def test_name_too_short(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
         with pytest.raises(ValidationError) as exc_info:
             CreateProjectRequest(name="ab")
         assert "min_length" in str(exc_info.value) or "3" in str(exc_info.value)
 
-    def test_name_too_long(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
-        with pytest.raises(ValidationError):
-            CreateProjectRequest(name="a" * 101)
-
     def test_valid_app_url(self):
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
         req = CreateProjectRequest(name="Test Project", app_url="https://app.example.com")
         assert req.app_url == "https://app.example.com"
 
     def test_invalid_app_url_rejects_javascript(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
         with pytest.raises(ValidationError) as exc_info:
             CreateProjectRequest(name="Test", app_url="javascript:alert(1)")
         assert "scheme" in str(exc_info.value).lower() or "not allowed" in str(exc_info.value).lower()
 
-    def test_invalid_app_url_rejects_data_uri(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
-        with pytest.raises(ValidationError):
-            CreateProjectRequest(name="Test", app_url="data:text/html,<script>alert(1)</script>")
-
     def test_valid_github_url(self):
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
         req = CreateProjectRequest(
             name="Test Project",
             github_repo_url="https://github.com/owner/repo"
         )
         assert req.github_repo_url == "https://github.com/owner/repo"
 
-    def test_invalid_github_url_non_github(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"name": _LONG_NAME_101},
+            {"name": "Test", "app_url": "data:text/html,<script>alert(1)</script>"},
+            {"name": "Test", "github_repo_url": "https://gitlab.com/owner/repo"},
+            {"name": "Test", "github_repo_url": "https://github.com/owner"},
+            {"name": "Test Project", "description": _LONG_DESC_2001},
+        ],
+        ids=[
+            "name_too_long", "app_url_data_uri", "github_url_non_github",
+            "github_url_missing_repo", "description_too_long",
+        ],
+    )
+    def test_create_rejects(self, payload):
         with pytest.raises(ValidationError):
-            CreateProjectRequest(name="Test", github_repo_url="https://gitlab.com/owner/repo")
-
-    def test_invalid_github_url_missing_repo(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
+            CreateProjectRequest(**payload)
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {"default_environment": "invalid_env"},
+            {"tags": _ELEVEN_TAGS},
+            {"tags": [_LONG_TAG]},
+        ],
+        ids=["invalid_environment", "too_many_tags", "tag_too_long"],
+    )
+    def test_update_settings_rejects(self, settings):
         with pytest.raises(ValidationError):
-            CreateProjectRequest(name="Test", github_repo_url="https://github.com/owner")
-
-    def test_description_too_long(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
-        with pytest.raises(ValidationError):
-            CreateProjectRequest(name="Test Project", description="x" * 2001)
+            UpdateProjectRequest(settings=settings)
 
     def test_name_whitespace_stripped(self):
-        from src.api.v1.projects.schemas import CreateProjectRequest
-
         req = CreateProjectRequest(name="  My Project  ")
         assert req.name == "My Project"
 
-    def test_update_settings_invalid_environment(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import UpdateProjectRequest
-
-        with pytest.raises(ValidationError):
-            UpdateProjectRequest(settings={"default_environment": "invalid_env"})
-
-    def test_update_settings_too_many_tags(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import UpdateProjectRequest
-
-        with pytest.raises(ValidationError):
-            UpdateProjectRequest(settings={"tags": [f"tag{i}" for i in range(11)]})
-
-    def test_update_settings_tag_too_long(self):
-        from pydantic import ValidationError
-        from src.api.v1.projects.schemas import UpdateProjectRequest
-
-        with pytest.raises(ValidationError):
-            UpdateProjectRequest(settings={"tags": ["a" * 51]})
-
     def test_update_valid_settings(self):
-        from src.api.v1.projects.schemas import UpdateProjectRequest
-
         req = UpdateProjectRequest(
             settings={
                 "default_environment": "staging",
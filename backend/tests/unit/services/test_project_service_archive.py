@@ -6,28 +6,41 @@ AC: AC3 — archive_project: sets is_active=false, raises 400 if already archive
 AC: AC4 — restore_project: sets is_active=true, raises 400 if not archived
 AC: AC5 — delete_project: cascade, audit BEFORE deletion
 AC: AC7 — Error handling: ProjectAlreadyArchivedError, ProjectNotArchivedError
+
+PYTEST_DONT_REWRITE — plain equality asserts only; skip the assertion-rewrite
+import hook for this module.
 """
 
 import uuid
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch, call
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call
 
 import pytest
 
 from src.services.project_service import (
-    ProjectService,
     ProjectAlreadyArchivedError,
     ProjectNotArchivedError,
     ProjectNotFoundError,
 )
 
+# One event loop for the whole module instead of one per test (pytest-asyncio 0.23).
+pytestmark = [
+    pytest.mark.asyncio(scope="module"),
+    pytest.mark.usefixtures("_patch_schema"),  # tests/unit/services/conftest.py
+]
+
+# Fixed identifiers — deterministic and free of per-test RNG reads
+_PROJECT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000002")
+_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000003")
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 def _mock_project_row(project_id=None, name="Test Project", is_active=True, status="active"):
-    """Helper: mock row as returned by _get_project_raw."""
-    row = MagicMock()
-    pid = project_id or uuid.uuid4()
-    row.__getitem__ = lambda self, key: {
-        "id": pid,
+    """Helper: row mapping as returned by _get_project_raw (mappings().fetchone())."""
+    return {
+        "id": project_id or _PROJECT_ID,
         "name": name,
         "slug": "test-project",
         "description": None,
@@ -37,23 +50,27 @@ def _mock_project_row(project_id=None, name="Test Project", is_active=True, stat
         "settings": {},
         "is_active": is_active,
         "created_by": None,
-        "tenant_id": uuid.uuid4(),
+        "tenant_id": _TENANT_ID,
         "organization_id": None,
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc),
-    }[key]
-    return row
+        "created_at": _NOW,
+        "updated_at": _NOW,
+    }
+
+
+# Result stand-in for statements whose return value the service ignores
+# (cascade DELETEs, audit INSERT) — shared instead of a fresh MagicMock each.
+_NOOP_RESULT = SimpleNamespace(
+    fetchone=lambda: None,
+    mappings=lambda: SimpleNamespace(fetchone=lambda: None, fetchall=lambda: []),
+)
 
 
 class TestArchiveProject:
     """AC3, AC7 — archive_project."""
 
-    @pytest.mark.asyncio
-    async def test_archive_active_project_succeeds(self):
+    async def test_archive_active_project_succeeds(self, svc, mock_db):
         """AC3: archiving active project sets is_active=false, status='archived'."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
-        project_id = uuid.uuid4()
+        project_id = _PROJECT_ID
 
         # _get_project_raw returns active project
         raw_result = MagicMock()
@@ -66,18 +83,14 @@ class TestArchiveProject:
         updated_result.mappings.return_value.fetchone.return_value = updated_row
         mock_db.execute.side_effect = [raw_result, updated_result]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            project = await svc.archive_project(project_id=project_id, db=mock_db)
+        project = await svc.archive_project(project_id=project_id, db=mock_db)
 
         mock_db.commit.assert_awaited_once()
         assert project.is_active is False
 
-    @pytest.mark.asyncio
-    async def test_archive_already_archived_raises_error(self):
+    async def test_archive_already_archived_raises_error(self, svc, mock_db):
         """AC7: archiving already-archived project → ProjectAlreadyArchivedError."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
-        project_id = uuid.uuid4()
+        project_id = _PROJECT_ID
 
         raw_result = MagicMock()
         raw_result.mappings.return_value.fetchone.return_value = _mock_project_row(
@@ -85,37 +98,29 @@ class TestArchiveProject:
         )
         mock_db.execute.return_value = raw_result
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            with pytest.raises(ProjectAlreadyArchivedError) as exc_info:
-                await svc.archive_project(project_id=project_id, db=mock_db)
+        with pytest.raises(ProjectAlreadyArchivedError) as exc_info:
+            await svc.archive_project(project_id=project_id, db=mock_db)
 
         assert "already archived" in str(exc_info.value).lower()
 
-    @pytest.mark.asyncio
-    async def test_archive_not_found_raises_error(self):
+    async def test_archive_not_found_raises_error(self, svc, mock_db):
         """AC7: archiving non-existent project → ProjectNotFoundError."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
-        project_id = uuid.uuid4()
+        project_id = _PROJECT_ID
 
         raw_result = MagicMock()
         raw_result.mappings.return_value.fetchone.return_value = None
         mock_db.execute.return_value = raw_result
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            with pytest.raises(ProjectNotFoundError):
-                await svc.archive_project(project_id=project_id, db=mock_db)
+        with pytest.raises(ProjectNotFoundError):
+            await svc.archive_project(project_id=project_id, db=mock_db)
 
 
 class TestRestoreProject:
     """AC4, AC7 — restore_project."""
 
-    @pytest.mark.asyncio
-    async def test_restore_archived_project_succeeds(self):
+    async def test_restore_archived_project_succeeds(self, svc, mock_db):
         """AC4: restoring archived project sets is_active=true, status='active'."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
-        project_id = uuid.uuid4()
+        project_id = _PROJECT_ID
 
         raw_result = MagicMock()
         raw_result.mappings.return_value.fetchone.return_value = _mock_project_row(
@@ -126,18 +131,14 @@ class TestRestoreProject:
         updated_result.mappings.return_value.fetchone.return_value = updated_row
         mock_db.execute.side_effect = [raw_result, updated_result]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            project = await svc.restore_project(project_id=project_id, db=mock_db)
+        project = await svc.restore_project(project_id=project_id, db=mock_db)
 
         mock_db.commit.assert_awaited_once()
         assert project.is_active is True
 
-    @pytest.mark.asyncio
-    async def test_restore_active_project_raises_error(self):
+    async def test_restore_active_project_raises_error(self, svc, mock_db):
         """AC7: restoring active project → ProjectNotArchivedError."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
-        project_id = uuid.uuid4()
+        project_id = _PROJECT_ID
 
         raw_result = MagicMock()
         raw_result.mappings.return_value.fetchone.return_value = _mock_project_row(
@@ -145,9 +146,8 @@ class TestRestoreProject:
         )
         mock_db.execute.return_value = raw_result
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            with pytest.raises(ProjectNotArchivedError) as exc_info:
-                await svc.restore_project(project_id=project_id, db=mock_db)
+        with pytest.raises(ProjectNotArchivedError) as exc_info:
+            await svc.restore_project(project_id=project_id, db=mock_db)
 
         assert "not archived" in str(exc_info.value).lower()
 
@@ -155,12 +155,9 @@ class TestRestoreProject:
 class TestDeleteProject:
     """AC5, AC8, C3, C8 — delete_project."""
 
-    @pytest.mark.asyncio
-    async def test_delete_executes_cascade_in_order(self):
+    async def test_delete_executes_cascade_in_order(self, svc, mock_db):
         """AC5, C8: cascade delete — test_executions → test_cases → project_members → project."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
-        project_id = uuid.uuid4()
+        project_id = _PROJECT_ID
 
         # _get_project_raw succeeds
         raw_result = MagicMock()
@@ -175,42 +172,34 @@ class TestDeleteProject:
         # execute called: 1 (raw) + 1 (test_executions) + 1 (test_cases) + 1 (project_members) + 1 (project)
         mock_db.execute.side_effect = [
             raw_result,      # _get_project_raw
-            MagicMock(),     # DELETE test_executions
-            MagicMock(),     # DELETE test_cases
-            MagicMock(),     # DELETE project_members
+            _NOOP_RESULT,    # DELETE test_executions
+            _NOOP_RESULT,    # DELETE test_cases
+            _NOOP_RESULT,    # DELETE project_members
             delete_result,   # DELETE projects RETURNING id
         ]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            await svc.delete_project(project_id=project_id, db=mock_db)
+        await svc.delete_project(project_id=project_id, db=mock_db)
 
         mock_db.commit.assert_awaited_once()
         # Verify 5 execute calls (1 raw + 4 deletes)
         assert mock_db.execute.call_count == 5
 
-    @pytest.mark.asyncio
-    async def test_delete_not_found_raises_error(self):
+    async def test_delete_not_found_raises_error(self, svc, mock_db):
         """AC7: deleting non-existent project → ProjectNotFoundError."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
-        project_id = uuid.uuid4()
+        project_id = _PROJECT_ID
 
         # _get_project_raw returns None → not found
         raw_result = MagicMock()
         raw_result.mappings.return_value.fetchone.return_value = None
         mock_db.execute.return_value = raw_result
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            with pytest.raises(ProjectNotFoundError):
-                await svc.delete_project(project_id=project_id, db=mock_db)
+        with pytest.raises(ProjectNotFoundError):
+            await svc.delete_project(project_id=project_id, db=mock_db)
 
-    @pytest.mark.asyncio
-    async def test_delete_with_audit_info_writes_audit_before_deletion(self):
+    async def test_delete_with_audit_info_writes_audit_before_deletion(self, svc, mock_db):
         """AC8, C3: audit entry written before project deletion."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
-        project_id = uuid.uuid4()
-        actor_id = uuid.uuid4()
+        project_id = _PROJECT_ID
+        actor_id = _USER_ID
 
         raw_result = MagicMock()
         raw_result.mappings.return_value.fetchone.return_value = _mock_project_row(
@@ -226,20 +215,20 @@ class TestDeleteProject:
             execute_calls.append(sql)
             if "SELECT" in sql.upper():
                 return raw_result
-            if "RETURNING id" in sql.upper():
+            if "RETURNING ID" in sql.upper():
                 return delete_result
-            return MagicMock()
-
-        mock_db.execute = capture_execute
-
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            await svc.delete_project(
-                project_id=project_id,
-                db=mock_db,
-                audit_schema="tenant_test",
-                audit_actor_id=actor_id,
-                audit_actor_email="actor@test.com",
-            )
+            return _NOOP_RESULT
+
+        mock_db.execute.side_effect = capture_execute
+
+        await svc.delete_project(
+            project_id=project_id,
+            db=mock_db,
+            audit_schema="tenant_test",
+            audit_actor_id=actor_id,
+            audit_actor_email="actor@test.com",
+            audit_tenant_id=_TENANT_ID,
+        )
 
         # audit log INSERT should appear BEFORE the project DELETE
         audit_idx = next((i for i, sql in enumerate(execute_calls) if "audit_logs" in sql.lower()), None)
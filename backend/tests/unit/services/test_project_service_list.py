@@ -3,15 +3,30 @@ Unit tests — ProjectService.list_projects()
 Story: 1-11-project-management-archive-delete-list
 Task 6.1 — Unit tests: list filtering, search, sort, pagination logic
 AC: AC1, AC2 — status filter (active/archived/all), search, sort, pagination
+
+PYTEST_DONT_REWRITE — plain equality asserts only; skip the assertion-rewrite
+import hook for this module.
 """
 
 import uuid
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
-from src.services.project_service import ProjectService, PaginatedResult
+from src.services.project_service import PaginatedResult
+
+# One event loop for the whole module instead of one per test (pytest-asyncio 0.23).
+pytestmark = [
+    pytest.mark.asyncio(scope="module"),
+    pytest.mark.usefixtures("_patch_schema"),  # tests/unit/services/conftest.py
+]
+
+# Fixed identifiers — deterministic and free of per-test RNG reads
+_PROJECT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000002")
+_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000003")
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
 
 def _make_row(
@@ -23,10 +38,9 @@ def _make_row(
     is_active=True,
     member_count=0,
 ):
-    """Helper: mock DB row matching projects LEFT JOIN member_count."""
-    row = MagicMock()
-    row.__getitem__ = lambda self, key: {
-        "id": project_id or uuid.uuid4(),
+    """Helper: row mapping matching projects LEFT JOIN member_count."""
+    return {
+        "id": project_id or _PROJECT_ID,
         "name": name,
         "slug": slug,
         "description": description,
@@ -36,28 +50,23 @@ def _make_row(
         "settings": {},
         "is_active": is_active,
         "created_by": None,
-        "tenant_id": uuid.uuid4(),
+        "tenant_id": _TENANT_ID,
         "organization_id": None,
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc),
+        "created_at": _NOW,
+        "updated_at": _NOW,
         "member_count": member_count,
-    }[key]
-    row.keys.return_value = [
-        "id", "name", "slug", "description", "app_url", "github_repo_url",
-        "status", "settings", "is_active", "created_by", "tenant_id",
-        "organization_id", "created_at", "updated_at", "member_count",
-    ]
-    return row
+    }
+
+
+# list_projects only reads rows, so page-filling tests can repeat one mapping.
+_SHARED_ROW = _make_row()
 
 
 class TestListProjectsFiltering:
     """AC1, AC2 — status filtering."""
 
-    @pytest.mark.asyncio
-    async def test_active_filter_excludes_archived(self):
+    async def test_active_filter_excludes_archived(self, svc, mock_db):
         """AC2: default 'active' filter should query is_active=true."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
 
         # count query returns 1, data query returns one active project row
         count_result = MagicMock()
@@ -65,30 +74,32 @@ class TestListProjectsFiltering:
         row = _make_row(is_active=True, status="active")
         data_result = MagicMock()
         data_result.mappings.return_value.fetchall.return_value = [row]
-        mock_db.execute.side_effect = [count_result, data_result]
+        results = iter([count_result, data_result])
+        sqls: list[str] = []
+
+        async def capture_execute(stmt, params=None):
+            sqls.append(str(stmt))
+            return next(results)
+
+        mock_db.execute.side_effect = capture_execute
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            result = await svc.list_projects(
-                db=mock_db,
-                user_id=uuid.uuid4(),
-                user_role="owner",
-                tenant_id=uuid.uuid4(),
-                status="active",
-            )
+        result = await svc.list_projects(
+            db=mock_db,
+            user_id=_USER_ID,
+            user_role="owner",
+            tenant_id=_TENANT_ID,
+            status="active",
+        )
 
         assert isinstance(result, PaginatedResult)
         assert result.total == 1
         assert len(result.data) == 1
 
-        # Verify the WHERE clause includes is_active = true
-        first_call_sql = str(mock_db.execute.call_args_list[0])
-        assert "is_active" in first_call_sql or "active" in str(mock_db.execute.call_args_list[0])
+        # Verify the count query's WHERE clause includes is_active = true
+        assert "p.is_active = true" in sqls[0]
 
-    @pytest.mark.asyncio
-    async def test_all_filter_returns_both(self):
+    async def test_all_filter_returns_both(self, svc, mock_db):
         """AC2: status='all' — no is_active filter."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
 
         count_result = MagicMock()
         count_result.scalar_one.return_value = 2
@@ -98,23 +109,19 @@ class TestListProjectsFiltering:
         data_result.mappings.return_value.fetchall.return_value = [active_row, archived_row]
         mock_db.execute.side_effect = [count_result, data_result]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            result = await svc.list_projects(
-                db=mock_db,
-                user_id=uuid.uuid4(),
-                user_role="owner",
-                tenant_id=uuid.uuid4(),
-                status="all",
-            )
+        result = await svc.list_projects(
+            db=mock_db,
+            user_id=_USER_ID,
+            user_role="owner",
+            tenant_id=_TENANT_ID,
+            status="all",
+        )
 
         assert result.total == 2
         assert len(result.data) == 2
 
-    @pytest.mark.asyncio
-    async def test_archived_filter(self):
+    async def test_archived_filter(self, svc, mock_db):
         """AC2: status='archived' — only is_active=false."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
 
         count_result = MagicMock()
         count_result.scalar_one.return_value = 1
@@ -123,14 +130,13 @@ class TestListProjectsFiltering:
         data_result.mappings.return_value.fetchall.return_value = [row]
         mock_db.execute.side_effect = [count_result, data_result]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            result = await svc.list_projects(
-                db=mock_db,
-                user_id=uuid.uuid4(),
-                user_role="owner",
-                tenant_id=uuid.uuid4(),
-                status="archived",
-            )
+        result = await svc.list_projects(
+            db=mock_db,
+            user_id=_USER_ID,
+            user_role="owner",
+            tenant_id=_TENANT_ID,
+            status="archived",
+        )
 
         assert result.total == 1
         assert result.data[0].is_active is False
@@ -139,38 +145,31 @@ class TestListProjectsFiltering:
 class TestListProjectsPagination:
     """AC1 — pagination."""
 
-    @pytest.mark.asyncio
-    async def test_pagination_metadata(self):
+    async def test_pagination_metadata(self, svc, mock_db):
         """AC1: pagination total_pages computed correctly."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
 
         count_result = MagicMock()
         count_result.scalar_one.return_value = 45  # 45 total → 3 pages at 20/page
         data_result = MagicMock()
-        data_result.mappings.return_value.fetchall.return_value = [_make_row() for _ in range(20)]
+        data_result.mappings.return_value.fetchall.return_value = [_SHARED_ROW] * 20
         mock_db.execute.side_effect = [count_result, data_result]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            result = await svc.list_projects(
-                db=mock_db,
-                user_id=uuid.uuid4(),
-                user_role="owner",
-                tenant_id=uuid.uuid4(),
-                page=1,
-                per_page=20,
-            )
+        result = await svc.list_projects(
+            db=mock_db,
+            user_id=_USER_ID,
+            user_role="owner",
+            tenant_id=_TENANT_ID,
+            page=1,
+            per_page=20,
+        )
 
         assert result.total == 45
         assert result.total_pages == 3
         assert result.page == 1
         assert result.per_page == 20
 
-    @pytest.mark.asyncio
-    async def test_empty_result(self):
+    async def test_empty_result(self, svc, mock_db):
         """AC1: empty state when no projects."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
 
         count_result = MagicMock()
         count_result.scalar_one.return_value = 0
@@ -178,13 +177,12 @@ class TestListProjectsPagination:
         data_result.mappings.return_value.fetchall.return_value = []
         mock_db.execute.side_effect = [count_result, data_result]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            result = await svc.list_projects(
-                db=mock_db,
-                user_id=uuid.uuid4(),
-                user_role="owner",
-                tenant_id=uuid.uuid4(),
-            )
+        result = await svc.list_projects(
+            db=mock_db,
+            user_id=_USER_ID,
+            user_role="owner",
+            tenant_id=_TENANT_ID,
+        )
 
         assert result.total == 0
         assert result.data == []
@@ -194,11 +192,8 @@ class TestListProjectsPagination:
 class TestListProjectsMemberCount:
     """AC1 — member_count from JOIN."""
 
-    @pytest.mark.asyncio
-    async def test_member_count_populated(self):
+    async def test_member_count_populated(self, svc, mock_db):
         """AC1: member_count from LEFT JOIN project_members."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
 
         count_result = MagicMock()
         count_result.scalar_one.return_value = 1
@@ -207,13 +202,12 @@ class TestListProjectsMemberCount:
         data_result.mappings.return_value.fetchall.return_value = [row]
         mock_db.execute.side_effect = [count_result, data_result]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            result = await svc.list_projects(
-                db=mock_db,
-                user_id=uuid.uuid4(),
-                user_role="owner",
-                tenant_id=uuid.uuid4(),
-            )
+        result = await svc.list_projects(
+            db=mock_db,
+            user_id=_USER_ID,
+            user_role="owner",
+            tenant_id=_TENANT_ID,
+        )
 
         assert result.data[0].member_count == 5
 
@@ -221,11 +215,8 @@ class TestListProjectsMemberCount:
 class TestListProjectsHealthPlaceholder:
     """AC6 — health indicator placeholder."""
 
-    @pytest.mark.asyncio
-    async def test_health_is_dash_placeholder(self):
+    async def test_health_is_dash_placeholder(self, svc, mock_db):
         """AC6: health always '—' in Epic 1."""
-        svc = ProjectService()
-        mock_db = AsyncMock()
 
         count_result = MagicMock()
         count_result.scalar_one.return_value = 1
@@ -234,12 +225,11 @@ class TestListProjectsHealthPlaceholder:
         data_result.mappings.return_value.fetchall.return_value = [row]
         mock_db.execute.side_effect = [count_result, data_result]
 
-        with patch("src.services.project_service._get_schema", return_value="tenant_test"):
-            result = await svc.list_projects(
-                db=mock_db,
-                user_id=uuid.uuid4(),
-                user_role="owner",
-                tenant_id=uuid.uuid4(),
-            )
+        result = await svc.list_projects(
+            db=mock_db,
+            user_id=_USER_ID,
+            user_role="owner",
+            tenant_id=_TENANT_ID,
+        )
 
         assert result.data[0].health == "—"
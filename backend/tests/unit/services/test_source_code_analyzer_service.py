@@ -6,6 +6,7 @@ Tests use pytest tmp_path fixture (real temp directories — no filesystem mocks
 SourceCodeAnalyzerService is pure Python stdlib; no DB, Redis, or network calls.
 """
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -49,6 +50,21 @@ class TestDetectFramework:
         (tmp_path / "package.json").write_text(json.dumps(pkg))
         assert svc.detect_framework(str(tmp_path)) == "express"
 
+    def test_detect_express_with_bom_prefixed_package_json(self, svc, tmp_path):
+        # Proves: a UTF-8 BOM before package.json's JSON is tolerated.
+        pkg = {"dependencies": {"express": "^4.18.2"}}
+        (tmp_path / "package.json").write_bytes(b"\xef\xbb\xbf" + json.dumps(pkg).encode())
+        assert svc.detect_framework(str(tmp_path)) == "express"
+
+    @pytest.mark.parametrize("raw", [
+        b'{"dependencies": {"express": "\xff\xfe"}}',  # invalid UTF-8
+        b'{"dependencies": ',                         # truncated JSON
+    ], ids=["invalid-encoding", "malformed"])
+    def test_detect_unreadable_package_json_is_unknown(self, svc, tmp_path, raw):
+        # Proves: an undecodable or malformed package.json is skipped, not raised → 'unknown'.
+        (tmp_path / "package.json").write_bytes(raw)
+        assert svc.detect_framework(str(tmp_path)) == "unknown"
+
     def test_detect_spring_boot_framework(self, svc, tmp_path):
         # Proves: pom.xml containing 'spring-boot' artifact → detect_framework returns 'spring_boot'.
         (tmp_path / "pom.xml").write_text(
@@ -117,6 +133,48 @@ class TestExtractRoutes:
         methods = {r["method"] for r in routes}
         assert methods == {"PUT", "PATCH", "DELETE"}
 
+    def test_extract_fastapi_routes_ignores_commented_decorators(self, svc, tmp_path):
+        # Proves: AST extraction skips commented-out decorators and reads path= / multi-line decorator args.
+        (tmp_path / "api.py").write_text(
+            '# @app.get("/api/old")\n'
+            '@router.get(path="/api/new")\n'
+            'async def new(): pass\n'
+        )
+        (tmp_path / "multi.py").write_text(
+            '@router.post(\n'
+            '    "/api/items",\n'
+            ')\n'
+            'async def create(): pass\n'
+        )
+        routes = svc.extract_routes(str(tmp_path), "fastapi")
+        assert sorted(routes, key=lambda r: r["file"]) == [
+            {"method": "GET",  "path": "/api/new",   "file": "api.py"},
+            {"method": "POST", "path": "/api/items", "file": "multi.py"},
+        ]
+
+    def test_extract_fastapi_routes_regex_fallback_on_syntax_error(self, svc, tmp_path):
+        # Proves: a .py file that does not parse still yields its routes via the regex scan.
+        (tmp_path / "legacy.py").write_text(
+            '@app.get("/api/legacy")\n'
+            'def legacy(:\n'
+        )
+        routes = svc.extract_routes(str(tmp_path), "fastapi")
+        assert routes == [{"method": "GET", "path": "/api/legacy", "file": "legacy.py"}]
+
+    @pytest.mark.parametrize(
+        "expr", ["1+" * 200_000 + "1", "-" * 100_000 + "1"], ids=["recursion", "memory"],
+    )
+    def test_extract_fastapi_routes_regex_fallback_on_parser_exhaustion(self, svc, tmp_path, expr):
+        # Proves: pathologically nested code (RecursionError / MemoryError in ast.parse)
+        # falls back to the regex scan instead of failing the whole analysis.
+        (tmp_path / "generated.py").write_text(
+            '@app.get("/api/generated")\n'
+            'def generated():\n'
+            f'    return {expr}\n'
+        )
+        routes = svc.extract_routes(str(tmp_path), "fastapi")
+        assert routes == [{"method": "GET", "path": "/api/generated", "file": "generated.py"}]
+
     def test_extract_express_routes(self, svc, tmp_path):
         # Proves: *.js with router.get and router.post calls → route dicts extracted with correct method.
         js_file = tmp_path / "routes.js"
@@ -139,6 +197,20 @@ class TestExtractRoutes:
         assert routes[0]["method"] == "DELETE"
         assert routes[0]["path"] == "/api/users/:id"
 
+    def test_extract_routes_share_method_strings(self, svc, tmp_path):
+        # Proves: route dicts reuse one "GET" string object rather than allocating one per match.
+        (tmp_path / "a.js").write_text('router.get("/a")\nrouter.GET("/b")\n')
+        (tmp_path / "b.js").write_text('router.get("/c")\n')
+        methods = [r["method"] for r in svc.extract_routes(str(tmp_path), "express")]
+        assert methods == ["GET", "GET", "GET"]
+        assert all(m is methods[0] for m in methods)
+
+    def test_extract_routes_from_large_mmapped_file(self, svc, tmp_path):
+        # Proves: files above the mmap threshold (advised SEQUENTIAL/WILLNEED) are scanned end to end.
+        (tmp_path / "bundle.js").write_text("// filler\n" * 1000 + 'router.post("/api/tail")\n')
+        routes = svc.extract_routes(str(tmp_path), "express")
+        assert routes == [{"method": "POST", "path": "/api/tail", "file": "bundle.js"}]
+
     def test_extract_spring_boot_routes(self, svc, tmp_path):
         # Proves: *.java with @GetMapping and @PostMapping → route dicts with correct methods.
         java_file = tmp_path / "UserController.java"
@@ -154,6 +226,35 @@ class TestExtractRoutes:
         assert "GET" in methods
         assert "POST" in methods
 
+    def test_extract_routes_skips_pruned_directories(self, svc, tmp_path):
+        # Proves: node_modules and hidden dirs are not walked by default; prune_dirs=frozenset() walks node_modules.
+        route = 'router.get("/api/vendored")\n'
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib" / "index.js").write_text(route)
+        (tmp_path / ".cache").mkdir()
+        (tmp_path / ".cache" / "index.js").write_text(route)
+        (tmp_path / "app.js").write_text('router.get("/api/own")\n')
+
+        assert [r["path"] for r in svc.extract_routes(str(tmp_path), "express")] == ["/api/own"]
+
+        full = SourceCodeAnalyzerService(prune_dirs=frozenset())
+        paths = {r["path"] for r in full.extract_routes(str(tmp_path), "express")}
+        assert paths == {"/api/own", "/api/vendored"}
+
+    def test_extract_routes_prune_hidden_is_overridable(self, svc, tmp_path):
+        # Proves: hidden dirs are skipped by default; prune_hidden=False walks them
+        # while prune_dirs still applies inside them.
+        (tmp_path / ".config" / "node_modules").mkdir(parents=True)
+        (tmp_path / ".config" / "routes.js").write_text('router.get("/api/hidden")\n')
+        (tmp_path / ".config" / "node_modules" / "dep.js").write_text('router.get("/api/dep")\n')
+        (tmp_path / "app.js").write_text('router.get("/api/own")\n')
+
+        assert [r["path"] for r in svc.extract_routes(str(tmp_path), "express")] == ["/api/own"]
+
+        with_hidden = SourceCodeAnalyzerService(prune_hidden=False)
+        paths = {r["path"] for r in with_hidden.extract_routes(str(tmp_path), "express")}
+        assert paths == {"/api/own", "/api/hidden"}
+
     def test_extract_routes_unknown_returns_empty(self, svc, tmp_path):
         # Proves: framework='unknown' → extract_routes returns empty list (C4).
         (tmp_path / "main.py").write_text("print('hello')\n")
@@ -269,3 +370,31 @@ class TestAnalyze:
         )
         summary = svc.analyze(str(tmp_path))
         assert summary["endpoints"] == summary["routes"]
+
+    def test_analyze_reuses_result_for_same_cache_key(self, svc, tmp_path, monkeypatch):
+        # Proves: a second analyze() with the same cache_key is served from cache without re-extracting routes.
+        (tmp_path / "main.py").write_text(
+            "from fastapi import FastAPI\n"
+            '@app.get("/ping")\n'
+            "async def ping(): pass\n"
+        )
+        first = svc.analyze(str(tmp_path), cache_key="owner/repo@abc123")
+        monkeypatch.setattr(svc, "extract_routes", lambda *a: pytest.fail("cache miss"))
+        assert svc.analyze(str(tmp_path), cache_key="owner/repo@abc123") == first
+
+    def test_analyze_without_cache_key_rescans(self, svc, tmp_path):
+        # Proves: with no cache_key every analyze() scans the tree, so a new file's route is picked up.
+        (tmp_path / "main.py").write_text("from fastapi import FastAPI\n")
+        assert svc.analyze(str(tmp_path))["routes"] == []
+        (tmp_path / "api.py").write_text('@router.get("/items")\n')
+        routes = svc.analyze(str(tmp_path))["routes"]
+        assert [r["path"] for r in routes] == ["/items"]
+
+    def test_analyze_async_matches_analyze(self, svc, tmp_path):
+        # Proves: analyze_async() (worker-thread offload) returns the same summary as analyze().
+        (tmp_path / "main.py").write_text(
+            "from fastapi import FastAPI\n"
+            '@app.get("/ping")\n'
+            "async def ping(): pass\n"
+        )
+        assert asyncio.run(svc.analyze_async(str(tmp_path))) == svc.analyze(str(tmp_path))
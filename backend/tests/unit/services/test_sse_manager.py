@@ -7,7 +7,7 @@ import asyncio
 
 import pytest
 
-from src.services.sse_manager import SSEManager
+from src.services.sse_manager import RunEventQueue, SSEManager
 
 
 # ---------------------------------------------------------------------------
@@ -25,9 +25,9 @@ def manager() -> SSEManager:
 # ---------------------------------------------------------------------------
 
 def test_get_or_create_queue_creates_new_queue(manager: SSEManager) -> None:
-    # Proves: first call for an unknown run_id creates a new asyncio.Queue
+    # Proves: first call for an unknown run_id creates a new RunEventQueue
     q = manager.get_or_create_queue("run-1")
-    assert isinstance(q, asyncio.Queue)
+    assert isinstance(q, RunEventQueue)
 
 
 def test_get_or_create_queue_returns_same_queue(manager: SSEManager) -> None:
@@ -53,6 +53,28 @@ async def test_publish_puts_event_in_queue(manager: SSEManager) -> None:
     assert item == {"type": "running", "payload": {"step_id": "s1", "progress_pct": 0}}
 
 
+@pytest.mark.asyncio
+async def test_get_waits_for_later_publish(manager: SSEManager) -> None:
+    # Proves: a consumer blocked in get() is woken by a subsequent publish()
+    q = manager.get_or_create_queue("run-1")
+    waiter = asyncio.create_task(q.get())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    await manager.publish("run-1", "complete", {"all_done": True})
+    item = await asyncio.wait_for(waiter, timeout=1)
+    assert item == {"type": "complete", "payload": {"all_done": True}}
+
+
+def test_queue_drops_oldest_when_full() -> None:
+    # Proves: a full RunEventQueue keeps the newest events instead of blocking the publisher
+    q = RunEventQueue(maxsize=2)
+    for i in range(3):
+        q.put_nowait(i)
+    assert [q.get_nowait(), q.get_nowait()] == [1, 2]
+    with pytest.raises(asyncio.QueueEmpty):
+        q.get_nowait()
+
+
 @pytest.mark.asyncio
 async def test_publish_no_op_when_no_subscriber(manager: SSEManager) -> None:
     # Proves: publish() with no registered queue raises no exception (silent no-op)
@@ -3,6 +3,8 @@ Unit tests — TokenBudgetService
 Story: 2-2-vector-embeddings-generation, 2-8-agent-execution-engine
 Task 5.2 — 3 tests covering consume_tokens and get_monthly_usage.
 Story 2-8 — 4 tests covering check_budget() (AC-17).
+3 tests covering the fused check_and_consume() path.
+4 tests covering the in-process monthly usage cache.
 DoD A6: every test has a one-line comment stating the BEHAVIOUR proved.
 """
 
@@ -140,3 +142,115 @@ class TestTokenBudgetService:
         assert call_kwargs[1]["usage"] == 80_000
         assert call_kwargs[1]["limit"] == 100_000
         assert call_kwargs[1]["pct"] == 80.0
+
+    # ------------------------------------------------------------------
+    # check_and_consume() — fused check + consume (single EVAL)
+    # ------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_check_and_consume_returns_new_total(self):
+        # Proves: within budget, check_and_consume returns the new total with one EVAL and no GET.
+        mock_redis = MagicMock()
+        mock_redis.eval = AsyncMock(return_value=[5500, 0])
+        mock_redis.get  = AsyncMock()
+
+        with patch("src.services.token_budget_service.get_redis_client", return_value=mock_redis):
+            total = await self.svc.check_and_consume("tenant-abc", 500, 100_000)
+
+        assert total == 5500
+        mock_redis.eval.assert_called_once()
+        mock_redis.get.assert_not_called()
+        args = mock_redis.eval.call_args[0]
+        assert args[3:] == ("500", "100000", str(_MONTHLY_TTL_SECONDS))
+
+    @pytest.mark.asyncio
+    async def test_check_and_consume_rejected_raises(self):
+        # Proves: script rejection flag (-1) raises BudgetExceededError carrying the unchanged usage.
+        mock_redis = MagicMock()
+        mock_redis.eval = AsyncMock(return_value=[99_800, -1])
+
+        with patch("src.services.token_budget_service.get_redis_client", return_value=mock_redis):
+            with pytest.raises(BudgetExceededError) as exc_info:
+                await self.svc.check_and_consume("tenant-full", 500, 100_000)
+
+        assert exc_info.value.used == 99_800
+        assert exc_info.value.limit == 100_000
+
+    @pytest.mark.asyncio
+    async def test_check_and_consume_80_percent_logs_warning(self):
+        # Proves: a consume that lands at >= 80% of the limit logs the threshold warning.
+        mock_redis = MagicMock()
+        mock_redis.eval = AsyncMock(return_value=[85_000, 0])
+
+        with patch("src.services.token_budget_service.get_redis_client", return_value=mock_redis), \
+             patch("src.services.token_budget_service.logger") as mock_logger:
+            await self.svc.check_and_consume("tenant-warn", 5_000, 100_000)
+
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args[1]["pct"] == 85.0
+
+    # ------------------------------------------------------------------
+    # In-process monthly usage cache
+    # ------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_get_monthly_usage_cached_within_ttl(self):
+        # Proves: a second read inside the cache TTL is served locally without another Redis GET.
+        mock_redis = MagicMock()
+        mock_redis.get = AsyncMock(return_value=b"4200")
+
+        with patch("src.services.token_budget_service.get_redis_client", return_value=mock_redis):
+            first  = await self.svc.get_monthly_usage("tenant-abc")
+            second = await self.svc.get_monthly_usage("tenant-abc")
+
+        assert first == second == 4200
+        mock_redis.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_consume_tokens_refreshes_cached_usage(self):
+        # Proves: consume_tokens writes its new total into the cache, so the next read skips GET.
+        mock_redis = MagicMock()
+        mock_redis.eval = AsyncMock(return_value=[7000, _MONTHLY_TTL_SECONDS])
+        mock_redis.get  = AsyncMock()
+
+        with patch("src.services.token_budget_service.get_redis_client", return_value=mock_redis):
+            await self.svc.consume_tokens("tenant-abc", 700)
+            usage = await self.svc.get_monthly_usage("tenant-abc")
+
+        assert usage == 7000
+        mock_redis.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_usage_entry_is_refetched_and_pruned_on_read(self):
+        # Proves: an expired cache entry is removed when read and the next read goes back to Redis.
+        mock_redis = MagicMock()
+        mock_redis.get = AsyncMock(side_effect=[b"100", b"250"])
+        clock = [0.0]
+
+        with patch("src.services.token_budget_service.get_redis_client", return_value=mock_redis), \
+             patch("src.services.token_budget_service.time.monotonic", lambda: clock[0]):
+            first  = await self.svc.get_monthly_usage("tenant-abc")
+            clock[0] = 5.0  # past the 1 s cache TTL
+            second = await self.svc.get_monthly_usage("tenant-abc")
+
+        assert (first, second) == (100, 250)
+        assert mock_redis.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_tenants_are_pruned_from_cache_and_locks(self):
+        # Proves: tenants whose entries expired lose both cache entry and lock on the next sweep.
+        mock_redis = MagicMock()
+        mock_redis.get = AsyncMock(return_value=b"1")
+        clock = [0.0]
+
+        with patch("src.services.token_budget_service.get_redis_client", return_value=mock_redis), \
+             patch("src.services.token_budget_service.time.monotonic", lambda: clock[0]):
+            for i in range(50):
+                await self.svc.get_monthly_usage(f"tenant-{i}")
+            assert len(self.svc._usage_locks) == 50
+
+            clock[0] = 10.0  # every entry above is now expired
+            await self.svc.get_monthly_usage("tenant-active")
+
+        assert set(self.svc._usage_cache) == {"tenant-active"}
+        assert set(self.svc._usage_locks) == {"tenant-active"}
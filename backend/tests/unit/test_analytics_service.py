@@ -23,7 +23,7 @@ TENANT_ID = uuid.uuid4()
 
 
 def _make_db_session(user_count: int = 3, project_count: int = 5):
-    """Mock db session that returns canned COUNT results."""
+    """Mock db session that returns canned COUNT results for the combined metrics query."""
     session = AsyncMock()
 
     call_count = [0]
@@ -32,15 +32,10 @@ def _make_db_session(user_count: int = 3, project_count: int = 5):
         call_count[0] += 1
         result = MagicMock()
         s = str(stmt).lower()
-        if "tenants_users" in s:
-            result.fetchone.return_value = (user_count,)
-            result.scalar.return_value = user_count
-        elif "projects" in s:
-            result.fetchone.return_value = (project_count,)
-            result.scalar.return_value = project_count
+        if "tenants_users" in s and "projects" in s:
+            result.fetchone.return_value = (user_count, project_count)
         else:
-            result.fetchone.return_value = (0,)
-            result.scalar.return_value = 0
+            result.fetchone.return_value = (0, 0)
         return result
 
     session.execute = mock_execute
@@ -51,8 +46,9 @@ def _make_redis_no_cache():
     """Redis mock that returns no cached value."""
     mock = MagicMock()
     mock.get = AsyncMock(return_value=None)
+    mock.set = AsyncMock(return_value=True)   # regeneration lock acquired
     mock.setex = AsyncMock(return_value=True)
-    mock.delete = AsyncMock(return_value=1)
+    mock.eval = AsyncMock(return_value=1)     # compare-and-delete lock release
     return mock
 
 
@@ -87,6 +83,21 @@ async def test_get_dashboard_metrics_returns_correct_counts():
     assert metrics["storage_consumed"] == "—" # placeholder
 
 
+@pytest.mark.asyncio
+async def test_get_dashboard_metrics_single_db_round_trip():
+    """Both COUNTs are fetched with one execute() call."""
+    db = AsyncMock()
+    result = MagicMock()
+    result.fetchone.return_value = (7, 3)
+    db.execute = AsyncMock(return_value=result)
+    svc = AnalyticsService()
+
+    with patch("src.services.analytics_service.get_redis_client", return_value=_make_redis_no_cache()):
+        await svc.get_dashboard_metrics(schema_name=SCHEMA, tenant_id=TENANT_ID, db=db)
+
+    db.execute.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_get_dashboard_metrics_uses_redis_cache():
     """Second call returns cached data without hitting DB."""
@@ -126,6 +137,68 @@ async def test_get_dashboard_metrics_caches_result():
     redis_mock.setex.assert_called_once()
     call_args = redis_mock.setex.call_args
     assert call_args.args[1] == 300  # 5 minutes = 300 seconds
+    payload = call_args.args[2]
+    assert ", " not in payload and ": " not in payload  # compact separators
+    assert json.loads(payload)["active_users"] == 5
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_metrics_cache_miss_takes_and_releases_lock():
+    """Cache miss takes the SET NX lock with a random token and releases only that token."""
+    db = _make_db_session()
+    svc = AnalyticsService()
+    redis_mock = _make_redis_no_cache()
+
+    with patch("src.services.analytics_service.get_redis_client", return_value=redis_mock):
+        await svc.get_dashboard_metrics(schema_name=SCHEMA, tenant_id=TENANT_ID, db=db)
+        await svc.get_dashboard_metrics(schema_name=SCHEMA, tenant_id=TENANT_ID, db=db)
+
+    lock_key = f"analytics:dashboard:{TENANT_ID}:lock"
+    first, second = redis_mock.set.await_args_list
+    assert first.args[0] == lock_key and first.kwargs == {"nx": True, "ex": 5}
+    assert first.args[1] != second.args[1]  # fresh token per regeneration
+
+    script, numkeys, key, token = redis_mock.eval.await_args_list[0].args
+    assert "GET" in script and "DEL" in script  # compare-and-delete, not a blind DEL
+    assert (numkeys, key, token) == (1, lock_key, first.args[1])
+    redis_mock.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_metrics_lock_error_skips_release():
+    """If SET NX itself fails the request fails open and never touches the lock key."""
+    db = _make_db_session(user_count=2, project_count=1)
+    svc = AnalyticsService()
+    redis_mock = _make_redis_no_cache()
+    redis_mock.set = AsyncMock(side_effect=Exception("Redis unavailable"))
+
+    with patch("src.services.analytics_service.get_redis_client", return_value=redis_mock):
+        metrics = await svc.get_dashboard_metrics(schema_name=SCHEMA, tenant_id=TENANT_ID, db=db)
+
+    assert metrics["active_users"] == 2
+    redis_mock.setex.assert_awaited_once()
+    redis_mock.eval.assert_not_called()
+    redis_mock.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_metrics_waits_for_lock_holder():
+    """When another worker holds the lock, the cached result is awaited instead of querying DB."""
+    cached = {"active_users": 4, "active_projects": 2, "test_runs": 0, "storage_consumed": "—"}
+    db = AsyncMock()
+    db.execute = AsyncMock()
+    svc = AnalyticsService()
+    redis_mock = _make_redis_no_cache()
+    redis_mock.set = AsyncMock(return_value=None)  # lock already held
+    redis_mock.get = AsyncMock(side_effect=[None, None, json.dumps(cached)])
+
+    with patch("src.services.analytics_service.get_redis_client", return_value=redis_mock), \
+         patch("src.services.analytics_service._REGEN_WAIT_INTERVAL", 0):
+        metrics = await svc.get_dashboard_metrics(schema_name=SCHEMA, tenant_id=TENANT_ID, db=db)
+
+    assert metrics == cached
+    db.execute.assert_not_called()
+    redis_mock.setex.assert_not_called()
 
 
 @pytest.mark.asyncio
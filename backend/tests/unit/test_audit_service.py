@@ -2,42 +2,48 @@
 Unit tests — AuditService
 Story: 1-12-usage-analytics-audit-logs-basic
 Task 7.1 — AuditService.log_action() inserts correct record, graceful failure
+log_action_async() buffering + batched flush
 AC: #3 — Non-blocking, convenience methods, action naming convention
 """
 
 import json
 import uuid
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, call, patch
 
 import pytest
 
-from src.services.audit_service import AuditService, audit_service
+from src.services.audit_service import _ACTION_RE, AuditService, audit_service
+from tests.unit._fakes import FakeAsyncSession
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-def _make_db_session():
-    """Mock AsyncSession with execute and commit stubs."""
-    session = AsyncMock()
-    session.execute = AsyncMock(return_value=MagicMock())
-    session.commit = AsyncMock()
-    return session
+def _make_db_session(error: Exception | None = None) -> FakeAsyncSession:
+    """Fake AsyncSession recording execute() calls and commit count."""
+    return FakeAsyncSession(error=error)
 
 
 SCHEMA = "tenant_test"
 TENANT_ID = uuid.uuid4()
 ACTOR_ID = uuid.uuid4()
 RESOURCE_ID = uuid.uuid4()
+TENANT_ID_STR = str(TENANT_ID)
+ACTOR_ID_STR = str(ACTOR_ID)
+RESOURCE_ID_STR = str(RESOURCE_ID)
+
+# Async tests below share one module-scoped event loop (pytest-asyncio 0.23);
+# marked per test because this module also has plain sync tests.
 
 
 # ---------------------------------------------------------------------------
 # Test log_action() — synchronous in-transaction insert
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_log_action_executes_insert():
     """log_action() should call db.execute with correct params."""
     db = _make_db_session()
@@ -56,22 +62,20 @@ async def test_log_action_executes_insert():
         user_agent="pytest/test",
     )
 
-    db.execute.assert_called_once()
-    call_args = db.execute.call_args
-    # The first positional arg is the text() statement; second is params dict
-    params = call_args.args[1]
+    assert db.execute_count == 1
+    params = db.last_params
 
-    assert params["tenant_id"] == str(TENANT_ID)
-    assert params["actor_user_id"] == str(ACTOR_ID)
+    assert params["tenant_id"] == TENANT_ID_STR
+    assert params["actor_user_id"] == ACTOR_ID_STR
     assert params["action"] == "project.deleted"
     assert params["resource_type"] == "project"
-    assert params["resource_id"] == str(RESOURCE_ID)
+    assert params["resource_id"] == RESOURCE_ID_STR
     assert json.loads(params["details"]) == {"project_name": "Alpha"}
     assert params["ip_address"] == "1.2.3.4"
     assert params["user_agent"] == "pytest/test"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_log_action_none_resource_id():
     """resource_id=None should store None, not 'None'."""
     db = _make_db_session()
@@ -86,15 +90,35 @@ async def test_log_action_none_resource_id():
         resource_type="session",
     )
 
-    params = db.execute.call_args.args[1]
+    params = db.last_params
     assert params["resource_id"] is None
+    assert params["details"] == "{}"
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_log_action_reuses_insert_statement_per_schema():
+    """The INSERT text() clause is built once per schema and reused."""
+    db = _make_db_session()
+    svc = AuditService()
+
+    for action in ("user.login", "user.removed"):
+        await svc.log_action(
+            db=db,
+            schema_name=SCHEMA,
+            tenant_id=TENANT_ID,
+            actor_user_id=ACTOR_ID,
+            action=action,
+            resource_type="user",
+        )
+
+    assert db.calls[0][0] is db.calls[1][0]
+    assert f'"{SCHEMA}".audit_logs' in str(db.calls[0][0])
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_log_action_graceful_on_db_error():
     """DB errors must not propagate — audit failures are non-fatal."""
-    db = _make_db_session()
-    db.execute = AsyncMock(side_effect=Exception("DB error"))
+    db = _make_db_session(error=Exception("DB error"))
     svc = AuditService()
 
     # Should not raise
@@ -112,7 +136,7 @@ async def test_log_action_graceful_on_db_error():
 # Test log_action_async() — non-blocking (opens own session)
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_log_action_async_graceful_on_error():
     """log_action_async() catches exceptions and never raises."""
     svc = AuditService()
@@ -130,7 +154,7 @@ async def test_log_action_async_graceful_on_error():
         mock_ctx.__aenter__.side_effect = Exception("db unavailable")
         MockSession.return_value = mock_ctx
 
-        # Should not raise
+        # Should not raise — neither buffering nor the batch flush
         await svc.log_action_async(
             schema_name=SCHEMA,
             tenant_id=TENANT_ID,
@@ -138,13 +162,224 @@ async def test_log_action_async_graceful_on_error():
             action="user.login",
             resource_type="session",
         )
+        await svc.flush()
+
+
+def _patch_session(db: FakeAsyncSession):
+    """Patch src.db.AsyncSessionLocal to yield the given fake session."""
+    return patch("src.db.AsyncSessionLocal", return_value=db)
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_log_action_async_batches_rows_per_schema():
+    """Buffered rows are written with one executemany per schema and a single commit."""
+    db = _make_db_session()
+    svc = AuditService()
+
+    with _patch_session(db):
+        for action in ("user.login", "project.created"):
+            await svc.log_action_async(
+                schema_name=SCHEMA, tenant_id=TENANT_ID, actor_user_id=ACTOR_ID,
+                action=action, resource_type="session",
+            )
+        await svc.log_action_async(
+            schema_name="tenant_other", tenant_id=TENANT_ID, actor_user_id=ACTOR_ID,
+            action="user.login", resource_type="session",
+        )
+        assert db.execute_count == 0  # buffered, not yet written
+        await svc.flush()
+
+    assert db.execute_count == 2
+    rows_by_schema = {str(stmt).split('"')[1]: rows for stmt, rows in db.calls}
+    assert [r["action"] for r in rows_by_schema[SCHEMA]] == ["user.login", "project.created"]
+    assert len(rows_by_schema["tenant_other"]) == 1
+    assert db.commits == 2  # one per schema
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_log_action_async_flushes_when_batch_full():
+    """Reaching _AUDIT_BATCH_MAX buffered rows writes the batch immediately."""
+    db = _make_db_session()
+    svc = AuditService()
+
+    with _patch_session(db), patch("src.services.audit_service._AUDIT_BATCH_MAX", 3):
+        for _ in range(3):
+            await svc.log_action_async(
+                schema_name=SCHEMA, tenant_id=TENANT_ID, actor_user_id=ACTOR_ID,
+                action="user.login", resource_type="session",
+            )
+
+    assert db.execute_count == 1
+    assert len(db.last_params) == 3
+
+
+class _FailingSession(FakeAsyncSession):
+    """FakeAsyncSession whose execute() raises for one schema, or for rows with a given action."""
+
+    __slots__ = ("committed", "_uncommitted", "_bad_schema", "_bad_action")
+
+    def __init__(self, bad_schema: str | None = None, bad_action: str | None = None) -> None:
+        super().__init__()
+        self.committed: list[dict] = []
+        self._uncommitted: list[dict] = []
+        self._bad_schema = bad_schema
+        self._bad_action = bad_action
+
+    async def execute(self, stmt, params=None):
+        result = await super().execute(stmt, params)
+        rows = params if isinstance(params, list) else [params]
+        if f'"{self._bad_schema}"' in str(stmt) or any(r["action"] == self._bad_action for r in rows):
+            raise Exception("insert failed")
+        self._uncommitted += rows
+        return result
+
+    async def commit(self) -> None:
+        await super().commit()
+        self.committed += self._uncommitted
+        self._uncommitted = []
+
+    async def rollback(self) -> None:
+        await super().rollback()
+        self._uncommitted = []
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_flush_failing_schema_does_not_drop_other_tenants():
+    """A dropped/broken schema loses only its own rows; other schemas still commit."""
+    db = _FailingSession(bad_schema="tenant_gone")
+    svc = AuditService()
+
+    with _patch_session(db):
+        for schema in ("tenant_gone", SCHEMA, "tenant_other"):
+            await svc.log_action_async(
+                schema_name=schema, tenant_id=TENANT_ID, actor_user_id=ACTOR_ID,
+                action="user.login", resource_type="session",
+            )
+        await svc.flush()
+
+    assert len(db.committed) == 2
+    assert db.rollbacks == 2  # the batch, then its single-row retry
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_flush_retries_failed_batch_row_by_row():
+    """One bad row fails its schema's batch; the retry keeps every other row."""
+    db = _FailingSession(bad_action="user.removed")
+    svc = AuditService()
+
+    with _patch_session(db):
+        for action in ("user.login", "user.removed", "project.created"):
+            await svc.log_action_async(
+                schema_name=SCHEMA, tenant_id=TENANT_ID, actor_user_id=ACTOR_ID,
+                action=action, resource_type="session",
+            )
+        await svc.flush()
+
+    assert [r["action"] for r in db.committed] == ["user.login", "project.created"]
+
+
+class _CopySession(FakeAsyncSession):
+    """
+    FakeAsyncSession whose raw driver connection supports asyncpg-style COPY.
+
+    Models the asyncpg adapter's lazy BEGIN: a transaction opens on the first
+    execute()/exec_driver_sql(). COPY inside it is kept until commit() (and
+    discarded by rollback()); COPY outside it autocommits straight into
+    `copies`. `fail_commits` makes the first N commit() calls raise.
+    """
+
+    def __init__(self, fail_commits: int = 0) -> None:
+        super().__init__()
+        self.copies: list[tuple[str, dict]] = []
+        self.in_transaction = False
+        self._uncommitted_copies: list[tuple[str, dict]] = []
+        self._fail_commits = fail_commits
+
+    async def execute(self, stmt, params=None):
+        self.in_transaction = True
+        return await super().execute(stmt, params)
+
+    async def exec_driver_sql(self, sql: str) -> None:
+        self.in_transaction = True
+
+    async def connection(self):
+        return self
+
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=self)
+
+    async def copy_records_to_table(self, table: str, **kwargs) -> None:
+        target = self._uncommitted_copies if self.in_transaction else self.copies
+        target.append((table, kwargs))
+
+    async def commit(self) -> None:
+        await super().commit()
+        if self._fail_commits:
+            self._fail_commits -= 1
+            raise Exception("commit failed")
+        self.copies += self._uncommitted_copies
+        self._uncommitted_copies = []
+        self.in_transaction = False
+
+    async def rollback(self) -> None:
+        await super().rollback()
+        self._uncommitted_copies = []
+        self.in_transaction = False
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_flush_uses_copy_for_large_groups():
+    """Schema groups at the COPY threshold are written with copy_records_to_table, not INSERT."""
+    db = _CopySession()
+    svc = AuditService()
+
+    with _patch_session(db), patch("src.services.audit_service._AUDIT_COPY_MIN_ROWS", 2):
+        for action in ("user.login", "user.removed"):
+            await svc.log_action_async(
+                schema_name=SCHEMA, tenant_id=TENANT_ID, actor_user_id=ACTOR_ID,
+                action=action, resource_type="user",
+            )
+        await svc.log_action_async(
+            schema_name="tenant_other", tenant_id=TENANT_ID, actor_user_id=ACTOR_ID,
+            action="user.login", resource_type="user",
+        )
+        await svc.flush()
+
+    assert len(db.copies) == 1
+    table, kwargs = db.copies[0]
+    assert table == "audit_logs" and kwargs["schema_name"] == SCHEMA
+    assert [r[kwargs["columns"].index("action")] for r in kwargs["records"]] == ["user.login", "user.removed"]
+    # Below-threshold group still goes through the INSERT path
+    assert db.execute_count == 1 and '"tenant_other"' in str(db.calls[0][0])
+    assert db.commits == 2
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_flush_copy_rolls_back_with_its_transaction():
+    """COPY as the first statement still runs in the transaction: a failed commit undoes it."""
+    db = _CopySession(fail_commits=1)
+    svc = AuditService()
+
+    with _patch_session(db), patch("src.services.audit_service._AUDIT_COPY_MIN_ROWS", 2):
+        for action in ("user.login", "user.removed"):
+            await svc.log_action_async(
+                schema_name=SCHEMA, tenant_id=TENANT_ID, actor_user_id=ACTOR_ID,
+                action=action, resource_type="user",
+            )
+        await svc.flush()
+
+    # The COPY was rolled back (not autocommitted); the row-by-row INSERT
+    # retry is the only write that landed — no duplicates.
+    assert db.copies == []
+    assert db.rollbacks == 1
+    assert [params["action"] for _, params in db.calls] == ["user.login", "user.removed"]
 
 
 # ---------------------------------------------------------------------------
 # Test convenience methods
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_log_project_action_sets_resource_type():
     """log_project_action() pre-fills resource_type='project'."""
     db = _make_db_session()
@@ -159,12 +394,12 @@ async def test_log_project_action_sets_resource_type():
         resource_id=RESOURCE_ID,
     )
 
-    params = db.execute.call_args.args[1]
+    params = db.last_params
     assert params["resource_type"] == "project"
     assert params["action"] == "project.archived"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_log_user_action_sets_resource_type():
     """log_user_action() pre-fills resource_type='user'."""
     db = _make_db_session()
@@ -180,12 +415,12 @@ async def test_log_user_action_sets_resource_type():
         details={"old_role": "member", "new_role": "admin"},
     )
 
-    params = db.execute.call_args.args[1]
+    params = db.last_params
     assert params["resource_type"] == "user"
     assert params["action"] == "user.role_changed"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_log_org_action_sets_resource_type():
     """log_org_action() pre-fills resource_type='organization'."""
     db = _make_db_session()
@@ -199,7 +434,7 @@ async def test_log_org_action_sets_resource_type():
         action="org.settings_updated",
     )
 
-    params = db.execute.call_args.args[1]
+    params = db.last_params
     assert params["resource_type"] == "organization"
 
 
@@ -231,15 +466,14 @@ async def test_log_org_action_sets_resource_type():
     "member.removed",
 ])
 def test_action_naming_convention(action: str):
-    """All catalog actions must follow {resource_type}.{verb} format."""
-    assert "." in action, f"Action '{action}' missing dot separator"
-    parts = action.split(".")
-    assert len(parts) == 2, f"Action '{action}' has more than one dot"
-    resource_type, verb = parts
-    assert resource_type, "resource_type must not be empty"
-    assert verb, "verb must not be empty"
-    assert resource_type == resource_type.lower(), "resource_type must be lowercase"
-    assert verb == verb.lower(), "verb must be lowercase"
+    """All catalog actions must follow lowercase {resource_type}.{verb} format."""
+    assert _ACTION_RE.fullmatch(action), f"Action '{action}' is not lowercase resource_type.verb"
+
+
+@pytest.mark.parametrize("action", ["project", "Project.created", "org.settings.updated", ".created"])
+def test_action_regex_rejects_malformed(action: str):
+    """The shared _ACTION_RE rejects missing/extra dots, uppercase and empty parts."""
+    assert _ACTION_RE.fullmatch(action) is None
 
 
 # ---------------------------------------------------------------------------
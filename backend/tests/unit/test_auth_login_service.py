@@ -3,10 +3,14 @@ Unit tests — login_with_password (AuthService Story 1.5)
 ACs: AC1 (credential verification), AC7 (account lockout), AC8 (rate limiting)
 """
 
+import asyncio
+import functools
+import threading
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+from prometheus_client import REGISTRY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.services.auth.auth_service import (
@@ -18,12 +22,26 @@ from src.services.auth.auth_service import (
     login_with_password,
 )
 from src.models.user import User
+from tests.unit._fakes import FakeAsyncSession, FakeRedis, FakeResult
+
+# One event loop for the whole module instead of one per test (pytest-asyncio 0.23).
+pytestmark = pytest.mark.asyncio(scope="module")
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _hashed(password: str) -> str:
+    """Real Argon2id hash, computed once per plaintext for the whole module.
+
+    Each hash_password() call costs 64 MiB x 3 passes; the login tests only
+    need a hash that verify_password() accepts, not a fresh salt per test.
+    """
+    return hash_password(password)
+
+
 def _make_user(
     email_verified: bool = True,
     password: str = "SecurePass123!",
@@ -33,44 +51,57 @@ def _make_user(
         id=uuid.uuid4(),
         email="login@example.com",
         full_name="Login User",
-        password_hash=hash_password(password) if password else None,
+        password_hash=_hashed(password) if password else None,
         email_verified=email_verified,
         auth_provider=auth_provider,
     )
     return user
 
 
+class _SlowRedis(FakeRedis):
+    """FakeRedis whose MGET stalls far beyond the rate-limit check budget."""
+
+    async def mget(self, *keys: str) -> list:
+        await asyncio.sleep(1)
+        return await super().mget(*keys)
+
+
+class _LaggyRedis(FakeRedis):
+    """FakeRedis whose MGET is slow (loop under load) but still inside the check budget."""
+
+    async def mget(self, *keys: str) -> list:
+        await asyncio.sleep(0.05)
+        return await super().mget(*keys)
+
+
+class _BusyPoolRedis(FakeRedis):
+    """FakeRedis whose client() waits longer than the check budget for a pooled connection."""
+
+    async def __aenter__(self) -> "FakeRedis":
+        await asyncio.sleep(0.5)
+        return self
+
+
+def _fail_open_count(reason: str) -> float:
+    return REGISTRY.get_sample_value("auth_rate_limit_fail_open_total", {"reason": reason}) or 0.0
+
+
 def _make_db(user: User | None) -> AsyncSession:
-    """Mock DB that returns the given user on query execution."""
-    mock_db = MagicMock()
-    result_mock = MagicMock()
-    result_mock.scalar_one_or_none.return_value = user
-    mock_db.execute = AsyncMock(return_value=result_mock)
-    return mock_db
-
-
-def _make_redis_no_limits():
-    """Redis mock that never triggers rate limits or lockout."""
-    redis = MagicMock()
-    redis.exists = AsyncMock(return_value=0)     # no lockout
-    redis.get = AsyncMock(return_value=None)      # zero attempts
-    redis.incr = AsyncMock(return_value=1)
-    redis.expire = AsyncMock(return_value=True)
-    redis.delete = AsyncMock(return_value=1)
-    pipeline = MagicMock()
-    pipeline.incr = MagicMock(return_value=pipeline)
-    pipeline.expire = MagicMock(return_value=pipeline)
-    pipeline.execute = AsyncMock(return_value=[1, True])
-    redis.pipeline.return_value = pipeline
-    return redis
+    """Fake DB session that returns the given user on query execution."""
+    return FakeAsyncSession(FakeResult(scalar=user))
+
+
+def _make_redis_no_limits() -> FakeRedis:
+    """Fake Redis with no lockout marker and no attempt counter."""
+    return FakeRedis()
 
 
 # ---------------------------------------------------------------------------
 # AC1 — Successful login
 # ---------------------------------------------------------------------------
 
+@pytest.mark.xdist_group(name="login_success")
 class TestLoginSuccess:
-    @pytest.mark.asyncio
     async def test_returns_user_on_valid_credentials(self):
         user = _make_user(email_verified=True)
         db = _make_db(user)
@@ -86,11 +117,10 @@ class TestLoginSuccess:
 
         assert result.id == user.id
 
-    @pytest.mark.asyncio
     async def test_clears_attempt_counter_on_success(self):
         user = _make_user(email_verified=True)
         db = _make_db(user)
-        redis = _make_redis_no_limits()
+        redis = FakeRedis({"login_attempts:login@example.com": b"2"})
 
         with patch("src.cache.get_redis_client", return_value=redis):
             await login_with_password(
@@ -100,9 +130,9 @@ class TestLoginSuccess:
                 correlation_id="test",
             )
 
-        redis.delete.assert_called_once()
+        assert ("delete", ("login_attempts:login@example.com",)) in redis.calls
+        assert "login_attempts:login@example.com" not in redis.data
 
-    @pytest.mark.asyncio
     async def test_email_case_insensitive(self):
         user = _make_user(email_verified=True)
         db = _make_db(user)
@@ -117,14 +147,56 @@ class TestLoginSuccess:
             )
 
         assert result.id == user.id
+        assert db.last_params == {"email": "login@example.com"}
+
+    async def test_user_lookup_statement_reused_across_logins(self):
+        """The email SELECT is one module-level statement, not rebuilt per login."""
+        user = _make_user(email_verified=True)
+        db = _make_db(user)
+        redis = _make_redis_no_limits()
+
+        with patch("src.cache.get_redis_client", return_value=redis):
+            for _ in range(2):
+                await login_with_password(
+                    db=db,
+                    email="login@example.com",
+                    password="SecurePass123!",
+                    correlation_id="test",
+                )
+
+        assert db.execute_count == 2
+        assert db.calls[0][0] is db.calls[1][0]
+
+    async def test_password_verified_off_event_loop(self):
+        """Argon2 verify runs in a worker thread so it cannot starve other logins' checks."""
+        user = _make_user()
+        db = _make_db(user)
+        redis = _make_redis_no_limits()
+        verify_threads: list[threading.Thread] = []
+
+        def _recording_verify(plain: str, hashed: str) -> bool:
+            verify_threads.append(threading.current_thread())
+            return True
+
+        with patch("src.cache.get_redis_client", return_value=redis), patch(
+            "src.services.auth.auth_service.verify_password", _recording_verify
+        ):
+            await login_with_password(
+                db=db,
+                email="login@example.com",
+                password="SecurePass123!",
+                correlation_id="test",
+            )
+
+        assert verify_threads and verify_threads[0] is not threading.main_thread()
 
 
 # ---------------------------------------------------------------------------
 # AC8 — Authentication failures (no enumeration)
 # ---------------------------------------------------------------------------
 
+@pytest.mark.xdist_group(name="login_failures")
 class TestLoginFailures:
-    @pytest.mark.asyncio
     async def test_wrong_password_raises_auth_error(self):
         user = _make_user(email_verified=True)
         db = _make_db(user)
@@ -139,7 +211,6 @@ class TestLoginFailures:
                     correlation_id="test",
                 )
 
-    @pytest.mark.asyncio
     async def test_unknown_email_raises_auth_error(self):
         db = _make_db(None)  # user not found
         redis = _make_redis_no_limits()
@@ -153,7 +224,6 @@ class TestLoginFailures:
                     correlation_id="test",
                 )
 
-    @pytest.mark.asyncio
     async def test_oauth_only_user_raises_auth_error(self):
         """User with auth_provider='google' (no password_hash) → same error, no enumeration."""
         user = _make_user(email_verified=True, password=None, auth_provider="google")
@@ -169,7 +239,6 @@ class TestLoginFailures:
                     correlation_id="test",
                 )
 
-    @pytest.mark.asyncio
     async def test_unverified_email_raises_specific_error(self):
         user = _make_user(email_verified=False)
         db = _make_db(user)
@@ -184,7 +253,6 @@ class TestLoginFailures:
                     correlation_id="test",
                 )
 
-    @pytest.mark.asyncio
     async def test_failure_increments_attempt_counter(self):
         db = _make_db(None)
         redis = _make_redis_no_limits()
@@ -198,21 +266,20 @@ class TestLoginFailures:
                     correlation_id="test",
                 )
 
-        redis.pipeline.return_value.execute.assert_called()
+        assert redis.data["login_attempts:nobody@example.com"] == 1
 
 
 # ---------------------------------------------------------------------------
 # AC7 — Account lockout
 # ---------------------------------------------------------------------------
 
+@pytest.mark.xdist_group(name="login_lockout")
 class TestAccountLockout:
-    @pytest.mark.asyncio
     async def test_lockout_raises_before_db_query(self):
         """Account lockout check happens before any DB query (fail fast)."""
         user = _make_user()
         db = _make_db(user)
-        redis = _make_redis_no_limits()
-        redis.exists = AsyncMock(return_value=1)  # lockout active
+        redis = FakeRedis({"login_lockout:locked@example.com": b"1"})  # lockout active
 
         with patch("src.cache.get_redis_client", return_value=redis):
             with pytest.raises(AccountLockedError):
@@ -223,14 +290,44 @@ class TestAccountLockout:
                     correlation_id="test",
                 )
 
-        db.execute.assert_not_called()
+        assert db.execute_count == 0
+
+    async def test_lockout_enforced_when_pool_wait_exceeds_budget(self):
+        """Queueing for a pooled connection is not bounded by the check budget — no fail-open."""
+        db = _make_db(_make_user())
+        redis = _BusyPoolRedis({"login_lockout:locked@example.com": b"1"})
+
+        with patch("src.cache.get_redis_client", return_value=redis):
+            with pytest.raises(AccountLockedError):
+                await login_with_password(
+                    db=db,
+                    email="locked@example.com",
+                    password="SecurePass123!",
+                    correlation_id="test",
+                )
+
+    async def test_lockout_enforced_when_mget_is_slow(self):
+        """A slow-but-answering Redis must still enforce lockout, not fail open."""
+        db = _make_db(_make_user())
+        redis = _LaggyRedis({"login_lockout:locked@example.com": b"1"})
+        timeouts_before = _fail_open_count("timeout")
+
+        with patch("src.cache.get_redis_client", return_value=redis):
+            with pytest.raises(AccountLockedError):
+                await login_with_password(
+                    db=db,
+                    email="locked@example.com",
+                    password="SecurePass123!",
+                    correlation_id="test",
+                )
+
+        assert _fail_open_count("timeout") == timeouts_before
+        assert db.execute_count == 0
 
-    @pytest.mark.asyncio
     async def test_rate_limit_raises_before_db_query(self):
         user = _make_user()
         db = _make_db(user)
-        redis = _make_redis_no_limits()
-        redis.get = AsyncMock(return_value=b"5")  # 5 attempts → at max_attempts
+        redis = FakeRedis({"login_attempts:limited@example.com": b"5"})  # 5 attempts → at max_attempts
 
         with patch("src.cache.get_redis_client", return_value=redis):
             with pytest.raises(RateLimitError):
@@ -241,16 +338,50 @@ class TestAccountLockout:
                     correlation_id="test",
                 )
 
-        db.execute.assert_not_called()
+        assert db.execute_count == 0
+
+    async def test_lockout_and_attempts_read_in_one_round_trip(self):
+        """Lockout marker and attempt counter are fetched with a single MGET."""
+        user = _make_user(email_verified=True)
+        db = _make_db(user)
+        redis = _make_redis_no_limits()
+
+        with patch("src.cache.get_redis_client", return_value=redis):
+            await login_with_password(
+                db=db,
+                email="Login@Example.com",
+                password="SecurePass123!",
+                correlation_id="test",
+            )
+
+        mgets = [args for command, args in redis.calls if command == "mget"]
+        assert mgets == [("login_lockout:login@example.com", "login_attempts:login@example.com")]
 
-    @pytest.mark.asyncio
     async def test_redis_failure_allows_login(self):
         """If Redis is unavailable, login should proceed (fail-open for availability)."""
         user = _make_user(email_verified=True)
         db = _make_db(user)
-        redis = _make_redis_no_limits()
         # Simulate Redis connection error
-        redis.exists = AsyncMock(side_effect=ConnectionError("Redis down"))
+        redis = FakeRedis(error=ConnectionError("Redis down"))
+        errors_before = _fail_open_count("error")
+
+        with patch("src.cache.get_redis_client", return_value=redis):
+            result = await login_with_password(
+                db=db,
+                email="login@example.com",
+                password="SecurePass123!",
+                correlation_id="test",
+            )
+
+        assert result.id == user.id
+        assert _fail_open_count("error") == errors_before + 1
+
+    async def test_redis_slow_allows_login(self):
+        """A stalled Redis is abandoned after the check budget; login proceeds (fail-open)."""
+        user = _make_user(email_verified=True)
+        db = _make_db(user)
+        redis = _SlowRedis()
+        timeouts_before = _fail_open_count("timeout")
 
         with patch("src.cache.get_redis_client", return_value=redis):
             result = await login_with_password(
@@ -261,3 +392,4 @@ class TestAccountLockout:
             )
 
         assert result.id == user.id
+        assert _fail_open_count("timeout") == timeouts_before + 1
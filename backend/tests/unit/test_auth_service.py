@@ -34,6 +34,7 @@ settings = get_settings()
 # Password hashing — AC4
 # ---------------------------------------------------------------------------
 
+@pytest.mark.xdist_group(name="auth_hashing")
 class TestPasswordHashing:
     def test_hash_produces_bcrypt_string(self):
         hashed = hash_password("SecurePass123!")
@@ -125,23 +126,33 @@ class TestEmailValidation:
 # JWT — access token and email verification token
 # ---------------------------------------------------------------------------
 
+@pytest.mark.xdist_group(name="auth_tokens")
 class TestTokens:
-    def test_access_token_has_correct_claims(self):
-        """AC3: access token (now RS256) contains required claims."""
+    # Sign/verify once per class — the read-only claim checks share the result.
+    @pytest.fixture(scope="class")
+    def access_token_pair(self):
+        """(user_id, validated payload) for one RS256 access token."""
+        from src.services.token_service import token_service
         user_id = uuid.uuid4()
         token = create_access_token(user_id, "user@example.com")
-        from src.services.token_service import token_service
-        payload = token_service.validate_access_token(token)
+        return user_id, token_service.validate_access_token(token)
+
+    @pytest.fixture(scope="class")
+    def email_verification_token_pair(self):
+        """(user_id, token) for one email-verification token."""
+        user_id = uuid.uuid4()
+        return user_id, create_email_verification_token(user_id)
+
+    def test_access_token_has_correct_claims(self, access_token_pair):
+        """AC3: access token (now RS256) contains required claims."""
+        user_id, payload = access_token_pair
         assert payload["sub"] == str(user_id)
         assert payload["email"] == "user@example.com"
         assert payload["type"] == "access"
 
-    def test_access_token_expires_in_15_minutes(self):
+    def test_access_token_expires_in_15_minutes(self, access_token_pair):
         """AC3: access token expires within 15-minute window."""
-        user_id = uuid.uuid4()
-        token = create_access_token(user_id, "user@example.com")
-        from src.services.token_service import token_service
-        payload = token_service.validate_access_token(token)
+        _, payload = access_token_pair
         exp = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
         now = datetime.now(timezone.utc)
         delta = exp - now
@@ -154,17 +165,15 @@ class TestTokens:
         assert isinstance(token, str)
         assert len(token) >= 32
 
-    def test_email_verification_token_valid(self):
+    def test_email_verification_token_valid(self, email_verification_token_pair):
         """AC3: verification token generated with user_id and purpose=email_verification."""
-        user_id = uuid.uuid4()
-        token = create_email_verification_token(user_id)
+        user_id, token = email_verification_token_pair
         decoded_id = decode_email_verification_token(token)
         assert decoded_id == user_id
 
-    def test_email_verification_token_uses_separate_secret(self):
+    def test_email_verification_token_uses_separate_secret(self, email_verification_token_pair):
         """Verification token is signed with email_verification_secret, NOT jwt_secret."""
-        user_id = uuid.uuid4()
-        token = create_email_verification_token(user_id)
+        _, token = email_verification_token_pair
         # Decoding with session JWT secret should fail
         with pytest.raises(Exception):
             jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
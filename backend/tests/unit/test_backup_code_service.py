@@ -3,15 +3,19 @@ Unit Tests — Backup Code Service
 Story: 1-7-two-factor-authentication-totp (Task 8.2)
 AC: AC4 (generate 10 codes, bcrypt hashes), AC6 (verify, mark used), AC8 (regenerate)
 
-Uses the in-memory SQLite test database provided by conftest.
+Uses the in-memory SQLite test database provided by conftest. Codes are
+generated (hashed) once per module; each test runs inside a SAVEPOINT that is
+rolled back afterwards, so used_at updates and regenerate deletes never leak.
 """
 
+import string
 import uuid
+from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.models.user_backup_code import UserBackupCode
 from src.services.backup_code_service import (
@@ -22,22 +26,81 @@ from src.services.backup_code_service import (
     get_remaining_count,
     regenerate_codes,
     verify_code,
+    verify_codes_bulk,
 )
 
 
+_VALID_CODE_CHARS = frozenset(string.ascii_uppercase + string.digits)
+# Well-formed but never verified — for tests that only count rows.
+_SENTINEL_HASH = "$2b$04$" + "x" * 53
+
+# Module-scoped session and codes below share one event loop with the tests.
+pytestmark = pytest.mark.asyncio(scope="module")
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest_asyncio.fixture
-async def user_id() -> uuid.UUID:
+@pytest.fixture(scope="module")
+def user_id() -> uuid.UUID:
+    """Owner of the module-wide codes_in_db."""
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def new_user_id() -> uuid.UUID:
+    """A user with no codes yet (generation tests count rows per user)."""
     return uuid.uuid4()
 
 
+@pytest_asyncio.fixture(scope="module")
+async def module_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
+    """One session + outer transaction for the module, rolled back at teardown."""
+    TestSessionLocal = async_sessionmaker(
+        bind=test_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    async with TestSessionLocal() as session:
+        async with session.begin():
+            yield session
+            await session.rollback()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def codes_in_db(module_session: AsyncSession, user_id: uuid.UUID) -> list[str]:
+    """Generate 10 backup codes for user_id once per module; returns plaintext codes."""
+    return await generate_codes(module_session, user_id)
+
+
+@pytest_asyncio.fixture
+async def db_session(module_session: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Overrides conftest's db_session: the module session, inside a per-test
+    SAVEPOINT. Module-scoped codes_in_db is created before the savepoint
+    (higher-scoped fixtures set up first), so it survives every rollback.
+    """
+    savepoint = await module_session.begin_nested()
+    yield module_session
+    if savepoint.is_active:
+        await savepoint.rollback()
+
+
 @pytest_asyncio.fixture
-async def codes_in_db(db_session: AsyncSession, user_id: uuid.UUID) -> list[str]:
-    """Generate 10 backup codes for user_id; returns plaintext codes."""
-    return await generate_codes(db_session, user_id)
+async def codes_rows_only(db_session: AsyncSession, new_user_id: uuid.UUID) -> uuid.UUID:
+    """
+    _NUM_BACKUP_CODES unused rows for new_user_id in one INSERT, with no
+    hashing — for count-only tests. Returns the owning user id.
+    """
+    await db_session.execute(
+        insert(UserBackupCode),
+        [
+            {"id": uuid.uuid4(), "user_id": new_user_id, "code_hash": _SENTINEL_HASH, "used_at": None}
+            for _ in range(_NUM_BACKUP_CODES)
+        ],
+    )
+    return new_user_id
 
 
 # ---------------------------------------------------------------------------
@@ -45,67 +108,60 @@ async def codes_in_db(db_session: AsyncSession, user_id: uuid.UUID) -> list[str]
 # ---------------------------------------------------------------------------
 
 class TestGenerateCodes:
-    async def test_returns_ten_codes(self, db_session: AsyncSession, user_id: uuid.UUID):
-        codes = await generate_codes(db_session, user_id)
+    async def test_returns_ten_codes(self, db_session: AsyncSession, new_user_id: uuid.UUID):
+        codes = await generate_codes(db_session, new_user_id)
         assert len(codes) == _NUM_BACKUP_CODES
 
-    async def test_codes_are_8_chars(self, db_session: AsyncSession, user_id: uuid.UUID):
-        codes = await generate_codes(db_session, user_id)
+    async def test_codes_are_8_chars(self, db_session: AsyncSession, new_user_id: uuid.UUID):
+        codes = await generate_codes(db_session, new_user_id)
         for code in codes:
             assert len(code) == _CODE_LENGTH
 
-    async def test_codes_are_alphanumeric_uppercase(self, db_session: AsyncSession, user_id: uuid.UUID):
-        codes = await generate_codes(db_session, user_id)
-        import string
-        valid_chars = set(string.ascii_uppercase + string.digits)
+    async def test_codes_are_alphanumeric_uppercase(self, db_session: AsyncSession, new_user_id: uuid.UUID):
+        codes = await generate_codes(db_session, new_user_id)
         for code in codes:
-            assert all(c in valid_chars for c in code), f"Code {code!r} contains invalid chars"
+            assert _VALID_CODE_CHARS.issuperset(code), f"Code {code!r} contains invalid chars"
 
-    async def test_codes_are_unique(self, db_session: AsyncSession, user_id: uuid.UUID):
-        codes = await generate_codes(db_session, user_id)
+    async def test_codes_are_unique(self, db_session: AsyncSession, new_user_id: uuid.UUID):
+        codes = await generate_codes(db_session, new_user_id)
         assert len(set(codes)) == len(codes), "All generated codes must be unique"
 
-    async def test_hashes_stored_in_db(self, db_session: AsyncSession, user_id: uuid.UUID):
-        codes = await generate_codes(db_session, user_id)
+    async def test_hashes_stored_in_db(self, db_session: AsyncSession, new_user_id: uuid.UUID):
+        codes = await generate_codes(db_session, new_user_id)
         result = await db_session.execute(
-            select(UserBackupCode).where(UserBackupCode.user_id == user_id)
+            select(UserBackupCode).where(UserBackupCode.user_id == new_user_id)
         )
         rows = result.scalars().all()
         assert len(rows) == len(codes)
 
-    async def test_hashes_are_bcrypt(self, db_session: AsyncSession, user_id: uuid.UUID):
+    async def test_hashes_are_bcrypt(self, db_session: AsyncSession, new_user_id: uuid.UUID):
         """Stored hashes must be bcrypt format (AC9: not plaintext)."""
-        codes = await generate_codes(db_session, user_id)
+        codes = await generate_codes(db_session, new_user_id)
         result = await db_session.execute(
-            select(UserBackupCode).where(UserBackupCode.user_id == user_id)
+            select(UserBackupCode.code_hash).where(UserBackupCode.user_id == new_user_id)
         )
-        rows = result.scalars().all()
-        for row in rows:
-            assert row.code_hash.startswith("$2b$") or row.code_hash.startswith("$2a$"), (
-                f"code_hash {row.code_hash!r} is not bcrypt — must never store plaintext"
+        for code_hash in result.scalars().all():
+            assert code_hash.startswith("$2b$") or code_hash.startswith("$2a$"), (
+                f"code_hash {code_hash!r} is not bcrypt — must never store plaintext"
             )
 
-    async def test_codes_not_stored_as_plaintext(self, db_session: AsyncSession, user_id: uuid.UUID):
+    async def test_codes_not_stored_as_plaintext(self, db_session: AsyncSession, new_user_id: uuid.UUID):
         """No plaintext code must appear in any stored hash."""
-        codes = await generate_codes(db_session, user_id)
+        codes = await generate_codes(db_session, new_user_id)
         result = await db_session.execute(
-            select(UserBackupCode).where(UserBackupCode.user_id == user_id)
+            select(UserBackupCode.code_hash).where(UserBackupCode.user_id == new_user_id)
         )
-        rows = result.scalars().all()
-        stored_hashes = {row.code_hash for row in rows}
-        for code in codes:
-            assert code not in stored_hashes, (
-                f"Plaintext code {code!r} found verbatim in stored hashes"
-            )
+        leaked = frozenset(codes) & frozenset(result.scalars().all())
+        assert not leaked, f"Plaintext codes {sorted(leaked)!r} found verbatim in stored hashes"
 
-    async def test_used_at_is_null_initially(self, db_session: AsyncSession, user_id: uuid.UUID):
-        await generate_codes(db_session, user_id)
+    async def test_used_at_is_null_initially(self, db_session: AsyncSession, new_user_id: uuid.UUID):
+        await generate_codes(db_session, new_user_id)
         result = await db_session.execute(
-            select(UserBackupCode).where(UserBackupCode.user_id == user_id)
+            select(UserBackupCode.used_at).where(UserBackupCode.user_id == new_user_id)
         )
-        rows = result.scalars().all()
-        for row in rows:
-            assert row.used_at is None
+        used_at = result.scalars().all()
+        assert len(used_at) == _NUM_BACKUP_CODES
+        assert all(value is None for value in used_at)
 
 
 # ---------------------------------------------------------------------------
@@ -164,6 +220,15 @@ class TestVerifyCode:
         result = await verify_code(db_session, user_id, codes_in_db[1])
         assert result is True
 
+    async def test_bulk_matches_serial_semantics(
+        self, db_session: AsyncSession, user_id: uuid.UUID, codes_in_db: list[str]
+    ):
+        """Bulk verify consumes each valid code once; invalid and repeated codes fail."""
+        code = codes_in_db[3]
+        result = await verify_codes_bulk(db_session, user_id, [code, "INVALID1", code])
+        assert result == [True, False, False]
+        assert await verify_code(db_session, user_id, code) is False
+
 
 # ---------------------------------------------------------------------------
 # Task 8.2: Remaining count + warning threshold (AC6)
@@ -171,9 +236,9 @@ class TestVerifyCode:
 
 class TestGetRemainingCount:
     async def test_full_count_after_generation(
-        self, db_session: AsyncSession, user_id: uuid.UUID, codes_in_db: list[str]
+        self, db_session: AsyncSession, codes_rows_only: uuid.UUID
     ):
-        count = await get_remaining_count(db_session, user_id)
+        count = await get_remaining_count(db_session, codes_rows_only)
         assert count == _NUM_BACKUP_CODES
 
     async def test_decrements_after_use(
@@ -192,9 +257,9 @@ class TestGetRemainingCount:
         self, db_session: AsyncSession, user_id: uuid.UUID, codes_in_db: list[str]
     ):
         """Simulate using codes until fewer than 3 remain."""
-        # Use 8 out of 10 codes
-        for code in codes_in_db[:8]:
-            await verify_code(db_session, user_id, code)
+        # Use 8 out of 10 codes (one SELECT + one UPDATE)
+        used = await verify_codes_bulk(db_session, user_id, codes_in_db[:8])
+        assert used == [True] * 8
         count = await get_remaining_count(db_session, user_id)
         assert count == 2
         assert count < 3, "Should trigger frontend warning when < 3"
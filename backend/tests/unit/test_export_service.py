@@ -6,12 +6,16 @@ AC: #2 — background job creation, rate limit (1/24h)
 AC: #5 — list exports, download URL generation
 """
 
+import re
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from src.services.export_service import ExportService, _json_default
+from tests.unit._fakes import FakeAsyncSession, FakeResult
 
 
 # ---------------------------------------------------------------------------
@@ -22,29 +26,30 @@ TENANT_ID = uuid.uuid4()
 USER_ID = uuid.uuid4()
 JOB_ID = uuid.uuid4()
 
+# A completed export_jobs row as returned by .mappings(); tests copy it with
+# {**_JOB_ROW_TEMPLATE, ...} overriding only the columns they care about.
+_JOB_ROW_TEMPLATE = {
+    "id": JOB_ID,
+    "status": "completed",
+    "progress_percent": 100,
+    "file_size_bytes": 1234,
+    "s3_key": "exports/abc/def/zip",
+    "error_message": None,
+    "created_at": datetime(2026, 2, 25, tzinfo=timezone.utc),
+    "completed_at": datetime(2026, 2, 25, tzinfo=timezone.utc),
+}
 
-def _make_session(scalar_one_or_none=None, fetchone=None, fetchall=None, scalar=None):
-    """Mock AsyncSession."""
-    session = AsyncMock()
-    result_mock = MagicMock()
+# Error codes raised by request_export(), compiled once for pytest.raises(match=)
+_RATE_LIMIT_RE = re.compile("RATE_LIMIT_EXCEEDED")
+_IN_PROGRESS_RE = re.compile("EXPORT_IN_PROGRESS")
 
-    if scalar is not None:
-        result_mock.scalar.return_value = scalar
-        result_mock.scalar_one_or_none.return_value = scalar
 
-    if fetchone is not None:
-        mappings = MagicMock()
-        mappings.fetchone.return_value = fetchone
-        result_mock.mappings.return_value = mappings
-
-    if fetchall is not None:
-        mappings = MagicMock()
-        mappings.fetchall.return_value = fetchall
-        result_mock.mappings.return_value = mappings
-
-    session.execute = AsyncMock(return_value=result_mock)
-    session.commit = AsyncMock()
-    return session
+def _make_session(fetchone=None, fetchall=None, scalar=None) -> FakeAsyncSession:
+    """
+    Fake AsyncSession: every execute() returns one result serving fetchone(),
+    fetchall() (also via .mappings()) and scalar().
+    """
+    return FakeAsyncSession(FakeResult(scalar=scalar, row=fetchone, rows=fetchall))
 
 
 # ---------------------------------------------------------------------------
@@ -71,15 +76,9 @@ async def test_request_export_creates_job():
     """request_export() should create job record and return job metadata."""
     svc = ExportService()
 
-    db = AsyncMock()
-    db.commit = AsyncMock()
-
     # First execute() call: check for in-progress job → None (no active job)
     # Second execute() call: INSERT into export_jobs
-    in_progress_result = MagicMock()
-    in_progress_result.fetchone.return_value = None
-
-    db.execute = AsyncMock(return_value=in_progress_result)
+    db = _make_session(fetchone=None)
 
     with patch.object(svc, '_check_export_rate_limit', return_value=True):
         result = await svc.request_export(db=db, tenant_id=TENANT_ID, requested_by=USER_ID)
@@ -87,21 +86,17 @@ async def test_request_export_creates_job():
     assert result["status"] == "processing"
     assert "job_id" in result
     assert "estimated_duration" in result
-    assert db.commit.called
+    assert db.commits == 1
 
 
 @pytest.mark.asyncio
 async def test_request_export_rate_limit_blocks():
     """request_export() should raise ValueError('RATE_LIMIT_EXCEEDED') when blocked."""
     svc = ExportService()
-
-    db = AsyncMock()
-    in_progress_result = MagicMock()
-    in_progress_result.fetchone.return_value = None
-    db.execute = AsyncMock(return_value=in_progress_result)
+    db = _make_session(fetchone=None)
 
     with patch.object(svc, '_check_export_rate_limit', return_value=False):
-        with pytest.raises(ValueError, match="RATE_LIMIT_EXCEEDED"):
+        with pytest.raises(ValueError, match=_RATE_LIMIT_RE):
             await svc.request_export(db=db, tenant_id=TENANT_ID, requested_by=USER_ID)
 
 
@@ -110,15 +105,10 @@ async def test_request_export_blocks_when_in_progress():
     """request_export() should raise EXPORT_IN_PROGRESS if a job is already running."""
     svc = ExportService()
 
-    db = AsyncMock()
     # First execute: returns an in-progress job row
-    existing_job = MagicMock()
-    existing_job.id = str(JOB_ID)
-    in_progress_result = MagicMock()
-    in_progress_result.fetchone.return_value = existing_job
-    db.execute = AsyncMock(return_value=in_progress_result)
+    db = _make_session(fetchone=SimpleNamespace(id=str(JOB_ID)))
 
-    with pytest.raises(ValueError, match="EXPORT_IN_PROGRESS"):
+    with pytest.raises(ValueError, match=_IN_PROGRESS_RE):
         await svc.request_export(db=db, tenant_id=TENANT_ID, requested_by=USER_ID)
 
 
@@ -127,43 +117,30 @@ async def test_request_export_blocks_when_in_progress():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_get_export_status_returns_none_when_not_found():
-    """get_export_status() should return None when job does not exist for tenant."""
+@pytest.mark.parametrize(
+    "method, kwargs, session_kwargs, expected",
+    [
+        # get_export_status() → None when job does not exist for tenant
+        ("get_export_status", {"job_id": JOB_ID}, {"fetchone": None}, None),
+        # list_exports() → [] when no jobs exist
+        ("list_exports", {}, {"fetchall": []}, []),
+    ],
+    ids=["status-not-found", "list-empty"],
+)
+async def test_export_queries_with_no_rows(method, kwargs, session_kwargs, expected):
+    """Status and list queries return their empty value when no job rows match."""
     svc = ExportService()
+    db = _make_session(**session_kwargs)
 
-    db = AsyncMock()
-    result_mock = MagicMock()
-    mappings_mock = MagicMock()
-    mappings_mock.fetchone.return_value = None
-    result_mock.mappings.return_value = mappings_mock
-    db.execute = AsyncMock(return_value=result_mock)
-
-    status = await svc.get_export_status(db=db, tenant_id=TENANT_ID, job_id=JOB_ID)
-    assert status is None
+    result = await getattr(svc, method)(db=db, tenant_id=TENANT_ID, **kwargs)
+    assert result == expected
 
 
 @pytest.mark.asyncio
 async def test_get_export_status_returns_job_dict():
     """get_export_status() should return a status dict for a found job."""
-    from datetime import datetime, timezone
     svc = ExportService()
-
-    db = AsyncMock()
-    row = {
-        "id": JOB_ID,
-        "status": "completed",
-        "progress_percent": 100,
-        "file_size_bytes": 1234,
-        "s3_key": "exports/abc/def/zip",
-        "error_message": None,
-        "created_at": datetime(2026, 2, 25, tzinfo=timezone.utc),
-        "completed_at": datetime(2026, 2, 25, tzinfo=timezone.utc),
-    }
-    result_mock = MagicMock()
-    mappings_mock = MagicMock()
-    mappings_mock.fetchone.return_value = row
-    result_mock.mappings.return_value = mappings_mock
-    db.execute = AsyncMock(return_value=result_mock)
+    db = _make_session(fetchone=dict(_JOB_ROW_TEMPLATE))
 
     with patch.object(svc, 'get_download_url', return_value="https://s3/presigned"):
         status = await svc.get_export_status(db=db, tenant_id=TENANT_ID, job_id=JOB_ID)
@@ -178,47 +155,16 @@ async def test_get_export_status_returns_job_dict():
 # Test: list_exports
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_list_exports_returns_empty_list():
-    """list_exports() should return [] when no jobs exist."""
-    svc = ExportService()
-
-    db = AsyncMock()
-    result_mock = MagicMock()
-    mappings_mock = MagicMock()
-    mappings_mock.fetchall.return_value = []
-    result_mock.mappings.return_value = mappings_mock
-    db.execute = AsyncMock(return_value=result_mock)
-
-    result = await svc.list_exports(db=db, tenant_id=TENANT_ID)
-    assert result == []
-
-
 @pytest.mark.asyncio
 async def test_list_exports_returns_up_to_5():
     """list_exports() should pass limit=5 to query and return that many jobs."""
-    from datetime import datetime, timezone
     svc = ExportService()
 
-    db = AsyncMock()
     rows = [
-        {
-            "id": uuid.uuid4(),
-            "status": "completed",
-            "progress_percent": 100,
-            "file_size_bytes": 100,
-            "s3_key": None,
-            "error_message": None,
-            "created_at": datetime(2026, 2, 25, tzinfo=timezone.utc),
-            "completed_at": None,
-        }
+        {**_JOB_ROW_TEMPLATE, "id": uuid.uuid4(), "file_size_bytes": 100, "s3_key": None, "completed_at": None}
         for _ in range(3)
     ]
-    result_mock = MagicMock()
-    mappings_mock = MagicMock()
-    mappings_mock.fetchall.return_value = rows
-    result_mock.mappings.return_value = mappings_mock
-    db.execute = AsyncMock(return_value=result_mock)
+    db = _make_session(fetchall=rows)
 
     result = await svc.list_exports(db=db, tenant_id=TENANT_ID)
     assert len(result) == 3
@@ -8,9 +8,10 @@ AC: AC6 — revoke guard (pending-only), resend guard
 AC: AC9 — generic exception messages (no token value leakage)
 """
 
+import secrets
 import uuid
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -27,6 +28,7 @@ from src.services.invitation.invitation_service import (
     TokenRevokedError,
     _INVITEABLE_ROLES,
 )
+from tests.unit._fakes import FakeAsyncSession, FakeResult
 
 
 # ---------------------------------------------------------------------------
@@ -41,8 +43,8 @@ class TestRoleConstants:
         assert "admin" not in _INVITEABLE_ROLES
 
     def test_allowed_roles_all_present(self):
-        for role in ["pm-csm", "qa-manual", "qa-automation", "developer", "viewer"]:
-            assert role in _INVITEABLE_ROLES
+        missing = {"pm-csm", "qa-manual", "qa-automation", "developer", "viewer"} - _INVITEABLE_ROLES
+        assert not missing, f"missing inviteable roles: {sorted(missing)}"
 
 
 # ---------------------------------------------------------------------------
@@ -52,13 +54,11 @@ class TestRoleConstants:
 class TestTokenGeneration:
     def test_tokens_are_unique(self):
         """secrets.token_urlsafe must produce unique tokens each call."""
-        import secrets
         tokens = {secrets.token_urlsafe(32) for _ in range(100)}
         assert len(tokens) == 100
 
     def test_token_has_sufficient_length(self):
         """32-byte tokens → at least 40 URL-safe base64 characters."""
-        import secrets
         token = secrets.token_urlsafe(32)
         assert len(token) >= 40
 
@@ -113,75 +113,86 @@ class TestDomainExceptions:
 # validate_token — AC4 (via mocked DB)
 # ---------------------------------------------------------------------------
 
+_NOW = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned to _NOW, so expiry checks are deterministic."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _NOW
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    monkeypatch.setattr(
+        "src.services.invitation.invitation_service.datetime", _FrozenDatetime
+    )
+
+
+@pytest.fixture(scope="module")
+def svc() -> InvitationService:
+    """One InvitationService for the module — it is stateless (db is passed per call)."""
+    return InvitationService()
+
+
 def _make_invitation(**kwargs):
-    inv = MagicMock()
-    inv.id = uuid.uuid4()
-    inv.status = kwargs.get("status", "pending")
-    inv.expires_at = kwargs.get(
-        "expires_at", datetime.now(timezone.utc) + timedelta(hours=24)
+    # Plain attribute bag: the service only reads and assigns fields on it.
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        status=kwargs.get("status", "pending"),
+        expires_at=kwargs.get(
+            "expires_at", _NOW + timedelta(hours=24)
+        ),
+        email=kwargs.get("email", "user@example.com"),
+        role=kwargs.get("role", "developer"),
+        tenant_id=kwargs.get("tenant_id", uuid.uuid4()),
     )
-    inv.email = kwargs.get("email", "user@example.com")
-    inv.role = kwargs.get("role", "developer")
-    inv.tenant_id = kwargs.get("tenant_id", uuid.uuid4())
-    return inv
 
 
+def _db_returning(invitation) -> FakeAsyncSession:
+    """Session whose every lookup returns `invitation` from scalar_one_or_none()."""
+    return FakeAsyncSession(FakeResult(scalar=invitation))
+
+
+# Async test classes share one module-scoped event loop (pytest-asyncio 0.23).
+@pytest.mark.asyncio(scope="module")
 class TestValidateToken:
-    async def test_valid_pending_token_returns_invitation(self):
+    async def test_valid_pending_token_returns_invitation(self, svc):
         inv = _make_invitation()
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        svc = InvitationService()
+        db = _db_returning(inv)
         result = await svc.validate_token(db=db, token="good-token")
         assert result is inv
 
-    async def test_missing_token_raises_not_found(self):
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=None))
-        )
-        svc = InvitationService()
+    async def test_missing_token_raises_not_found(self, svc):
+        db = _db_returning(None)
         with pytest.raises(TokenNotFoundError):
             await svc.validate_token(db=db, token="bad-token")
 
-    async def test_revoked_token_raises_revoked(self):
+    async def test_revoked_token_raises_revoked(self, svc):
         inv = _make_invitation(status="revoked")
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        svc = InvitationService()
+        db = _db_returning(inv)
         with pytest.raises(TokenRevokedError):
             await svc.validate_token(db=db, token="revoked-token")
 
-    async def test_past_expires_at_raises_expired_and_updates_status(self):
+    async def test_past_expires_at_raises_expired_and_updates_status(self, svc):
         """AC4: service lazily sets status='expired' when expires_at is in the past."""
         inv = _make_invitation(
             status="pending",
-            expires_at=datetime.now(timezone.utc) - timedelta(hours=1),
-        )
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
+            expires_at=_NOW - timedelta(hours=1),
         )
-        db.flush = AsyncMock()
-        svc = InvitationService()
+        db = _db_returning(inv)
         with pytest.raises(TokenExpiredError):
             await svc.validate_token(db=db, token="expired-token")
         # Lazy expiry update must set status to 'expired'
         assert inv.status == "expired"
-        db.flush.assert_awaited()
+        assert db.flushes == 1
 
-    async def test_accepted_token_raises_not_found(self):
+    async def test_accepted_token_raises_not_found(self, svc):
         """Accepted tokens are single-use — treat as not found for re-use attempts."""
         inv = _make_invitation(status="accepted")
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        svc = InvitationService()
+        db = _db_returning(inv)
         with pytest.raises(TokenNotFoundError):
             await svc.validate_token(db=db, token="used-token")
 
@@ -190,50 +201,27 @@ class TestValidateToken:
 # revoke_invitation — AC6 (pending-only guard)
 # ---------------------------------------------------------------------------
 
+@pytest.mark.asyncio(scope="module")
 class TestRevokeInvitation:
-    async def test_revoke_accepted_raises_not_revocable(self):
-        inv = _make_invitation(status="accepted")
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        svc = InvitationService()
+    @pytest.mark.parametrize("status", ["accepted", "expired"])
+    async def test_revoke_non_pending_raises_not_revocable(self, svc, status):
+        inv = _make_invitation(status=status)
+        db = _db_returning(inv)
         with pytest.raises(InvitationNotRevocableError):
             await svc.revoke_invitation(
                 db=db, invite_id=inv.id, tenant_id=inv.tenant_id
             )
 
-    async def test_revoke_expired_raises_not_revocable(self):
-        inv = _make_invitation(status="expired")
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        svc = InvitationService()
-        with pytest.raises(InvitationNotRevocableError):
-            await svc.revoke_invitation(
-                db=db, invite_id=inv.id, tenant_id=inv.tenant_id
-            )
-
-    async def test_revoke_nonexistent_raises_not_found(self):
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=None))
-        )
-        svc = InvitationService()
+    async def test_revoke_nonexistent_raises_not_found(self, svc):
+        db = _db_returning(None)
         with pytest.raises(TokenNotFoundError):
             await svc.revoke_invitation(
                 db=db, invite_id=uuid.uuid4(), tenant_id=uuid.uuid4()
             )
 
-    async def test_revoke_pending_sets_status_revoked(self):
+    async def test_revoke_pending_sets_status_revoked(self, svc):
         inv = _make_invitation(status="pending")
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        db.flush = AsyncMock()
-        svc = InvitationService()
+        db = _db_returning(inv)
         result = await svc.revoke_invitation(
             db=db, invite_id=inv.id, tenant_id=inv.tenant_id
         )
@@ -245,18 +233,13 @@ class TestRevokeInvitation:
 # accept_invitation — email mismatch (AC9)
 # ---------------------------------------------------------------------------
 
+@pytest.mark.asyncio(scope="module")
 class TestAcceptInvitation:
-    async def test_email_mismatch_raises_email_mismatch_error(self):
+    async def test_email_mismatch_raises_email_mismatch_error(self, svc):
         """AC9: accept must reject if acting user email != invitation email."""
         inv = _make_invitation(email="invited@example.com", status="pending")
-        db = AsyncMock()
-        # First call to validate_token returns the invitation
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        db.flush = AsyncMock()
-        db.add = MagicMock()
-        svc = InvitationService()
+        # validate_token returns the invitation
+        db = _db_returning(inv)
         with pytest.raises(EmailMismatchError):
             await svc.accept_invitation(
                 db=db,
@@ -265,16 +248,10 @@ class TestAcceptInvitation:
                 accepting_email="different@example.com",
             )
 
-    async def test_email_match_creates_membership(self):
+    async def test_email_match_creates_membership(self, svc):
         """Happy path: matching email creates TenantUser membership."""
         inv = _make_invitation(email="match@example.com", status="pending")
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        db.flush = AsyncMock()
-        db.add = MagicMock()
-        svc = InvitationService()
+        db = _db_returning(inv)
         result = await svc.accept_invitation(
             db=db,
             token="any-token",
@@ -292,32 +269,24 @@ class TestAcceptInvitation:
 # resend_invitation — AC6
 # ---------------------------------------------------------------------------
 
+@pytest.mark.asyncio(scope="module")
 class TestResendInvitation:
-    async def test_resend_revoked_raises_not_found(self):
+    async def test_resend_revoked_raises_not_found(self, svc):
         inv = _make_invitation(status="revoked")
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        svc = InvitationService()
+        db = _db_returning(inv)
         with pytest.raises(TokenNotFoundError):
             await svc.resend_invitation(
                 db=db, invite_id=inv.id, tenant_id=inv.tenant_id
             )
 
-    async def test_resend_expired_resets_token_and_expiry(self):
+    async def test_resend_expired_resets_token_and_expiry(self, svc):
         old_token = "old-expired-token"
         inv = _make_invitation(
             status="expired",
-            expires_at=datetime.now(timezone.utc) - timedelta(days=1),
+            expires_at=_NOW - timedelta(days=1),
         )
         inv.token = old_token
-        db = AsyncMock()
-        db.execute = AsyncMock(
-            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=inv))
-        )
-        db.flush = AsyncMock()
-        svc = InvitationService()
+        db = _db_returning(inv)
         result, raw_token = await svc.resend_invitation(
             db=db, invite_id=inv.id, tenant_id=inv.tenant_id
         )
@@ -327,5 +296,5 @@ class TestResendInvitation:
         # Status must be reset to pending
         assert inv.status == "pending"
         # Expiry must be in the future
-        assert inv.expires_at > datetime.now(timezone.utc)
+        assert inv.expires_at > _NOW
         assert result is inv
@@ -6,12 +6,18 @@ AC: #3 — org name match, 2FA/password verification
 AC: #4 — ordered deletion sequence
 """
 
+import re
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch, call
+from unittest.mock import AsyncMock, patch, call
 
+import bcrypt
 import pytest
 
 from src.services.org_deletion_service import OrgDeletionService
+from tests.unit._fakes import FakeAsyncSession, FakeResult
+
+# One event loop for the whole module instead of one per test (pytest-asyncio 0.23).
+pytestmark = pytest.mark.asyncio(scope="module")
 
 
 # ---------------------------------------------------------------------------
@@ -20,52 +26,98 @@ from src.services.org_deletion_service import OrgDeletionService
 
 ORG_ID = uuid.uuid4()
 USER_ID = uuid.uuid4()
+OTHER_TENANT_ID = uuid.uuid4()
 
+# Error codes raised by verify_deletion(), compiled once for pytest.raises(match=)
+_ORG_NAME_MISMATCH_RE = re.compile("ORG_NAME_MISMATCH")
+_PASSWORD_REQUIRED_RE = re.compile("PASSWORD_REQUIRED")
+_INVALID_PASSWORD_RE = re.compile("INVALID_PASSWORD")
+_TOTP_REQUIRED_RE = re.compile("TOTP_REQUIRED")
 
-def _make_session_with_row(row: dict | None):
-    """Mock AsyncSession that returns a single row from mappings().fetchone()."""
-    session = AsyncMock()
-    result = MagicMock()
-    mappings = MagicMock()
-    mappings.fetchone.return_value = row
-    result.mappings.return_value = mappings
-    session.execute = AsyncMock(return_value=result)
-    session.commit = AsyncMock()
-    return session
 
+@pytest.fixture(scope="module")
+def svc() -> OrgDeletionService:
+    """One OrgDeletionService for the module — it is stateless (db is passed per call)."""
+    return OrgDeletionService()
 
-# ---------------------------------------------------------------------------
-# Test: verify_deletion — org name mismatch
-# ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_verify_deletion_name_mismatch():
-    """verify_deletion() should raise ORG_NAME_MISMATCH for wrong org name."""
-    svc = OrgDeletionService()
-    db = _make_session_with_row({"totp_enabled": False, "password_hash": "hashed", "id": USER_ID})
+# Hashed once per module at the minimum cost (rounds=4): checkpw() cost scales
+# with 2**rounds, so verify_deletion() stays cheap in the password tests too.
+_CORRECT_PASSWORD_HASH = bcrypt.hashpw(b"correct-password", bcrypt.gensalt(rounds=4)).decode()
+
+
+def _make_session_with_row(row: dict | None) -> FakeAsyncSession:
+    """Session that returns a single row from mappings().fetchone()."""
+    return FakeAsyncSession(FakeResult(row=row))
+
+
+# _run_deletion() statements, matched on their leading keywords: one anchored
+# regex pass per execute() instead of repeated lower()/substring scans (which
+# also let "join" match the "joined_at" in the step-8 lookup).
+_STATEMENT_KINDS = re.compile(
+    r"\s*(?:"
+    r"(?P<tenant_lookup>SELECT id, name, slug FROM public\.tenants\b)"
+    r"|(?P<member_count>SELECT COUNT\(\*\) FROM public\.tenants_users\b)"
+    r"|(?P<member_list>SELECT u\.id\b.*\bJOIN public\.tenants_users\b)"
+    r"|(?P<other_tenant>SELECT tenant_id FROM public\.tenants_users\b)"
+    r"|(?P<audit_insert>INSERT INTO public\.deletion_audit\b)"
+    r"|(?P<delete_members>DELETE FROM public\.tenants_users\b)"
+    r"|(?P<drop_schema>DROP SCHEMA\b)"
+    r"|(?P<default_tenant_update>UPDATE public\.users SET default_tenant_id\b)"
+    r")",
+    re.IGNORECASE | re.DOTALL,
+)
 
-    with pytest.raises(ValueError, match="ORG_NAME_MISMATCH"):
-        await svc.verify_deletion(
-            db=db,
-            org_id=ORG_ID,
-            org_name="Acme Corp",
-            org_name_confirmation="acme corp",  # wrong case
-            user_id=USER_ID,
-        )
 
+def _statement_kind(stmt) -> str | None:
+    """Name of the _STATEMENT_KINDS group matching `stmt`, or None."""
+    m = _STATEMENT_KINDS.match(str(stmt))
+    return m.lastgroup if m else None
 
-@pytest.mark.asyncio
-async def test_verify_deletion_name_case_sensitive():
-    """verify_deletion() must be case-sensitive — 'Acme' != 'acme'."""
-    svc = OrgDeletionService()
+
+class _ScriptedSession(FakeAsyncSession):
+    """FakeAsyncSession that answers each execute() with respond(stmt, params)."""
+
+    def __init__(self, respond) -> None:
+        super().__init__()
+        self.respond = respond
+
+    async def execute(self, stmt, params=None) -> FakeResult:
+        await super().execute(stmt, params)
+        return self.respond(stmt, params)
+
+
+@pytest.fixture
+def deletion_side_effects(monkeypatch):
+    """Stub the e-mail / S3 steps and the schema-name guard for _run_deletion()."""
+    monkeypatch.setattr(
+        "src.services.org_deletion_service._send_deletion_notification", AsyncMock()
+    )
+    monkeypatch.setattr("src.services.org_deletion_service._delete_s3_objects", AsyncMock())
+    monkeypatch.setattr(
+        "src.services.org_deletion_service.validate_safe_identifier", lambda name: True
+    )
+
+
+# ---------------------------------------------------------------------------
+# Test: verify_deletion — org name mismatch
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "confirmation",
+    ["acme corp", "ACME CORP"],
+    ids=["lowercase", "uppercase"],
+)
+async def test_verify_deletion_name_mismatch(svc, confirmation):
+    """verify_deletion() raises ORG_NAME_MISMATCH — the match is case-sensitive."""
     db = _make_session_with_row({"totp_enabled": False, "password_hash": "hashed", "id": USER_ID})
 
-    with pytest.raises(ValueError, match="ORG_NAME_MISMATCH"):
+    with pytest.raises(ValueError, match=_ORG_NAME_MISMATCH_RE):
         await svc.verify_deletion(
             db=db,
             org_id=ORG_ID,
             org_name="Acme Corp",
-            org_name_confirmation="ACME CORP",
+            org_name_confirmation=confirmation,
             user_id=USER_ID,
         )
 
@@ -74,13 +126,11 @@ async def test_verify_deletion_name_case_sensitive():
 # Test: verify_deletion — password verification
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_verify_deletion_password_required_when_no_totp():
+async def test_verify_deletion_password_required_when_no_totp(svc):
     """verify_deletion() should require password when MFA is not enabled."""
-    svc = OrgDeletionService()
     db = _make_session_with_row({"totp_enabled": False, "password_hash": "hashed", "id": USER_ID})
 
-    with pytest.raises(ValueError, match="PASSWORD_REQUIRED"):
+    with pytest.raises(ValueError, match=_PASSWORD_REQUIRED_RE):
         await svc.verify_deletion(
             db=db,
             org_id=ORG_ID,
@@ -91,16 +141,13 @@ async def test_verify_deletion_password_required_when_no_totp():
         )
 
 
-@pytest.mark.asyncio
-async def test_verify_deletion_invalid_password():
+async def test_verify_deletion_invalid_password(svc):
     """verify_deletion() should raise INVALID_PASSWORD for wrong password."""
-    import bcrypt
-    hashed = bcrypt.hashpw(b"correct-password", bcrypt.gensalt()).decode()
-
-    svc = OrgDeletionService()
-    db = _make_session_with_row({"totp_enabled": False, "password_hash": hashed, "id": USER_ID})
+    db = _make_session_with_row(
+        {"totp_enabled": False, "password_hash": _CORRECT_PASSWORD_HASH, "id": USER_ID}
+    )
 
-    with pytest.raises(ValueError, match="INVALID_PASSWORD"):
+    with pytest.raises(ValueError, match=_INVALID_PASSWORD_RE):
         await svc.verify_deletion(
             db=db,
             org_id=ORG_ID,
@@ -111,14 +158,11 @@ async def test_verify_deletion_invalid_password():
         )
 
 
-@pytest.mark.asyncio
-async def test_verify_deletion_correct_password_succeeds():
+async def test_verify_deletion_correct_password_succeeds(svc):
     """verify_deletion() should succeed with correct password."""
-    import bcrypt
-    hashed = bcrypt.hashpw(b"correct-password", bcrypt.gensalt()).decode()
-
-    svc = OrgDeletionService()
-    db = _make_session_with_row({"totp_enabled": False, "password_hash": hashed, "id": USER_ID})
+    db = _make_session_with_row(
+        {"totp_enabled": False, "password_hash": _CORRECT_PASSWORD_HASH, "id": USER_ID}
+    )
 
     # Should not raise
     await svc.verify_deletion(
@@ -135,13 +179,11 @@ async def test_verify_deletion_correct_password_succeeds():
 # Test: verify_deletion — TOTP required
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_verify_deletion_totp_required_when_mfa_enabled():
+async def test_verify_deletion_totp_required_when_mfa_enabled(svc):
     """verify_deletion() should require TOTP code when MFA is enabled."""
-    svc = OrgDeletionService()
     db = _make_session_with_row({"totp_enabled": True, "password_hash": "hashed", "id": USER_ID})
 
-    with pytest.raises(ValueError, match="TOTP_REQUIRED"):
+    with pytest.raises(ValueError, match=_TOTP_REQUIRED_RE):
         await svc.verify_deletion(
             db=db,
             org_id=ORG_ID,
@@ -156,25 +198,13 @@ async def test_verify_deletion_totp_required_when_mfa_enabled():
 # Test: execute_deletion — tenant not found (early exit)
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_execute_deletion_skips_when_tenant_not_found():
+async def test_execute_deletion_skips_when_tenant_not_found(svc):
     """execute_deletion() should log warning and return if tenant not found."""
-    svc = OrgDeletionService()
-
-    with patch('src.services.org_deletion_service.AsyncSessionLocal') as mock_sl:
-        mock_db = AsyncMock()
-        mock_db.__aenter__ = AsyncMock(return_value=mock_db)
-        mock_db.__aexit__ = AsyncMock(return_value=False)
-        mock_db.commit = AsyncMock()
 
+    with patch('src.db.AsyncSessionLocal') as mock_sl:
         # tenant query returns None
-        result = MagicMock()
-        mappings = MagicMock()
-        mappings.fetchone.return_value = None
-        result.mappings.return_value = mappings
-        mock_db.execute = AsyncMock(return_value=result)
-
-        mock_sl.return_value = mock_db
+        db = _make_session_with_row(None)
+        mock_sl.return_value = db
 
         # Should not raise
         await svc.execute_deletion(
@@ -183,225 +213,108 @@ async def test_execute_deletion_skips_when_tenant_not_found():
             deleted_by_name="Admin User",
         )
 
+    assert db.execute_count == 1
+    assert db.commits == 0
+
 
 # ---------------------------------------------------------------------------
 # Test: deletion sequence ordering
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_deletion_sequence_records_audit_before_data_deleted():
+async def test_deletion_sequence_records_audit_before_data_deleted(svc, deletion_side_effects):
     """
     _run_deletion() must insert deletion_audit BEFORE deleting tenants_users.
     Verify audit INSERT happens in the sequence before DELETE tenants_users.
     """
-    svc = OrgDeletionService()
-
-    calls_order = []
-
-    async def mock_execute(stmt, *args, **kwargs):
-        sql = str(stmt)
-        if "deletion_audit" in sql and "INSERT" in sql.upper():
-            calls_order.append("audit_insert")
-        elif "tenants_users" in sql and "DELETE" in sql.upper():
-            calls_order.append("delete_members")
-        elif "DROP SCHEMA" in sql.upper():
-            calls_order.append("drop_schema")
-        result = MagicMock()
-        mappings = MagicMock()
-        if "tenants" in sql.lower() and "select" in sql.lower() and "tenants_users" not in sql.lower():
-            if "count" in sql.lower():
-                result.scalar.return_value = 3
-            else:
-                # tenant lookup
-                mappings.fetchone.return_value = {
-                    "name": "Acme", "slug": "acme", "id": str(ORG_ID)
-                }
-        elif "tenants_users" in sql.lower() and "select" in sql.lower():
-            mappings.fetchall.return_value = []
-        elif "count" in sql.lower():
-            result.scalar.return_value = 3
-        else:
-            mappings.fetchone.return_value = None
-            mappings.fetchall.return_value = []
-        result.mappings.return_value = mappings
-        return result
-
-    mock_db = AsyncMock()
-    mock_db.execute = mock_execute
-    mock_db.commit = AsyncMock()
-
-    with patch('src.services.org_deletion_service._send_deletion_notification', new_callable=AsyncMock):
-        with patch('src.services.org_deletion_service._delete_s3_objects', new_callable=AsyncMock):
-            with patch('src.services.tenant_provisioning.validate_safe_identifier', return_value=True):
-                try:
-                    await svc._run_deletion(
-                        db=mock_db,
-                        org_id=ORG_ID,
-                        deleted_by=USER_ID,
-                        deleted_by_name="Admin",
-                    )
-                except Exception:
-                    pass
 
-    # Audit insert must come before delete members in the sequence
-    if "audit_insert" in calls_order and "delete_members" in calls_order:
-        audit_idx = calls_order.index("audit_insert")
-        delete_idx = calls_order.index("delete_members")
-        assert audit_idx < delete_idx, (
-            f"audit_insert (step {audit_idx}) must precede delete_members (step {delete_idx})"
+    def respond(stmt, params):
+        kind = _statement_kind(stmt)
+        if kind == "tenant_lookup":
+            return FakeResult(row={"name": "Acme", "slug": "acme", "id": str(ORG_ID)})
+        if kind == "member_count":
+            return FakeResult(scalar=3)
+        return FakeResult()
+
+    db = _ScriptedSession(respond)
+
+    try:
+        await svc._run_deletion(
+            db=db,
+            org_id=ORG_ID,
+            deleted_by=USER_ID,
+            deleted_by_name="Admin",
         )
+    except Exception:
+        pass
+
+    # Audit insert must come before delete members in the sequence
+    kinds = [_statement_kind(stmt) for stmt, _ in db.calls]
+    audit_idx = kinds.index("audit_insert")
+    delete_idx = kinds.index("delete_members")
+    assert audit_idx < delete_idx, (
+        f"audit_insert (step {audit_idx}) must precede delete_members (step {delete_idx})"
+    )
 
 
 # ---------------------------------------------------------------------------
 # Test: Task 7.7 — multi-org user default_tenant_id update (AC6)
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_run_deletion_updates_default_tenant_for_multi_org_user():
+@pytest.mark.parametrize(
+    "other_tenant_id, expected_new_tid",
+    [
+        # Member of 2 orgs: default_tenant_id moves to the other org
+        (OTHER_TENANT_ID, str(OTHER_TENANT_ID)),
+        # Member of this org only: default_tenant_id is set to NULL
+        (None, None),
+    ],
+    ids=["multi-org", "single-org"],
+)
+async def test_run_deletion_updates_default_tenant(
+    svc, deletion_side_effects, other_tenant_id, expected_new_tid
+):
     """
-    Task 7.7: User belonging to 2 orgs — after org A is deleted,
-    _run_deletion() step 8 must set default_tenant_id to org B (not NULL).
+    Task 7.7: after the org is deleted, _run_deletion() step 8 points each
+    member's default_tenant_id at another org they belong to, or NULL.
     AC6: "Users who belong to MULTIPLE organizations: their default_tenant_id
-    updated to another org they belong to."
+    updated to another org they belong to." / "Users who belong to ONLY this
+    organization: their account remains but they have no active organization."
     """
-    svc = OrgDeletionService()
-
-    OTHER_TENANT_ID = uuid.uuid4()
     update_calls: list[dict] = []
 
-    async def mock_execute(stmt, *args, **kwargs):
-        sql = str(stmt)
-        sql_lower = sql.lower()
-        result = MagicMock()
-        mappings = MagicMock()
-
-        if "count(*)" in sql_lower and "tenants_users" in sql_lower:
-            # Member count query
-            result.scalar.return_value = 1
-        elif "select" in sql_lower and "tenants" in sql_lower and "tenants_users" not in sql_lower and "count" not in sql_lower:
+    def respond(stmt, params):
+        kind = _statement_kind(stmt)
+        if kind == "member_count":
+            return FakeResult(scalar=1)
+        if kind == "tenant_lookup":
             # Tenant lookup — return org info
-            mappings.fetchone.return_value = {
-                "name": "Acme Corp",
-                "slug": "acme-corp",
-                "id": str(ORG_ID),
-            }
-        elif "join" in sql_lower and "tenants_users" in sql_lower and "users" in sql_lower:
+            return FakeResult(row={"name": "Acme Corp", "slug": "acme-corp", "id": str(ORG_ID)})
+        if kind == "member_list":
             # Member list query — one member
-            mappings.fetchall.return_value = [
-                {"id": USER_ID, "email": "user@test.com", "full_name": "Test User"}
-            ]
-        elif "select tenant_id from public.tenants_users" in sql_lower:
-            # Step 8: find another org for this user — returns other tenant
-            result.scalar_one_or_none.return_value = OTHER_TENANT_ID
-        elif "update public.users set default_tenant_id" in sql_lower:
+            return FakeResult(rows=[{"id": USER_ID, "email": "user@test.com", "full_name": "Test User"}])
+        if kind == "other_tenant":
+            # Step 8: find another org for this user
+            return FakeResult(scalar=other_tenant_id)
+        if kind == "default_tenant_update":
             # Capture the update params
-            params = args[0] if args else kwargs
             update_calls.append(dict(params))
-        elif "delete from public.tenants_users" in sql_lower:
-            pass  # step 4
-        elif "drop schema" in sql_lower:
-            pass  # step 6
-        elif "delete from public.tenants" in sql_lower:
-            pass  # step 7
-        elif "insertion_audit" in sql_lower or "deletion_audit" in sql_lower:
-            pass  # step 1 + final update
-        else:
-            mappings.fetchone.return_value = None
-            mappings.fetchall.return_value = []
-
-        result.mappings.return_value = mappings
-        return result
-
-    mock_db = AsyncMock()
-    mock_db.execute = mock_execute
-    mock_db.commit = AsyncMock()
-
-    with patch("src.services.org_deletion_service._send_deletion_notification", new_callable=AsyncMock):
-        with patch("src.services.org_deletion_service._delete_s3_objects", new_callable=AsyncMock):
-            with patch("src.services.tenant_provisioning.validate_safe_identifier", return_value=True):
-                try:
-                    await svc._run_deletion(
-                        db=mock_db,
-                        org_id=ORG_ID,
-                        deleted_by=USER_ID,
-                        deleted_by_name="Admin",
-                    )
-                except Exception:
-                    pass
-
-    # Step 8: verify UPDATE was called with OTHER_TENANT_ID (not None)
-    assert len(update_calls) > 0, "UPDATE users SET default_tenant_id should have been called"
-    # The new_tid should be the other tenant, not NULL
-    assert any(
-        str(call.get("new_tid")) == str(OTHER_TENANT_ID)
-        for call in update_calls
-    ), (
-        f"Expected default_tenant_id to be updated to OTHER_TENANT_ID={OTHER_TENANT_ID!s}, "
-        f"but got update_calls={update_calls!r}"
-    )
-
+        # Audit insert/update, deletes and DROP SCHEMA return nothing
+        return FakeResult()
 
-@pytest.mark.asyncio
-async def test_run_deletion_sets_default_tenant_null_for_single_org_user():
-    """
-    Task 7.7: User belonging to only 1 org — after deletion,
-    default_tenant_id must be set to NULL (no other org).
-    AC6: "Users who belong to ONLY this organization: their account remains but
-    they have no active organization."
-    """
-    svc = OrgDeletionService()
-    update_calls: list[dict] = []
+    db = _ScriptedSession(respond)
 
-    async def mock_execute(stmt, *args, **kwargs):
-        sql = str(stmt)
-        sql_lower = sql.lower()
-        result = MagicMock()
-        mappings = MagicMock()
-
-        if "count(*)" in sql_lower and "tenants_users" in sql_lower:
-            result.scalar.return_value = 1
-        elif "select" in sql_lower and "tenants" in sql_lower and "tenants_users" not in sql_lower and "count" not in sql_lower:
-            mappings.fetchone.return_value = {
-                "name": "Solo Org",
-                "slug": "solo-org",
-                "id": str(ORG_ID),
-            }
-        elif "join" in sql_lower and "tenants_users" in sql_lower and "users" in sql_lower:
-            mappings.fetchall.return_value = [
-                {"id": USER_ID, "email": "user@test.com", "full_name": "Solo User"}
-            ]
-        elif "select tenant_id from public.tenants_users" in sql_lower:
-            # No other org found
-            result.scalar_one_or_none.return_value = None
-        elif "update public.users set default_tenant_id" in sql_lower:
-            params = args[0] if args else kwargs
-            update_calls.append(dict(params))
-        else:
-            mappings.fetchone.return_value = None
-            mappings.fetchall.return_value = []
-
-        result.mappings.return_value = mappings
-        return result
-
-    mock_db = AsyncMock()
-    mock_db.execute = mock_execute
-    mock_db.commit = AsyncMock()
-
-    with patch("src.services.org_deletion_service._send_deletion_notification", new_callable=AsyncMock):
-        with patch("src.services.org_deletion_service._delete_s3_objects", new_callable=AsyncMock):
-            with patch("src.services.tenant_provisioning.validate_safe_identifier", return_value=True):
-                try:
-                    await svc._run_deletion(
-                        db=mock_db,
-                        org_id=ORG_ID,
-                        deleted_by=USER_ID,
-                        deleted_by_name="Admin",
-                    )
-                except Exception:
-                    pass
+    try:
+        await svc._run_deletion(
+            db=db,
+            org_id=ORG_ID,
+            deleted_by=USER_ID,
+            deleted_by_name="Admin",
+        )
+    except Exception:
+        pass
 
     assert len(update_calls) > 0, "UPDATE users SET default_tenant_id should have been called"
     assert any(
-        call.get("new_tid") is None
+        call.get("new_tid") == expected_new_tid
         for call in update_calls
-    ), f"Expected default_tenant_id to be set to None for single-org user, got {update_calls!r}"
+    ), f"Expected default_tenant_id to be set to {expected_new_tid!r}, got {update_calls!r}"
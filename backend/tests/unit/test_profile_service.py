@@ -14,9 +14,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.base import Base
 from src.models.user import User
 from src.services.auth.auth_service import hash_password
 
@@ -25,22 +24,14 @@ from src.services.auth.auth_service import hash_password
 # In-memory SQLite session for unit tests
 # ---------------------------------------------------------------------------
 
-@pytest_asyncio.fixture(scope="module")
-async def mem_engine():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield engine
-    await engine.dispose()
-
-
-@pytest_asyncio.fixture
-async def db(mem_engine):
-    SessionLocal = async_sessionmaker(bind=mem_engine, class_=AsyncSession, expire_on_commit=False)
-    async with SessionLocal() as session:
-        async with session.begin():
-            yield session
-            await session.rollback()
+@pytest.fixture
+def db(db_session: AsyncSession) -> AsyncSession:
+    """
+    conftest's rolled-back session on the session-scoped test_engine: the
+    schema is created once per test session, not once per module. The
+    profile service only flushes, so the per-test rollback discards its writes.
+    """
+    return db_session
 
 
 @pytest_asyncio.fixture
@@ -96,6 +96,22 @@ class TestCreateAccessToken:
         assert payload["tenant_id"] is None
         assert payload["role"] is None
 
+    def test_verifies_against_published_pem(self):
+        """Tokens signed with the cached key object verify with the PEM served by JWKS."""
+        from jose import jwt
+        from src.services.token_service import get_public_key_pem
+
+        svc = _make_service()
+        user_id = uuid.uuid4()
+        token = svc.create_access_token(
+            user_id=user_id,
+            email="test@example.com",
+            tenant_id=None,
+            role=None,
+        )
+        payload = jwt.decode(token, get_public_key_pem(), algorithms=["RS256"])
+        assert payload["sub"] == str(user_id)
+
     def test_tampered_token_raises(self):
         svc = _make_service()
         token = svc.create_access_token(